@@ -0,0 +1,76 @@
+"""Benchmark the call of control methods.
+
+Run this script from the root of the repository:
+
+    python benchmarks/dispatch.py [number of calls]
+
+A press control is fired many times on a control method (as when the
+user holds a key down), with the current `Control._call_method` and
+with the previous implementation, which inspected the method
+signature for each call.
+
+"""
+
+import asyncio
+import inspect
+import sys
+from timeit import repeat
+
+from bui.control.press import Press
+
+class LegacyPress(Press):
+
+    """The press control with the former, uncached, method call."""
+
+    def _call_method(self, method, callback=None):
+        signature = inspect.signature(method)
+        parameters = tuple(signature.parameters.keys())
+        kwargs = {}
+        for key in self.options:
+            if key in parameters:
+                kwargs[key] = getattr(self, key)
+
+        if "control" in parameters:
+            kwargs["control"] = self
+
+        if "widget" in parameters:
+            kwargs["widget"] = self.widget
+
+        result = method(**kwargs)
+        if asyncio.iscoroutine(result):
+            self.widget.schedule(result)
+        elif callback:
+            callback(None)
+
+        return result
+
+
+class Window:
+
+    """A fake window, with a control method."""
+
+    widget = "window"
+    id = ""
+
+    def on_press(self, key, shift, control):
+        return key
+
+
+def dispatch(Control, window, number):
+    method = window.on_press
+    for _ in range(number):
+        control = Control(window, key="down", raw_key="down")
+        control._call_method(method)
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    window = Window()
+    for Control in (LegacyPress, Press):
+        best = min(repeat(lambda: dispatch(Control, window, number),
+                number=1, repeat=5))
+        print(f"{Control.__name__:>12}: {number / best:,.0f} calls "
+                f"per second ({best / number * 1e6:.2f} us per call)")
+
+
+if __name__ == "__main__":
+    main()
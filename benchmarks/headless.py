@@ -0,0 +1,92 @@
+"""Load-test a window with synthesized events, without a display.
+
+Run this script from the root of the repository:
+
+    BUI_GUI=headless python benchmarks/headless.py [number of events]
+
+The headless backend (`bui/specific/headless`) keeps widget states in
+memory and processes controls immediately.  This script fires clicks,
+keystrokes and table selections through the generic widgets and the
+control dispatch, like a user would, and reports the throughput of each.
+
+Then it does the same with the headless thread started: controls are
+sent to the asyncio queue of another thread, which answers through the
+veto channel, like with wxPython (GUI thread and asynchronous thread).
+The latency of the answers is reported as well.  The wxPython event
+loop itself isn't measured.
+
+"""
+
+import os
+import sys
+from time import perf_counter
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.specific.headless.thread import start_thread, stop_thread
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Headless benchmark">
+        <button x=0 y=0 id=ok>OK</button>
+        <text x=0 y=1 id=name>Name</text>
+        <table x=0 y=2 id=people>
+          <col>Name</col>
+          <col>Age</col>
+        </table>
+      </window>
+    """)
+
+    def on_init(self):
+        self.count = 0
+
+    def on_click_ok(self):
+        self.count += 1
+
+    def on_press_name(self, key):
+        self.count += 1
+
+    def on_select_people(self, selected):
+        self.count += 1
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with forbid_start():
+        window = start(Example)
+
+    table = window["people"]
+    for i in range(100):
+        table.add_row(f"Person {i}", i)
+
+    events = (
+        ("clicks", lambda i: window["ok"].specific.simulate_click()),
+        ("keystrokes", lambda i: window["name"].specific.simulate_press("a")),
+        ("selections", lambda i: table.specific.simulate_select(i % 100)),
+    )
+    for mode in ("immediate", "threaded"):
+        print(f"{mode.capitalize()} controls:")
+        if mode == "threaded":
+            thread = start_thread()
+
+        for name, function in events:
+            begin = perf_counter()
+            for i in range(number):
+                function(i)
+            elapsed = perf_counter() - begin
+            print(f"{name:>12}: {number / elapsed:,.0f} events per second "
+                    f"({elapsed / number * 1e6:.2f} us per event)")
+
+    stop_thread()
+    vetoes = thread.vetoes
+    print(f"Answers of the thread: p50 "
+            f"{vetoes.latency.percentile(50) * 1e6:.0f} us, p99 "
+            f"{vetoes.latency.percentile(99) * 1e6:.0f} us, "
+            f"{vetoes.timeouts} timeouts")
+
+
+if __name__ == "__main__":
+    main()
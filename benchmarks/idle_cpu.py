@@ -0,0 +1,135 @@
+"""Benchmark the CPU used by an idle window in single-thread mode.
+
+Run this script from the root of the repository:
+
+    python benchmarks/idle_cpu.py [seconds] [--max-cpu PERCENT]
+
+In single-thread mode (see `bui.start`), the asyncio and GUI event
+loops take turns in the main thread.  Before, the loop never blocked
+(`asyncio.sleep(1e-13)` after polling GUI events), keeping a core busy
+while the window was idle.  Now the GUI event loop waits until a GUI
+event arrives, an asyncio timer is due, or a callback is sent from
+another thread (see `bui/specific/loop.py`).
+
+This script doesn't need wxPython: it runs the main loop of `AsyncApp`
+(`bui.specific.loop.run_event_loops`) with a fake GUI event loop, which
+blocks like `DispatchTimeout` would without events.  A timer fires
+every 100 ms and another thread sends a callback every 250 ms, to check
+that they aren't delayed.  The number of times the GUI event loop
+wakes up per second is reported too.  It exits with status 1 if the new loop uses more CPU
+than `--max-cpu` (5% by default), so it can be used to spot
+regressions.
+
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+from time import perf_counter, process_time
+
+from bui.specific.loop import run_event_loops
+
+class FakeGUILoop:
+
+    """A GUI event loop without events, which can be woken up."""
+
+    def __init__(self):
+        self.woken = threading.Event()
+        self.wakeups = 0
+
+    def pending(self):
+        return False
+
+    def dispatch(self):
+        pass
+
+    def dispatch_timeout(self, timeout):
+        self.woken.wait(timeout / 1000)
+        self.woken.clear()
+        self.wakeups += 1
+
+    def process_idle(self):
+        pass
+
+    def wake_up(self):
+        self.woken.set()
+
+
+async def legacy(gui, running):
+    """The former main loop, which never blocks."""
+    while running.is_set():
+        while gui.pending():
+            pass
+
+        gui.wakeups += 1
+        await asyncio.sleep(0.0000000000001)
+
+async def blocking(gui, running):
+    """The new main loop, blocking until asyncio has something to do."""
+    await run_event_loops(asyncio.get_event_loop(), gui, running.is_set)
+
+async def measure(main_loop, seconds):
+    """Run a main loop for some seconds, return CPU usage, wakeups and delays."""
+    loop = asyncio.get_event_loop()
+    gui = FakeGUILoop()
+    running = threading.Event()
+    running.set()
+    stopped = threading.Event()
+    delays = []
+
+    async def timer():
+        while running.is_set():
+            expected = perf_counter() + 0.1
+            await asyncio.sleep(0.1)
+            delays.append(perf_counter() - expected)
+
+    def sender():
+        while not stopped.wait(0.25):
+            sent = perf_counter()
+            loop.call_soon_threadsafe(
+                    lambda: delays.append(perf_counter() - sent))
+
+    def stop():
+        running.clear()
+        stopped.set()
+        gui.wake_up()
+
+    thread = threading.Thread(target=sender)
+    thread.start()
+    timer_task = loop.create_task(timer())
+    loop.call_later(seconds, stop)
+    begin, cpu = perf_counter(), process_time()
+    await main_loop(gui, running)
+    elapsed, cpu = perf_counter() - begin, process_time() - cpu
+    timer_task.cancel()
+    thread.join()
+    return (cpu / elapsed * 100, gui.wakeups / elapsed,
+            max(delays, default=0))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("seconds", type=float, nargs="?", default=2)
+    parser.add_argument("--max-cpu", type=float, default=5)
+    args = parser.parse_args()
+
+    usage = None
+    for name, main_loop in (("legacy", legacy), ("blocking", blocking)):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        usage, wakeups, delay = loop.run_until_complete(
+                measure(main_loop, args.seconds))
+        loop.close()
+        print(f"{name:>10}: {usage:5.1f}% CPU while idle, "
+                f"{wakeups:,.0f} wakeups per second, "
+                f"callbacks delayed by {delay * 1000:.1f} ms at most")
+
+    if usage > args.max_cpu:
+        print(f"The idle loop uses more than {args.max_cpu}% CPU")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
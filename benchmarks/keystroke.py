@@ -0,0 +1,81 @@
+"""Benchmark the latency of keystrokes without bound control methods.
+
+Run this script from the root of the repository:
+
+    python benchmarks/keystroke.py [number of keystrokes]
+
+With wxPython, each key pressed in a widget fires three controls
+(press, type and release).  Before, each of them was sent to the
+asynchronous thread, the main thread waiting for its answer, even if
+no method was bound to these controls.  Now the widget knows which
+controls are handled (see `Widget.handled`) and skips the others.
+
+This script calls `process_control` on the specific widget, as the
+toolkit events do, for each control of each keystroke.  It compares
+the current behavior with the former one, where every control was
+considered handled.  By default, the wxPython backend is used (it
+needs a display), set `BUI_GUI=headless` to measure the headless
+backend (where controls are processed in the calling thread).
+
+"""
+
+import os
+import sys
+from time import perf_counter, sleep
+
+os.environ.setdefault("BUI_GUI", "wx4")
+
+from bui import Window, start
+from bui.control.base import CONTROLS
+from bui.tools import forbid_start
+
+KEY = {"key": "a", "raw_key": "a"}
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Keystroke benchmark">
+        <text x=0 y=0 id=name>Name</text>
+      </window>
+    """)
+
+
+def keystrokes(widget, number):
+    """Fire the controls of each keystroke through the specific widget."""
+    specific = widget.specific
+    for _ in range(number):
+        specific.process_control(None, "press", dict(KEY))
+        specific.process_control(None, "type", {"unicode": "a"})
+        specific.process_control(None, "release", dict(KEY))
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with forbid_start():
+        window = start(Example)
+
+    if os.environ["BUI_GUI"] == "wx4":
+        # Wait for the asynchronous thread to be ready
+        from bui.specific.wx4.thread import WX_THREAD
+        while WX_THREAD.in_queue is None:
+            sleep(0.01)
+
+    widget = window["name"]
+    handled = type(widget).handled
+    for name, everything in (("before", True), ("skipped", False)):
+        if everything:
+            # Every control is considered handled, as before
+            type(widget).handled = property(lambda self: frozenset(CONTROLS))
+
+        begin = perf_counter()
+        keystrokes(widget, number)
+        elapsed = perf_counter() - begin
+        type(widget).handled = handled
+        print(f"{name:>7}: {number} keystrokes in {elapsed * 1000:.1f} ms "
+                f"({elapsed / number * 1e6:.2f} us per keystroke)")
+
+    if os.environ["BUI_GUI"] == "wx4":
+        window.specific._close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the layout parser on a large generated layout.
+
+Run this script from the root of the repository:
+
+    python benchmarks/parse_layout.py [number of tags]
+
+The layout is parsed with the current `BUILayoutParser` and with the
+previous implementation of `handle_starttag`, which browsed the list
+of tag attributes for each attribute in the layout.
+
+"""
+
+import sys
+from timeit import repeat
+
+from bui.layout.parser import BUILayoutParser
+from bui.layout import TAGS
+
+class LegacyParser(BUILayoutParser):
+
+    """The parser with the former, quadratic, attribute lookup."""
+
+    def handle_starttag(self, name, attrs):
+        Tag, parent_types = TAGS.get(name, (None, None))
+        remaining = list(Tag.attrs)
+        values = {}
+        for attr_name, value in attrs:
+            attr = [attr for attr in remaining if attr.name == attr_name][0]
+            values[attr.python_name] = attr.prepare(value)
+            remaining.remove(attr)
+
+        for attr in remaining:
+            values[attr.python_name] = attr.prepare()
+
+        Tag.can_be_inside(parent_types, self.current_component)
+        tag = Tag(self.layout, self.current_component, **values)
+        if self.current_component:
+            self.current_component.children.append(tag)
+        else:
+            self.layout.components.append(tag)
+        self.current_component = tag
+
+def generate(number: int) -> str:
+    """Generate a layout with `number` tags."""
+    lines = ['<window title="Benchmark" width=50 height=50>']
+    for i in range(number - 1):
+        if i % 2:
+            lines.append(f'  <button x={i % 50} y={i // 50} id=b{i} '
+                    f'disabled>Button {i}</button>')
+        else:
+            lines.append(f'  <text x={i % 50} y={i // 50} width=2 '
+                    f'id=t{i} read-only>Text {i}</text>')
+    lines.append("</window>")
+    return "\n".join(lines)
+
+def parse(Parser, text):
+    parser = Parser("benchmark.bui")
+    parser.feed(text)
+    return parser.layout
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    text = generate(number)
+    assert str(parse(LegacyParser, text)) == str(parse(BUILayoutParser, text))
+    for Parser in (LegacyParser, BUILayoutParser):
+        best = min(repeat(lambda: parse(Parser, text), number=1, repeat=5))
+        print(f"{Parser.__name__:>16}: {number} tags in {best * 1000:.1f} ms "
+                f"({best / number * 1e6:.1f} us per tag)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark changing several cells of every row in a table.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_batch.py [number of rows]
+
+Changing three cells of a row sends the row three times to the specific
+widget.  In a row batch (`with row.batch():`), the row is sent once,
+when the batch ends.  In a table batch (`with table.batch():`), the
+changed rows are compared at the end and sent together.  This script
+changes three cells of every row in a table of 10,000 rows (by
+default), using the headless backend, and counts the calls to the
+specific widget.
+
+"""
+
+from contextlib import nullcontext
+import os
+import sys
+from time import perf_counter
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Batch benchmark">
+        <table x=0 y=0 id=people>
+          <col>Name</col>
+          <col>Age</col>
+          <col>Grade</col>
+        </table>
+      </window>
+    """)
+
+
+def change(table, row_batch):
+    """Change three cells of every row."""
+    for row in table:
+        with row.batch() if row_batch else nullcontext():
+            row.name = row.name.upper()
+            row.age += 1
+            row.grade = "A"
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rows = [(f"Person {i}", i % 100, "ABCDF"[i % 5]) for i in range(number)]
+    for name, table_batch, row_batch in (("no batch", False, False),
+            ("row batch", False, True), ("table batch", True, False)):
+        with forbid_start():
+            window = start(Example)
+
+        table = window["people"]
+        table.rows = rows
+        specific = table.specific
+        calls = []
+        nested = []
+        for method in ("update_row", "refresh", "apply_edits"):
+            def counted(*args, method=getattr(specific, method)):
+                # Only count calls from the generic table
+                if not nested:
+                    calls.append(args)
+                nested.append(method)
+                try:
+                    return method(*args)
+                finally:
+                    nested.pop()
+            setattr(specific, method, counted)
+
+        begin = perf_counter()
+        with table.batch() if table_batch else nullcontext():
+            change(table, row_batch)
+        elapsed = perf_counter() - begin
+        assert specific.cells[-1][2] == "A"
+        print(f"{name:>11}: {len(calls):>6,} calls to the specific widget "
+                f"in {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark adding and removing a lot of rows in a table.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_bulk.py [number of rows]
+
+Adding rows one by one (`Table.add_row`) checks and sends each row to
+the specific widget separately, and removing rows one by one
+(`Table.remove_row`) moves the following rows each time.  The bulk
+methods (`Table.extend`, `Table.insert_rows` and `Table.remove_rows`)
+check all rows first, move the others once and send one update to the
+specific widget.  By default, 50,000 rows are added and removed, using
+the headless backend.
+
+"""
+
+import os
+import sys
+from time import perf_counter
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Bulk benchmark">
+        <table x=0 y=0 id=people>
+          <col>Name</col>
+          <col>Age</col>
+          <col>Grade</col>
+        </table>
+      </window>
+    """)
+
+
+def new_table():
+    """Return an empty table in a new window."""
+    with forbid_start():
+        window = start(Example)
+
+    return window["people"]
+
+def one_by_one_insert(table, rows):
+    """Add rows with `add_row`."""
+    for row in rows:
+        table.add_row(*row)
+
+def bulk_insert(table, rows):
+    """Add rows with `extend`."""
+    table.extend(rows)
+
+def one_by_one_delete(table, indexes):
+    """Remove rows with `remove_row`."""
+    # Remove from the bottom, so the indexes stay valid
+    for index in reversed(indexes):
+        table.remove_row(index)
+
+def bulk_delete(table, indexes):
+    """Remove rows with `remove_rows`."""
+    table.remove_rows(indexes)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rows = [(f"Person {i}", i % 100, "ABCDF"[i % 5]) for i in range(number)]
+
+    # Remove every other row of a table twice as large
+    indexes = list(range(0, number * 2, 2))
+    for name, insert, delete in (
+            ("one by one", one_by_one_insert, one_by_one_delete),
+            ("bulk", bulk_insert, bulk_delete)):
+        table = new_table()
+        begin = perf_counter()
+        insert(table, rows)
+        inserted = perf_counter() - begin
+
+        table.extend(rows)
+        begin = perf_counter()
+        delete(table, indexes)
+        deleted = perf_counter() - begin
+        assert len(table) == number
+        print(f"{name:>10}: inserted {number:,} rows in "
+                f"{inserted * 1000:8.1f} ms, deleted {number:,} rows in "
+                f"{deleted * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
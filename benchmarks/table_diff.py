@@ -0,0 +1,101 @@
+"""Benchmark replacing the rows of a table with a new snapshot.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_diff.py [number of rows] [number of changes]
+
+An application often receives the full content of a table (a snapshot)
+and sets it with `table.rows = snapshot`, even though only a few rows
+have changed.  Before, the whole table was refreshed.  Now the table
+computes the edits (rows to delete, insert and update), keyed on its
+unique column, and only sends these edits to the specific widget.
+
+This script replaces a table of 10,000 rows (by default) with a snapshot
+where 20 rows have changed (some inserted, removed, moved or renamed),
+using the headless backend.  It reports the number of rows updated in the
+specific widget and the time taken, compared to a full refresh.
+
+"""
+
+import os
+import random
+import sys
+from time import perf_counter
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Diff benchmark">
+        <table x=0 y=0 id=people>
+          <col unique>ID</col>
+          <col>Name</col>
+          <col>Status</col>
+        </table>
+      </window>
+    """)
+
+
+def snapshot(rows, changes):
+    """Return a copy of the rows with a few changes."""
+    rows = list(rows)
+    for i in range(changes):
+        kind = i % 4
+        index = random.randrange(len(rows))
+        if kind == 0:
+            rows.insert(index, (len(rows) + 10 ** 6 + i, "New", "Waiting"))
+        elif kind == 1:
+            del rows[index]
+        elif kind == 2:
+            rows.insert(random.randrange(len(rows)), rows.pop(index))
+        else:
+            id, name, _ = rows[index]
+            rows[index] = (id, name, "Done")
+
+    return rows
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    random.seed(0)
+    rows = [(i, f"Person {i}", "Waiting") for i in range(number)]
+    new_rows = snapshot(rows, changes)
+
+    with forbid_start():
+        window = start(Example)
+
+    table = window["people"]
+    table.rows = rows
+    specific = table.specific
+
+    # Count the rows updated in the specific widget
+    updated = []
+    refresh = specific.refresh
+    apply_edits = specific.apply_edits
+    specific.refresh = lambda rows: (updated.append(len(rows)), refresh(rows))
+    specific.apply_edits = lambda edits: (updated.append(sum(count
+            for _, _, count in edits)), apply_edits(edits))
+
+    begin = perf_counter()
+    table.rows = new_rows
+    elapsed = perf_counter() - begin
+    print(f"      diff: {updated[-1]:>6,} rows updated in "
+            f"{elapsed * 1000:7.1f} ms")
+    assert specific.cells == [[str(cell) for cell in row] for row in new_rows]
+
+    # Refresh the whole table, as before
+    table.rows = rows
+    table._diff = lambda old_columns: None
+    begin = perf_counter()
+    table.rows = new_rows
+    elapsed = perf_counter() - begin
+    print(f"   refresh: {updated[-1]:>6,} rows updated in "
+            f"{elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
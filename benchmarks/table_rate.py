@@ -0,0 +1,84 @@
+"""Benchmark a table updated by a lot of concurrent tasks.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_rate.py [number of downloads] [seconds]
+
+Like in `example/download.py`, each download updates a cell of its row
+every time it receives a chunk.  Before, each change was sent to the
+specific widget (with wxPython, one call in the main thread per cell).
+Now the table marks changed rows and displays them at most
+`Table.update_rate` times a second.  This script runs 50 simulated
+downloads (by default) during one second, using the headless backend,
+and counts the rows sent to the specific widget.
+
+Chunks arrive as fast as the event loop allows (downloads only yield
+to each other), so the number of changes per second measures what a
+change costs to the producers.  Rate-limited updates must not make it
+lower than with `update_rate = 0`.
+
+"""
+
+import asyncio
+import os
+import sys
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Rate benchmark">
+        <table x=0 y=0 id=downloads>
+          <col>File</col>
+          <col>Downloaded</col>
+        </table>
+      </window>
+    """)
+
+
+async def download(row, seconds):
+    """Receive chunks as fast as possible."""
+    loop = asyncio.get_running_loop()
+    end = loop.time() + seconds
+    while loop.time() < end:
+        row.downloaded += 1
+        await asyncio.sleep(0)
+
+async def run(table, number, seconds):
+    """Run all the downloads in the table."""
+    table.rows = [(f"file{i}.zip", 0) for i in range(number)]
+    await asyncio.gather(*(download(row, seconds) for row in table.rows))
+    table.flush()
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1
+    speeds = {}
+    for rate in (0, 30):
+        with forbid_start():
+            window = start(Example)
+
+        table = window["downloads"]
+        table.update_rate = rate
+        sent = []
+        update_row = table.specific.update_row
+        table.specific.update_row = lambda row: (sent.append(row._index),
+                update_row(row))
+        asyncio.run(run(table, number, seconds))
+        changes = sum(row.downloaded for row in table)
+        assert table.specific.cells[0][1] == str(table[0].downloaded)
+        speeds[rate] = changes / seconds
+        print(f"update_rate={rate:>2}: {changes:,} changes "
+                f"({speeds[rate]:,.0f} per second), {len(sent):,} "
+                f"rows sent to the specific widget")
+
+    # Allow some noise, rate-limited updates are usually faster
+    assert speeds[30] >= speeds[0] * 0.95, "rate-limited updates are slower"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Benchmark the memory and time needed to fill a large table.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_rows.py [number of rows...]
+
+By default, tables of 10,000, 100,000 and 1,000,000 rows are built.
+Before, every row was an object holding its own dictionary of columns,
+and the wxPython table kept a second copy of every row.  Now the table
+stores its values in one list per column and row objects are only
+created when needed, as views holding their index.  A virtual table
+(`<table virtual>`) doesn't even send its rows to the GUI toolkit.
+
+The memory is measured with `tracemalloc` and includes the cell values
+themselves (the same in both cases).  The displayed cells (strings) are
+built in both cases, but not counted, a real GUI toolkit would hold them.
+
+"""
+
+import gc
+import os
+import sys
+from time import perf_counter
+import tracemalloc
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Table benchmark">
+        <table x=0 y=0 id=people>
+          <col>Name</col>
+          <col>Age</col>
+          <col>Grade</col>
+        </table>
+      </window>
+    """)
+
+
+class VirtualExample(Window):
+
+    layout = mark("""
+      <window title="Virtual table benchmark">
+        <table x=0 y=0 id=people virtual>
+          <col>Name</col>
+          <col>Age</col>
+          <col>Grade</col>
+        </table>
+      </window>
+    """)
+
+
+class LegacyRow:
+
+    """A row as it was stored before, with a dictionary of columns."""
+
+    columns = ("name", "age", "grade")
+
+    def __init__(self, index, *args):
+        self._index = index
+        self._cols = {}
+        self._should_update = True
+        for col, value in zip(self.columns, args):
+            self._update(col, value)
+            self._cols[col] = value
+
+        if not all(key in self._cols.keys() for key in self.columns):
+            raise ValueError("not all columns were specified")
+
+    def _update(self, column, value):
+        if not self._should_update:
+            return
+
+        method = getattr(self, f"update_{column}", None)
+        if method:
+            method(value)
+
+
+def legacy_build(rows):
+    """Build the generic rows, the copy and cells of the specific table."""
+    generic = []
+    specific = []
+    cells = []
+    for index, values in enumerate(rows):
+        row = LegacyRow(index, *values)
+        generic.append(row)
+        cells.append([str(cell) for cell in row._cols.values()])
+        copy = LegacyRow(index, *row._cols.values())
+        copy._should_update = False
+        specific.append(copy)
+
+    # The displayed cells are not counted, like the headless ones
+    cells.clear()
+    return generic, specific
+
+def table_build(rows, window_class=Example):
+    """Build the table in a headless window."""
+    with forbid_start():
+        window = start(window_class)
+
+    table = window["people"]
+    table.rows = rows
+    return window
+
+def virtual_build(rows):
+    """Build a virtual table in a headless window."""
+    return table_build(rows, VirtualExample)
+
+def measure(build, number):
+    """
+    Build rows, return the time and the memory it took.
+
+    Args:
+        build (callable): the function to build rows.
+        number (int): the number of rows.
+
+    Returns:
+        (elapsed, size): the time in seconds and the size in bytes.
+
+    """
+    def rows():
+        return ((f"Person {i}", i % 100, "ABCDF"[i % 5])
+                for i in range(number))
+
+    gc.collect()
+    begin = perf_counter()
+    result = build(rows())
+    elapsed = perf_counter() - begin
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build(rows())
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, "*/specific/headless/*")])
+    size = sum(stat.size for stat in snapshot.statistics("filename"))
+    del result
+    return elapsed, size
+
+
+def main():
+    numbers = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    for number in numbers:
+        for name, build in (("legacy", legacy_build),
+                ("columns", table_build), ("virtual", virtual_build)):
+            elapsed, size = measure(build, number)
+            print(f"{number:>9,} rows, {name:>7}: {size / 2 ** 20:8.1f} MiB "
+                    f"({size / number:5.0f} bytes per row), "
+                    f"built in {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
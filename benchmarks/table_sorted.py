@@ -0,0 +1,92 @@
+"""Benchmark adding rows to a table which must stay sorted.
+
+Run this script from the root of the repository:
+
+    python benchmarks/table_sorted.py [number of rows] [number of new rows]
+
+A table of messages must stay sorted by date, while new messages arrive
+in any order.  Before, the table had to be sorted after each new row,
+updating every row in the specific widget.  Now the table is kept
+sorted (`Table.keep_sorted`, or the `sort` attribute of `<table>`):
+each new row is placed with a binary search and only its insertion is
+sent to the specific widget.
+
+This script adds 50 rows (by default) to a table of 10,000 rows,
+using the headless backend, and reports the time taken and the number
+of rows sent to the specific widget.
+
+"""
+
+import os
+import random
+import sys
+from time import perf_counter
+
+os.environ.setdefault("BUI_GUI", "headless")
+
+from bui import Window, start
+from bui.tools import forbid_start
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Sorted benchmark">
+        <table x=0 y=0 id=messages>
+          <col>Date</col>
+          <col>Message</col>
+        </table>
+      </window>
+    """)
+
+
+def sort_after_each(table, rows):
+    """Add each row at the bottom, then sort the table."""
+    for row in rows:
+        table.add_row(*row)
+        table.sort(key="date")
+
+def keep_sorted(table, rows):
+    """Keep the table sorted, adding each row in order."""
+    table.keep_sorted("date")
+    for row in rows:
+        table.add_row(*row)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    new = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    random.seed(0)
+    rows = [(date, f"Message {date}") for date in range(0, number * 2, 2)]
+    new_rows = [(date, f"Message {date}") for date in
+            random.sample(range(1, number * 2, 2), new)]
+
+    for name, add in (("sort after each row", sort_after_each),
+            ("keep sorted", keep_sorted)):
+        with forbid_start():
+            window = start(Example)
+
+        table = window["messages"]
+        table.rows = rows
+        specific = table.specific
+
+        # Count the rows sent to the specific widget
+        sent = []
+        update_row = specific.update_row
+        insert_rows = specific.insert_rows
+        specific.update_row = lambda row: (sent.append(1), update_row(row))
+        specific.insert_rows = lambda index, count: (sent.append(count),
+                insert_rows(index, count))
+        specific.sort = lambda order: [specific.update_row(row)
+                for row in table]
+
+        begin = perf_counter()
+        add(table, new_rows)
+        elapsed = perf_counter() - begin
+        assert specific.cells == [[str(date), message]
+                for date, message in sorted(rows + new_rows)]
+        print(f"{name:>19}: {elapsed * 1000:8.1f} ms, {sum(sent):>9,} rows "
+                f"sent to the specific widget")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,18 +11,37 @@ Package content:
             from a GUI toolkit, depending on what is available and on other
             considerations.
 
-Additionally, importing this package will do some extra work to guess the
-available GUI toolkit.  Therefore, if none is available, an exception will
-be raised right when the module is imported, before anything can be done (or
-attempted) with its classes.
+Importing this package is fast: its content is only imported when
+first used.  The available GUI toolkit is guessed when the first window
+is created.  Therefore, if none is available, an exception will be raised
+at that time.
 
 """
 
+from importlib import import_module
+
 from bui.geometry import Point, Rectangle, Size
-from bui.tools import start, PACKAGE
-from bui.widget.base import Widget
-from bui.widget.dialog import Dialog
-from bui.widget.window import Window
-Widget.specific_package = PACKAGE
+
 name = "BUI"
 version = "0.3.3"
+
+# Content of this package, with its module, imported when first used
+_LAZY = {
+    "Dialog": "bui.widget.dialog",
+    "PACKAGE": "bui.tools",
+    "Widget": "bui.widget.base",
+    "Window": "bui.widget.window",
+    "start": "bui.tools",
+}
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
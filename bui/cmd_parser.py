@@ -12,8 +12,6 @@ import argparse
 import asyncio
 
 from bui.control import log as control_log
-from bui.log import start_logging
-from bui.widget.window import Window
 
 def init_args():
     """
@@ -32,20 +30,23 @@ def init_args():
     parser.add_argument("-c", "--debug-controls",
             help="Show subscribed control methods and fired controls, "
             "can take additional filters", nargs='*')
+    parser.add_argument("-s", "--single-thread", action="store_true",
+            help="Run asynchronous controls in the main thread, "
+            "along with the window")
 
     args = parser.parse_args()
     if args.log:
+        from bui.log import start_logging
         start_logging()
     if args.debug_controls is not None:
         print("Running in 'debug controls' mode.")
-        control_log.stream.push_application()
 
         # Handle optional filters
         filters = []
         for filter in args.debug_controls:
             widget, _, control = filter.partition("@")
             filters.append((widget, control))
-        control_log.filters[:] = filters
+        control_log.tracer.enable(filters)
 
     return args
 
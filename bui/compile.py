@@ -0,0 +1,300 @@
+"""Ahead-of-time compiler for BUI layouts.
+
+Layouts are usually parsed when the window is created (see the
+[layout cache](layout/cache.md) to avoid parsing the same layout
+twice).  For frozen applications (with PyInstaller or such), where
+startup time matters, layouts can be compiled beforehand into Python
+modules that build the layout tree directly, without any parsing.
+
+Run this module with one or more Python files or directories:
+
+    python -m bui.compile my_app/
+
+For each Python file containing layouts (either defined in code with
+`mark()`, or in a `.bui` file beside the Python file), a module with
+the same name followed by `_bui` is written (`my_app/main.py` would be
+compiled into `my_app/main_bui.py`).  When the window is created, the
+compiled module is preferred, as long as the layout it was compiled
+from hasn't changed since.
+
+Python files are not imported, they are only read, so compiling
+an application will not run it.
+
+"""
+
+import argparse
+import ast
+from importlib import import_module
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from bui.layout.cache import layout_hash
+from bui.layout.layout import Layout
+from bui.layout.parser import BUILayoutParser
+
+SUFFIX = "_bui"
+
+# Compiled modules which have already been imported (or None if absent)
+_MODULES = {}
+
+def compiled_module_name(Window: type) -> str:
+    """
+    Return the name of the compiled module for this window class.
+
+    Args:
+        Window (type): the window (or dialog) class.
+
+    """
+    module = Window.__module__
+    if module == "__main__":
+        main = sys.modules.get("__main__")
+        spec = getattr(main, "__spec__", None)
+        if spec is not None:
+            module = spec.name
+        else:
+            module = Path(getattr(main, "__file__", "__main__")).stem
+
+    return f"{module}{SUFFIX}"
+
+def load_compiled(Window: type, key: str,
+        text: Optional[str] = None) -> Optional[Layout]:
+    """
+    Return the compiled layout for this window class, if available.
+
+    Args:
+        Window (type): the window (or dialog) class.
+        key (str): the layout key, either the qualified name of the
+                class for layouts defined in code, or the name of
+                the `.bui` file.
+        text (str, optional): the current layout content.  If
+                specified, the compiled layout is only returned if
+                it was compiled from this very content.  If `None`
+                (the layout file can't be read, for instance in a
+                frozen application), the compiled layout is trusted.
+
+    Returns:
+        layout (Layout or None): the layout built by the compiled
+                module, or `None` if it cannot be used.
+
+    """
+    name = compiled_module_name(Window)
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        try:
+            module = import_module(name)
+        except ImportError:
+            module = None
+        _MODULES[name] = module
+
+    if module is None:
+        return None
+
+    digest, build = getattr(module, "LAYOUTS", {}).get(key, (None, None))
+    if build is None:
+        return None
+
+    if text is not None and digest != layout_hash(text):
+        return None
+
+    return build()
+
+def find_layouts(path: Path) -> List[Tuple[str, str, str, int]]:
+    """
+    Find the layouts defined in or for a Python file.
+
+    The Python file is not imported, it is only parsed.  Layouts
+    defined in a class body (`layout = mark(...)` or
+    `layout = "..."`) are returned, as well as the `.bui` file
+    beside the Python file, and `.bui` files specified in the
+    `bui` class attribute.
+
+    Args:
+        path (Path): the path to the Python or `.bui` file.
+
+    Returns:
+        layouts (list): a list of (key, text, filename, line) tuples.
+
+    """
+    layouts = []
+    files = {}
+    source = path.with_suffix(".py")
+    if source.exists():
+        tree = ast.parse(source.read_text(encoding="utf-8"),
+                filename=str(source))
+        for qualname, node in _find_classes(tree.body, ""):
+            for statement in node.body:
+                if not isinstance(statement, ast.Assign):
+                    continue
+
+                names = [target.id for target in statement.targets
+                        if isinstance(target, ast.Name)]
+                value = statement.value
+                if isinstance(value, ast.Call) and isinstance(
+                        value.func, ast.Name) and value.func.id == "mark":
+                    value = value.args[0] if value.args else None
+
+                if not isinstance(value, ast.Constant) or not isinstance(
+                        value.value, str) or not value.value:
+                    continue
+
+                if "layout" in names:
+                    layouts.append((qualname, value.value, str(source),
+                            value.lineno))
+                elif "bui" in names:
+                    bui = Path(value.value)
+                    files[bui.name] = bui
+
+    bui = path.with_suffix(".bui")
+    files.setdefault(bui.name, bui)
+    for key, bui in files.items():
+        if bui.exists():
+            layouts.append((key, bui.read_text(encoding="utf-8"),
+                    str(bui), 0))
+
+    return layouts
+
+def _find_classes(body, prefix):
+    """Yield (qualname, node) of classes, ignoring local classes."""
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            qualname = f"{prefix}{node.name}"
+            yield qualname, node
+            yield from _find_classes(node.body, f"{qualname}.")
+
+def compile_layout(layout: Layout, function: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Generate the code of a function building this layout.
+
+    Args:
+        layout (Layout): the parsed layout.
+        function (str): the name of the function to generate.
+
+    Returns:
+        (code, imports): the function code, and a dictionary of
+                the classes to import in the module, with their
+                name as key, and their module as value.
+
+    """
+    imports = {Layout.__name__: Layout.__module__}
+    lines = [f"def {function}():", "    layout = Layout()"]
+    names = {}
+    stack = [(component, None) for component in reversed(layout.components)]
+    while stack:
+        component, parent = stack.pop()
+        Tag = type(component)
+        imports[Tag.__name__] = Tag.__module__
+        name = f"c{len(names)}"
+        names[id(component)] = name
+        parent_name = names[id(parent)] if parent is not None else "None"
+        args = ["layout", parent_name]
+        for attr in Tag.attrs:
+            value = getattr(component, attr.python_name)
+            args.append(f"{attr.python_name}={value!r}")
+
+        lines.append(f"    {name} = {Tag.__name__}({', '.join(args)})")
+        if component.data:
+            lines.append(f"    {name}.data = {component.data!r}")
+
+        if parent is None:
+            lines.append(f"    layout.components.append({name})")
+        else:
+            lines.append(f"    {parent_name}.children.append({name})")
+
+        stack.extend((child, component)
+                for child in reversed(component.children))
+
+    lines.append("    return layout")
+    return "\n".join(lines), imports
+
+def compile_file(path: Path) -> Optional[Path]:
+    """
+    Compile the layouts of a Python file (or a `.bui` file).
+
+    Args:
+        path (Path): the path to the Python or `.bui` file.
+
+    Returns:
+        compiled (Path or None): the path of the compiled module, or
+                `None` if no layout was found.
+
+    Raises:
+        ValueError: a layout couldn't be parsed.
+
+    """
+    layouts = find_layouts(path)
+    if not layouts:
+        return None
+
+    functions = []
+    entries = []
+    imports = {}
+    for i, (key, text, filename, line) in enumerate(layouts):
+        parser = BUILayoutParser(filename, line)
+        parser.feed(text)
+        function = f"_build_{i}"
+        code, used = compile_layout(parser.layout, function)
+        functions.append(code)
+        imports.update(used)
+        entries.append(f"    {key!r}: ({layout_hash(text)!r}, {function}),")
+
+    modules = {}
+    for name, module in sorted(imports.items()):
+        modules.setdefault(module, []).append(name)
+
+    stem = path.stem
+    content = [
+        f'"""Compiled layouts of {stem}, generated by `python -m bui.compile`.',
+        "",
+        "Do not edit this file: compile the layouts again instead.",
+        "",
+        '"""',
+        "",
+    ]
+    content += [f"from {module} import {', '.join(names)}"
+            for module, names in sorted(modules.items())]
+    for code in functions:
+        content += ["", code]
+
+    content += ["", "LAYOUTS = {"] + entries + ["}", ""]
+    compiled = path.with_name(f"{stem}{SUFFIX}.py")
+    compiled.write_text("\n".join(content), encoding="utf-8")
+    return compiled
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Compile the layouts of the specified files and directories."""
+    parser = argparse.ArgumentParser(prog="python -m bui.compile",
+            description="Compile BUI layouts into Python modules.")
+    parser.add_argument("paths", nargs="+", type=Path,
+            help="the Python files or directories to compile")
+    parser.add_argument("-q", "--quiet", action="store_true",
+            help="don't display compiled files")
+    args = parser.parse_args(args)
+
+    paths = []
+    for path in args.paths:
+        if path.is_dir():
+            paths.extend(sorted(path.rglob("*.py")))
+        else:
+            paths.append(path)
+
+    status = 0
+    for path in paths:
+        if path.stem.endswith(SUFFIX):
+            continue
+
+        try:
+            compiled = compile_file(path)
+        except (OSError, SyntaxError, ValueError) as err:
+            print(f"Cannot compile {path}: {err}", file=sys.stderr)
+            status = 1
+        else:
+            if compiled and not args.quiet:
+                print(f"Compiled {path} into {compiled}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
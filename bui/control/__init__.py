@@ -13,16 +13,32 @@ BUI will infer control types when a control is defined as being
 "implicit" (a button control without specific control name is believed
 to be "click", since it's usually a good default).
 
+Control modules are only imported when a control is first needed
+(see `CONTROLS`).
+
 """
 
+from importlib import import_module
+
 from bui.control.base import CONTROLS
-from bui.control.change import Change
-from bui.control.check import Check
-from bui.control.click import Click
-from bui.control.close import Close
-from bui.control.init import Init
-from bui.control.press import Press
-from bui.control.release import Release
-from bui.control.right_click import RightClick
-from bui.control.select import Select
-from bui.control.type import Type
+
+# Control classes, with their module in this package
+_CLASSES = {
+    "Change": "change",
+    "Check": "check",
+    "Click": "click",
+    "Close": "close",
+    "Init": "init",
+    "Press": "press",
+    "Release": "release",
+    "RightClick": "right_click",
+    "Select": "select",
+    "Type": "type",
+}
+
+def __getattr__(name):
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(f"bui.control.{module}"), name)
@@ -6,20 +6,31 @@ All controls should inherit from the below class.
 
 import asyncio
 from enum import Enum
+from importlib import import_module
 import inspect
 import re
-from typing import Callable
+from time import perf_counter
 
 from bui.control.exceptions import StopControl
-from bui.control.log import ControlLogger
+from bui.control.log import tracer
+from bui.registry import LazyRegistry
 
 # Private constants
 _WINDOW = None
 
-# Dictionary of existing controls
-CONTROLS = {}
+def _import_control(name):
+    """Import a control module, the control registers itself."""
+    import_module(f"bui.control.{name}")
+
+# Dictionary of existing controls, imported when first needed
+CONTROLS = LazyRegistry(("change", "check", "click", "close", "init",
+        "press", "release", "right_click", "select", "type"),
+        _import_control)
 NOT_SET = object()
 
+# Call plans of control methods, with (function, control class) as key
+_CALL_PLANS = {}
+
 class MetaControl(type):
 
     """Control metaclass."""
@@ -29,9 +40,6 @@ class MetaControl(type):
         if control.name:
             CONTROLS[control.name] = control
 
-        # Create a logger just for this class
-        control.logger = ControlLogger(control)
-
         return control
 
 
@@ -52,13 +60,20 @@ class Control(metaclass=MetaControl):
         self.widget = widget
 
     @classmethod
-    def _bind_methods(cls, widget, window):
+    def _bind_methods(cls, widget, window, plan=None):
         """
         Bind one or more methods to this control.
 
+        Methods are not bound directly: they are added to a binding
+        plan (see `BindingPlan`), computed once for each window class
+        and applied to every window created from this class.
+
         Args:
             widget (Widget): the widget on which are controls.
             window (Window); othe window on which are control methods.
+            plan (BindingPlan, optional): the binding plan to complete.
+                    If not set, a plan is created for this widget
+                    and applied immediately.
 
         """
         global _WINDOW
@@ -66,49 +81,41 @@ class Control(metaclass=MetaControl):
         if _WINDOW is None:
             from bui.widget.window import Window as _WINDOW
 
+        if plan is None:
+            plan = BindingPlan(window, [widget])
+            cls._bind_methods(widget, window, plan)
+            plan.apply(window, [widget])
+            return
+
         if cls.has_sub_controls:
             # This control has sub-controls
             # sub-controls can all be linked to control methods
             if cls.window_control and widget is window:
                 method_name = f"on_{cls.name}"
-                bound = cls._register_method(widget, window, method_name)
-                if bound:
-                    cls._report_bound(_ControlScope.WINDOW, window,
-                            method_name)
+                plan.add(cls, _ControlScope.WINDOW, widget, method_name)
 
                 if cls.pattern_for_window:
-                    pattern = re.compile(cls.pattern_for_window)
-                    contents = dir(window)
-                    for content in contents:
+                    pattern = plan.compile(cls.pattern_for_window)
+                    for content in plan.names:
                         match = pattern.search(content)
                         if match:
                             group = match.groupdict()
-                            bound = cls._register_method(widget, window,
+                            plan.add(cls, _ControlScope.WINDOW, widget,
                                     content, group=group)
-                            if bound:
-                                cls._report_bound(_ControlScope.WINDOW,
-                                        window, content, options=group)
             elif cls.widget_control:
                 method_name = cls.name_for_widgets_without_options.format(
                         control=cls.name, wid=widget.id)
-                bound = cls._register_method(widget, window, method_name)
-                if bound:
-                    cls._report_bound(_ControlScope.WIDGET, widget,
-                            method_name)
+                plan.add(cls, _ControlScope.WIDGET, widget, method_name)
 
                 if cls.pattern_for_widgets:
                     pattern = cls.pattern_for_widgets.format(id=widget.id)
-                    pattern = re.compile(pattern)
-                    contents = dir(window)
-                    for content in contents:
+                    pattern = plan.compile(pattern)
+                    for content in plan.names:
                         match = pattern.search(content)
                         if match:
                             group = match.groupdict()
-                            bound = cls._register_method(widget, window,
+                            plan.add(cls, _ControlScope.WIDGET, widget,
                                     content, group=group)
-                            if bound:
-                                cls._report_bound(_ControlScope.WIDGET,
-                                        widget, content, options=group)
 
             return
 
@@ -117,125 +124,58 @@ class Control(metaclass=MetaControl):
             # This is an implicit control, don't force-add any method
             if cls.window_control and widget is window:
                 method_name = f"on_{cls.name}"
+                scope = _ControlScope.WINDOW
             elif cls.widget_control:
                 method_name = f"on_{widget.id}"
+                scope = _ControlScope.WIDGET
             else:
                 method_name = None
 
             if method_name:
-                bound = cls._register_method(widget, window, method_name,
-                        force=False)
-                if bound:
-                    if cls.window_control and widget is window:
-                        cls._report_bound(_ControlScope.WINDOW, window,
-                                method_name, implicit=True)
-                    else:
-                        cls._report_bound(_ControlScope.WIDGET, widget,
-                                method_name, implicit=True)
+                bound = plan.add(cls, scope, widget, method_name,
+                        force=False, implicit=True)
 
         if not bound:
             if cls.window_control and widget == window:
                 method_name = f"on_{cls.name}"
-                if cls._register_method(widget, window, method_name):
-                    cls._report_bound(_ControlScope.WINDOW, window,
-                            method_name)
+                if plan.add(cls, _ControlScope.WINDOW, widget, method_name):
                     return
 
             if cls.widget_control and hasattr(widget, "id"):
                 method_name = f"on_{cls.name}_{widget.id}"
-                if cls._register_method(widget, window, method_name):
-                    cls._report_bound(_ControlScope.WIDGET, widget,
-                            method_name)
-
-    @classmethod
-    def _register_method(cls, widget, window, method_name, force=True, group=None):
-        """Try to register a control method."""
-        group = group or {}
-        method = getattr(window, method_name, None)
-        if method:
-            former, control = window.control_methods.get(method_name, (None, None))
-            if former and force:
-                raise ValueError(
-                        f"attempting to connect control {widget}"
-                        f"[{cls.name}] but fails because {former}[{control}] "
-                        f"is using the same method ({method_name}).  Please "
-                        f"clarify their respective IDs and use explicit "
-                        f"names to avoid this conflit.")
-
-            widget.controls[cls.name].append((group, method))
-            window.control_methods[method_name] = (widget, cls.name)
-            return True
-
-        return False
-
-    @classmethod
-    def _report_bound(cls, kind: '_ControlScope', widget: 'Widget', method: str,
-            options: dict = None, implicit: bool = False):
-        report = f"Bound {cls.name} as "
-        if implicit:
-            report += "an implicit "
-        else:
-            report += "a "
-
-        wid = ""
-        if kind is _ControlScope.WINDOW:
-            report += "window control "
-        elif kind is _ControlScope.WIDGET:
-            report += f"widget control of {widget.widget}"
-            wid = getattr(widget, "id", "")
-            if wid:
-                report += f"({wid}) "
-        else:
-            report += "unknown scope "
-
-        if options is not None:
-            report += f"with options={options} "
-
-        report += f"to the {method!r} method"
-        report = report.replace("{", "{{").replace("}", "}}")
-        cls.logger.debug(" " * 4 + report.strip(), widget=wid)
+                plan.add(cls, _ControlScope.WIDGET, widget, method_name)
 
     def process(self, options=None, callback=None):
         """Process the control, calls a generic `on_` method if found."""
-        #if self.name == "select": breakpoint()
-        wid = getattr(self.widget, "id", "")
-        self._report_fire(options)
+        trace = tracer.enabled
+        if trace:
+            tracer.emit("fire", self.name, self.widget, options=options)
 
         # Call handle_{control} on the widget
         method = getattr(self.widget, f"handle_{self.name}", None)
         if method:
             method(self)
 
-        # Call the `on_...` method on the window
-        options = options or {}
-        methods = self.widget.controls.get(self.name, [])
+        # Call the `on_...` method on the window, looking for a
+        # sub-control matching the options first
+        table = self.widget._dispatch_table(self.name)
         res = NOT_SET
-        for group, method in methods:
-            if res is not NOT_SET:
-                continue
-
-            to_test = {}
-            for key, value in options.items():
-                if key in group.keys():
-                    to_test[key] = value
-
-            if group and group == to_test:
-                self._report_call(method, child=True, wid=wid)
-                res = self._call_method(method)
-                break
+        if options:
+            method = table.match(options)
+            if method is not None:
+                if trace:
+                    res = self._trace_call(method, child=True)
+                else:
+                    res = self._call_method(method)
 
         # At this point we consider no match was found in the options,
         # so we call the parent control if appropriate.
-        options = {}
-        methods = self.widget.controls.get(self.name, [])
-        for group, method in methods:
-            if res is not NOT_SET:
-                continue
-
-            if group == options:
-                self._report_call(method, wid=wid)
+        if res is NOT_SET and table.main is not None:
+            method = table.main
+            if trace:
+                res = self._trace_call(method, callback=callback)
+            else:
                 res = self._call_method(method, callback=callback)
-                break
 
         # Call after_{control} on the widget
         method = getattr(self.widget, f"after_{self.name}", None)
@@ -260,27 +200,22 @@ class Control(metaclass=MetaControl):
             StopControl
 
         """
-        wid = getattr(self.widget, "id", "")
-        self._report_stop(reason, wid=wid)
+        if tracer.enabled:
+            tracer.emit("stop", self.name, self.widget, reason=reason)
         raise StopControl()
 
     def _call_method(self, method, callback=None):
         """Call a control method with optional arguments."""
-        signature = inspect.signature(method)
-        parameters = tuple(signature.parameters.keys())
-        kwargs = {}
-        for key in self.options:
-            if key in parameters:
-                kwargs[key] = getattr(self, key)
-
-        if "control" in parameters:
+        options, control, widget, is_coroutine = self._call_plan(method)
+        kwargs = {key: getattr(self, key) for key in options}
+        if control:
             kwargs["control"] = self
 
-        if "widget" in parameters:
+        if widget:
             kwargs["widget"] = self.widget
 
         result = method(**kwargs)
-        if asyncio.iscoroutine(result):
+        if is_coroutine or asyncio.iscoroutine(result):
             task = self.widget.schedule(result)
             if callback:
                 task.add_done_callback(callback)
@@ -289,36 +224,215 @@ class Control(metaclass=MetaControl):
 
         return result
 
-    def _report_fire(self, options: dict = None):
-        report = f"Fire {self.name} control on {self.widget.widget}"
-        wid = getattr(self.widget, "id", None)
-        if wid:
-            report += f"({wid}) "
-        else:
-            report += " "
-        if options:
-            report += f"with options={options}"
-        report = report.replace("{", "{{").replace("}", "}}")
-        self.logger.debug("  " + report.strip(), widget=wid)
-
-    def _report_call(self, method: Callable, child: bool = False, wid: str = ""):
-        report = "Match "
-        if child:
-            report += "child "
-        else:
-            report += "main "
-
-        report += f"control to {method.__name__}, call it"
-        report = report.replace("{", "{{").replace("}", "}}")
-        self.logger.debug(" " * 4 + report.strip(), widget=wid)
-
-    def _report_stop(self, reason: str = "", wid: str = ""):
-        if reason:
-            report = f"Stopping: {reason}"
-        else:
-            report = f"Stopping"
-        report = report.replace("{", "{{").replace("}", "}}")
-        self.logger.debug(6 * " " + report, widget=wid)
+    def _trace_call(self, method, callback=None, child=False):
+        """Call a control method, tracing the call and its duration."""
+        name = getattr(method, "__name__", repr(method))
+        tracer.emit("call", self.name, self.widget, method=name, child=child)
+        start = perf_counter()
+        try:
+            return self._call_method(method, callback=callback)
+        finally:
+            tracer.emit("return", self.name, self.widget, method=name,
+                    duration=perf_counter() - start)
+
+    @classmethod
+    def _call_plan(cls, method):
+        """
+        Return the call plan of a control method, computing it if needed.
+
+        Inspecting the method signature is expensive, and controls
+        can be fired very often (a key held down, for instance).
+        The call plan is computed once for each function and control
+        class, and kept in `_CALL_PLANS`.
+
+        Args:
+            method (callable): the control method (usually bound).
+
+        Returns:
+            plan (tuple): a tuple (options, control, widget,
+                    is_coroutine), where options is the tuple of control
+                    options to send as keyword arguments, control and
+                    widget are booleans to indicate whether to send
+                    these keyword arguments, and is_coroutine
+                    indicates whether the method is a coroutine function.
+
+        """
+        function = getattr(method, "__func__", method)
+        key = (function, cls)
+        plan = _CALL_PLANS.get(key)
+        if plan is None:
+            parameters = inspect.signature(method).parameters
+            plan = (
+                tuple(key for key in cls.options if key in parameters),
+                "control" in parameters,
+                "widget" in parameters,
+                inspect.iscoroutinefunction(function),
+            )
+            _CALL_PLANS[key] = plan
+
+        return plan
+
+
+class BindingPlan:
+
+    """
+    The control methods to bind on the widgets of a window.
+
+    Finding the control methods of a window means browsing the window
+    methods for each widget and control.  Since the window methods and
+    layout are identical for all windows created from the same class,
+    the result is kept in a binding plan, computed when the first
+    window is created, and applied to every following window.
+
+    Args:
+        window (Window): the first window created from this class.
+        widgets (list): the widgets of this window, in order.
+
+    Attributes:
+        names (list): the sorted names of the window attributes.
+        bindings (list): the bindings to apply, as tuples
+                (widget position, control class, scope, method name,
+                group, implicit).
+
+    """
+
+    def __init__(self, window, widgets):
+        self.window = window
+        self.names = dir(window)
+        self.bindings = []
+        self._positions = {id(widget): i for i, widget in enumerate(widgets)}
+        self._methods = {}
+        self._patterns = {}
+
+    def compile(self, pattern: str):
+        """Compile and return a regular expression, caching it."""
+        compiled = self._patterns.get(pattern)
+        if compiled is None:
+            compiled = self._patterns[pattern] = re.compile(pattern)
+
+        return compiled
+
+    def add(self, control: type, scope: str, widget, method_name: str,
+            group: dict = None, force: bool = True,
+            implicit: bool = False) -> bool:
+        """
+        Add a binding to the plan, if the window has this method.
+
+        Args:
+            control (type): the control class.
+            scope (str): the control scope (see `_ControlScope`).
+            widget (Widget): the widget on which to bind the method.
+            method_name (str): the name of the window method.
+            group (dict, optional): the options of a sub-control.
+            force (bool, optional): if `True` (the default), fail if
+                    the method is already bound to another control.
+            implicit (bool, optional): is it an implicit control?
+
+        Returns:
+            bound (bool): whether the method exists and will be bound.
+
+        Raises:
+            ValueError: the method is already bound to another control.
+
+        """
+        if not getattr(self.window, method_name, None):
+            return False
+
+        former, name = self._methods.get(method_name, (None, None))
+        if former and force:
+            raise ValueError(
+                    f"attempting to connect control {widget}"
+                    f"[{control.name}] but fails because {former}[{name}] "
+                    f"is using the same method ({method_name}).  Please "
+                    f"clarify their respective IDs and use explicit "
+                    f"names to avoid this conflit.")
+
+        self._methods[method_name] = (widget, control.name)
+        self.bindings.append((self._positions[id(widget)], control, scope,
+                method_name, group, implicit))
+        return True
+
+    def apply(self, window, widgets):
+        """
+        Bind the control methods of a window.
+
+        Args:
+            window (Window): the window containing the control methods.
+            widgets (list): the widgets of this window, in the same
+                    order as the widgets used to compute the plan.
+
+        """
+        # The plan shouldn't keep the first window alive
+        self.window = None
+        for position, control, scope, method_name, group, implicit in (
+                self.bindings):
+            widget = widgets[position]
+            method = getattr(window, method_name)
+            widget.controls[control.name].append((group or {}, method))
+            window.control_methods[method_name] = (widget, control.name)
+            if tracer.enabled:
+                reported = window if scope is _ControlScope.WINDOW else widget
+                tracer.emit("bind", control.name, reported, method_name,
+                        options=group, scope=scope, implicit=implicit)
+
+
+class DispatchTable:
+
+    """
+    Index of the methods bound to a control on a widget.
+
+    Sub-controls (like `on_press_ctrl_s`) are indexed by their option
+    names and values, so that the method to call is found without
+    browsing all the methods bound to this control.  The first method
+    without options is the parent control, called if no sub-control
+    matches.
+
+    Args:
+        methods (list): the bound methods, as a list of
+                (options group, method) tuples, in order.
+
+    """
+
+    __slots__ = ("size", "children", "main")
+
+    def __init__(self, methods):
+        self.size = len(methods)
+        self.children = {}
+        self.main = None
+        for position, (group, method) in enumerate(methods):
+            if group:
+                keys = tuple(sorted(group))
+                values = tuple(group[key] for key in keys)
+                by_values = self.children.setdefault(keys, {})
+                by_values.setdefault(values, (position, method))
+            elif self.main is None:
+                self.main = method
+
+    def match(self, options: dict):
+        """
+        Return the sub-control method matching these options, if any.
+
+        If several sub-controls match, the first bound method is returned.
+
+        Args:
+            options (dict): the control options.
+
+        Returns:
+            method (callable or None): the matching method.
+
+        """
+        found = None
+        for keys, by_values in self.children.items():
+            try:
+                values = tuple(options[key] for key in keys)
+                match = by_values.get(values)
+            except (KeyError, TypeError):
+                continue
+
+            if match and (found is None or match[0] < found[0]):
+                found = match
+
+        return found[1] if found else None
 
 
 class _ControlScope:
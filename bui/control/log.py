@@ -1,49 +1,203 @@
-"""Log specific to controls."""
+"""Log and trace of controls.
 
+Controls can be traced, to display the bound control methods and
+fired controls (see the `--debug-controls` command-line argument in
+`bui/cmd_parser.py`).  Tracing is disabled by default and costs
+nothing then: callers check `tracer.enabled` before building any
+trace event.
+
+When enabled, the tracer records structured events (`TraceEvent`),
+keeping the last ones in memory, and logs them in a readable format.
+Filters (like `-c widget@control`) are applied when the event is
+emitted.  Logbook is only imported when the tracer is enabled.
+
+"""
+
+from collections import deque, namedtuple
 import sys
+from time import perf_counter
+
+TraceEvent = namedtuple("TraceEvent", ("kind", "control", "widget",
+        "wid", "method", "options", "duration", "details", "time"))
+TraceEvent.__doc__ = """
+A trace event.
+
+Attributes:
+    kind (str): the event kind, either "bind" (a control method is
+            bound), "fire" (a control is fired), "call" (a control
+            method is called), "return" (a control method has returned)
+            or "stop" (a control is stopped).
+    control (str): the control name.
+    widget (str): the widget name (like "window" or "button").
+    wid (str): the widget identifier, might be empty.
+    method (str): the name of the control method, might be empty.
+    options (dict): the control options, or `None`.
+    duration (float): for "return" events, the time spent in the
+            control method, in seconds.
+    details (dict): additional details, depending on the event kind.
+    time (float): the time of the event (see `time.perf_counter`).
+
+"""
+
+class ControlTracer:
+
+    """
+    Tracer of controls, disabled by default.
+
+    Args:
+        max_events (int, optional): the maximum number of events to
+                keep in memory.
+
+    Attributes:
+        enabled (bool): is the tracer enabled?  Callers should check
+                this flag before emitting events.
+        filters (list): the filters, as a list of (widget identifier,
+                control name) tuples, either of them can be empty.
+                If no filter is set, all events are accepted.
+        events (deque): the last accepted events.
+        log (bool): should accepted events be logged?
+
+    """
+
+    def __init__(self, max_events: int = 1000):
+        self.enabled = False
+        self.filters = []
+        self.events = deque(maxlen=max_events)
+        self.log = True
+        self._logger = None
+        self._stream = None
+
+    @property
+    def logger(self):
+        """Return the logger of controls, creating it if needed."""
+        if self._logger is None:
+            self._create_logger()
+
+        return self._logger
+
+    def _create_logger(self):
+        """Create the logger and the handler of the standard output."""
+        from logbook import Logger, StreamHandler
+        self._stream = StreamHandler(sys.stdout, level="DEBUG", bubble=True)
+        self._stream.format_string = "{record.message}"
+        self._logger = Logger("bui.control")
 
-from logbook import Logger, StreamHandler
+    def enable(self, filters=(), log: bool = True):
+        """
+        Enable the tracer.
 
-filters = []
-stream = StreamHandler(sys.stdout, level="DEBUG", bubble=True)
-stream.format_string = "{record.message}"
-logger = Logger("bui.control")
+        Args:
+            filters (sequence, optional): the filters, as a sequence of
+                    (widget identifier, control name) tuples.
+            log (bool, optional): if `True` (the default), log the
+                    accepted events on the standard output.
 
-def filter_record(record, handler):
-    """Check if the record can be logged."""
-    if not filters:
-        return True
+        """
+        self.filters[:] = filters
+        self.log = log
+        if log and not self.enabled:
+            if self._stream is None:
+                self._create_logger()
+            self._stream.push_application()
+        self.enabled = True
 
-    for widget, control in filters:
-        wid = record.kwargs.get("widget", None)
-        if wid is None:
+    def disable(self):
+        """Disable the tracer."""
+        if self.log and self.enabled:
+            self._stream.pop_application()
+        self.enabled = False
+
+    def accepts(self, wid: str, control: str) -> bool:
+        """
+        Return whether an event passes the filters.
+
+        Args:
+            wid (str): the widget identifier.
+            control (str): the control name.
+
+        """
+        if not self.filters:
             return True
 
-        if widget:
-            if widget == wid:
-                if not control:
-                    return True
-            else:
+        for f_widget, f_control in self.filters:
+            if f_widget and f_widget != wid:
                 continue
-        if control:
-            if control == record.extra["control"]:
+
+            if f_widget and not f_control:
+                return True
+
+            if f_control and f_control == control:
                 return True
 
-            continue
+        return False
 
-    return False
+    def emit(self, kind: str, control: str, widget, method: str = "",
+            options: dict = None, duration: float = None, **details):
+        """
+        Emit a trace event, if accepted by the filters.
+
+        Args:
+            kind (str): the event kind (see `TraceEvent`).
+            control (str): the control name.
+            widget (Widget): the widget on which the control is.
+            method (str, optional): the name of the control method.
+            options (dict, optional): the control options.
+            duration (float, optional): the duration of the call.
+            Other keyword arguments are stored in the event details.
+
+        Returns:
+            event (TraceEvent or None): the event, if accepted.
+
+        """
+        wid = getattr(widget, "id", "") or ""
+        if not self.accepts(wid, control):
+            return None
+
+        event = TraceEvent(kind, control, getattr(widget, "widget", ""), wid,
+                method, options, duration, details, perf_counter())
+        self.events.append(event)
+        if self.log:
+            self.logger.debug(self.format(event))
+
+        return event
+
+    @staticmethod
+    def format(event: TraceEvent) -> str:
+        """Return a readable description of the trace event."""
+        details = event.details
+        if event.kind == "bind":
+            report = "    Bound "
+            report += f"{event.control} as "
+            report += "an implicit " if details.get("implicit") else "a "
+            if details.get("scope") == "window control":
+                report += "window control "
+            else:
+                report += f"widget control of {event.widget}"
+                if event.wid:
+                    report += f"({event.wid}) "
 
-stream.filter = filter_record
+            if event.options is not None:
+                report += f"with options={event.options} "
 
-class ControlLogger(Logger):
+            return report + f"to the {event.method!r} method"
+        elif event.kind == "fire":
+            report = f"  Fire {event.control} control on {event.widget}"
+            if event.wid:
+                report += f"({event.wid})"
+            if event.options:
+                report += f" with options={event.options}"
+            return report
+        elif event.kind == "call":
+            kind = "child" if details.get("child") else "main"
+            return f"    Match {kind} control to {event.method}, call it"
+        elif event.kind == "return":
+            return (f"      {event.method} returned in "
+                    f"{event.duration * 1000:.3f} ms")
+        elif event.kind == "stop":
+            reason = details.get("reason")
+            return f"      Stopping: {reason}" if reason else "      Stopping"
 
-    """Specific logger to work on a given control class."""
+        return f"  {event.kind} {event.control} on {event.widget}"
 
-    def __init__(self, control):
-        name = f"bui.control.{control.name}"
-        super().__init__(name)
-        self.control = control
 
-    def process_record(self, record):
-        super().process_record(record)
-        record.extra['control'] = self.control.name
+tracer = ControlTracer()
@@ -1,34 +1,64 @@
-"""Package containing layout tags."""
-
-from bui.layout.button import Button
-from bui.layout.checkbox import Checkbox
-from bui.layout.choice import Choice
-from bui.layout.col import Col
-from bui.layout.context import Context
-from bui.layout.dialog import Dialog
-from bui.layout.item import Item
-from bui.layout.list import List
-from bui.layout.menu import Menu
-from bui.layout.menubar import Menubar
-from bui.layout.radio import RadioButton
-from bui.layout.table import Table
-from bui.layout.text import Text
-from bui.layout.window import Window
-
-TAGS = {
-    # name: (Class, (should be inside))
-    "button": (Button, (Window, Dialog)),
-    "checkbox": (Checkbox, (Window, Dialog)),
-    "choice": (Choice, (RadioButton, List)),
-    "col": (Col, Table),
-    "context": (Context, Window),
-    "dialog": (Dialog, None),
-    "item": (Item, (Context, Menu, )),
-    "list": (List, (Window, Dialog)),
-    "menu": (Menu, (Context, Menu, Menubar)),
-    "menubar": (Menubar, Window),
-    "radio": (RadioButton, (Window, Dialog)),
-    "table": (Table, (Window, Dialog)),
-    "text": (Text, (Window, Dialog)),
-    "window": (Window, None),
+"""Package containing layout tags.
+
+Tag modules are only imported when a tag is first needed (see `TAGS`).
+
+"""
+
+from importlib import import_module
+
+from bui.registry import LazyRegistry
+
+# Tag classes, with their module in this package
+_CLASSES = {
+    "Button": "button",
+    "Checkbox": "checkbox",
+    "Choice": "choice",
+    "Col": "col",
+    "Context": "context",
+    "Dialog": "dialog",
+    "Item": "item",
+    "List": "list",
+    "Menu": "menu",
+    "Menubar": "menubar",
+    "RadioButton": "radio",
+    "Table": "table",
+    "Text": "text",
+    "Window": "window",
+}
+
+_TAGS = {
+    # name: (class name, (should be inside))
+    "button": ("Button", ("window", "dialog")),
+    "checkbox": ("Checkbox", ("window", "dialog")),
+    "choice": ("Choice", ("radio", "list")),
+    "col": ("Col", ("table", )),
+    "context": ("Context", ("window", )),
+    "dialog": ("Dialog", None),
+    "item": ("Item", ("context", "menu")),
+    "list": ("List", ("window", "dialog")),
+    "menu": ("Menu", ("context", "menu", "menubar")),
+    "menubar": ("Menubar", ("window", )),
+    "radio": ("RadioButton", ("window", "dialog")),
+    "table": ("Table", ("window", "dialog")),
+    "text": ("Text", ("window", "dialog")),
+    "window": ("Window", None),
 }
+
+def __getattr__(name):
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(f"bui.layout.{module}"), name)
+
+def _load_tag(name):
+    """Return the tag class and the classes of its possible parents."""
+    class_name, parents = _TAGS[name]
+    Tag = __getattr__(class_name)
+    if parents is not None:
+        parents = tuple(__getattr__(_TAGS[parent][0]) for parent in parents)
+
+    return (Tag, parents)
+
+# name: (Class, (should be inside)), imported when first needed
+TAGS = LazyRegistry(_TAGS, _load_tag)
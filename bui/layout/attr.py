@@ -89,3 +89,43 @@ class Attr:
                         f"invalid value ({value} of type {type(value)}).  {self.help}") from None
 
         return value
+
+
+class AttrSchema:
+
+    """
+    The attributes of a tag, indexed for the parser.
+
+    A schema is built once for each component class (see
+    `Component.__init_subclass__`), so that parsing a tag doesn't need
+    to browse all its attributes for each attribute in the layout.
+
+    Args:
+        attrs (tuple): the tag attributes (`Attr` objects).
+
+    Attributes:
+        by_name (dict): the attributes, with their name as key.
+        required (tuple): the mandatory attributes, in order.
+        defaults (dict): the default values of the optional attributes
+                with a static default, with their Python name as key.
+        dynamic (tuple): the optional attributes whose default is a
+                callable, to be called for each tag.
+
+    """
+
+    def __init__(self, attrs):
+        self.by_name = {}
+        self.defaults = {}
+        required = []
+        dynamic = []
+        for attr in attrs:
+            self.by_name.setdefault(attr.name, attr)
+            if attr.default is NO_DEFAULT:
+                required.append(attr)
+            elif callable(attr.default):
+                dynamic.append(attr)
+            else:
+                self.defaults[attr.python_name] = attr.default
+
+        self.required = tuple(required)
+        self.dynamic = tuple(dynamic)
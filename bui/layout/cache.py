@@ -0,0 +1,231 @@
+"""Cache of compiled layouts, to avoid parsing the same layout twice.
+
+Parsing a layout with the `BUILayoutParser` means tokenizing the whole
+layout text and validating every attribute of every tag.  This is done
+each time a window or dialog is created, which can become expensive for
+an application with a lot of windows and dialogs (popping the same dialog
+again would parse its layout again).
+
+The `LayoutCache` stores the validated `Layout` (the component tree, with
+attributes already prepared) in memory and on disk.  An entry is keyed
+by the layout source (the path of the `.bui` file, or the file and
+qualified name of the class for layouts defined with `mark()`) and by
+a hash of the layout content, so that changing the layout will
+invalidate the entry.
+
+On disk, entries are written in a per-user cache directory (see
+`cache_directory`), which can be changed with the `BUI_CACHE_DIR`
+environment variable.  Setting this variable to an empty string disables
+the cache on disk.  Failing to read or write this directory is not an
+error: the layout is simply parsed again.  Entries written with an older
+format are removed when a layout is written again.
+
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import sys
+from typing import Optional, Union
+
+from bui.layout.layout import Layout
+from bui.layout.parser import BUILayoutParser
+
+# Increase this number when the layout classes change in a way that
+# makes older cached layouts incompatible.
+FORMAT = 3
+
+def layout_hash(text: str) -> str:
+    """
+    Return the hash of the layout content, as an hexadecimal string.
+
+    Args:
+        text (str): the layout content.
+
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_directory() -> Optional[Path]:
+    """
+    Return the directory in which to cache layouts on disk.
+
+    The `BUI_CACHE_DIR` environment variable is used if set (an empty
+    string disables the cache on disk).  Otherwise, the user cache
+    directory of the platform is used.
+
+    Returns:
+        directory (Path or None): the directory, or `None` if layouts
+                shouldn't be cached on disk.
+
+    """
+    directory = os.environ.get("BUI_CACHE_DIR")
+    if directory is not None:
+        return Path(directory) if directory else None
+
+    if sys.platform == "win32":
+        base = (os.environ.get("LOCALAPPDATA") or
+                Path.home() / "AppData" / "Local")
+        return Path(base) / "bui" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "bui"
+
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "bui"
+
+
+class LayoutCache:
+
+    """
+    Cache of compiled layouts, in memory and on disk.
+
+    Args:
+        directory (Path or str, optional): the directory in which to store
+                cached layouts.  If not set (the default), cached
+                layouts are written in the user cache directory (see
+                `cache_directory`).
+        max_size (int, optional): the maximum number of layouts to keep
+                in memory.  The least recently used layouts are
+                forgotten when this limit is reached.
+
+    Attributes:
+        enabled (bool): should the cache be used at all?  If set
+                to `False`, layouts are always parsed.
+        on_disk (bool): should layouts be read from and written to
+                the disk?  If set to `False`, only the memory is used.
+
+    """
+
+    def __init__(self, directory: Optional[Union[Path, str]] = None,
+            max_size: int = 256):
+        self.directory = directory
+        self.max_size = max_size
+        self.enabled = True
+        self.on_disk = True
+        self._memory = OrderedDict()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def clear(self):
+        """Clear the cache in memory.  Files on disk are kept."""
+        self._memory.clear()
+
+    def parse(self, text: str, filename: str, start_line: int = 0,
+            qualname: str = "") -> Layout:
+        """
+        Return the compiled layout, parsing it only if necessary.
+
+        Args:
+            text (str): the layout content.
+            filename (str): the file containing the layout.  This is
+                    either the `.bui` file or the Python file in which
+                    the layout is defined, with `mark()`.
+            start_line (int, optional): the line at which the layout
+                    begins in the file, used to report errors.
+            qualname (str, optional): the qualified name of the class
+                    defining this layout, if the layout is defined
+                    in code.
+
+        Returns:
+            layout (Layout): the compiled layout.  A new copy is
+                    returned for each call.
+
+        Raises:
+            ValueError: the layout couldn't be parsed.
+
+        """
+        if not self.enabled:
+            return self._compile(text, filename, start_line)
+
+        digest = layout_hash(text)
+        key = (filename, qualname, digest)
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            return pickle.loads(data)
+
+        path = self._path_for(filename, qualname)
+        layout = self._read(path, digest) if path else None
+        if layout is None:
+            layout = self._compile(text, filename, start_line)
+            if path:
+                self._write(path, digest, layout)
+
+        data = pickle.dumps(layout, pickle.HIGHEST_PROTOCOL)
+        self._memory[key] = data
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+        return layout
+
+    @staticmethod
+    def _compile(text: str, filename: str, start_line: int) -> Layout:
+        """Parse the layout and return it."""
+        parser = BUILayoutParser(filename, start_line)
+        parser.feed(text)
+        return parser.layout
+
+    def _path_for(self, filename: str, qualname: str) -> Optional[Path]:
+        """Return the path of the cached layout on disk, if any."""
+        if not self.on_disk or filename == "__unknown__":
+            return None
+
+        # Classes created dynamically (like the dialogs created by
+        # `pop_dialog`) share the same qualified name for different
+        # layouts, don't cache them on disk.
+        if "<locals>" in qualname:
+            return None
+
+        directory = self.directory or cache_directory()
+        if directory is None:
+            return None
+
+        # Files with the same name in different folders don't collide
+        path = Path(filename).resolve()
+        name = path.stem
+        if qualname:
+            name += f".{qualname}"
+        name += "." + hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+
+        return Path(directory) / f"{name}.layout-{FORMAT}.pickle"
+
+    @staticmethod
+    def _read(path: Path, digest: str) -> Optional[Layout]:
+        """Read and return the cached layout, if valid."""
+        try:
+            with path.open("rb") as file:
+                if file.readline().decode("ascii").strip() != digest:
+                    return None
+
+                layout = pickle.load(file)
+        except (OSError, EOFError, ValueError, AttributeError,
+                ImportError, pickle.UnpicklingError):
+            return None
+
+        if not isinstance(layout, Layout):
+            return None
+
+        return layout
+
+    @staticmethod
+    def _write(path: Path, digest: str, layout: Layout):
+        """Write the cached layout, ignoring errors."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as file:
+                file.write(f"{digest}\n".encode("ascii"))
+                pickle.dump(layout, file, pickle.HIGHEST_PROTOCOL)
+
+            # Remove the entries of older formats
+            prefix = path.name[:-len(f"{FORMAT}.pickle")]
+            for stale in path.parent.glob(f"{prefix}*.pickle"):
+                if stale != path:
+                    stale.unlink()
+        except OSError:
+            pass
+
+
+CACHE = LayoutCache()
@@ -1,13 +1,24 @@
 """Parent class of all window components in a layout stand-point."""
 
+from bui.layout.attr import AttrSchema
+
 NO_VALUE = object()
 
+# Frozen classes of components, with the component class as key
+_FROZEN = {}
+
 class Component:
 
     tag_name = "to set"
     attrs = ()
     must_have_data = False
     has_widget = True
+    frozen = False
+    schema = AttrSchema(())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.schema = AttrSchema(cls.attrs)
 
     def __init__(self, layout, parent):
         self.layout = layout
@@ -15,7 +26,6 @@ class Component:
         self.children = []
         self.id = ""
         self.data = ""
-        self.widget = None
 
     def __repr__(self):
         return f"<{self.tag_name.capitalize()}(attrs={len(self.attrs)}), has_data={bool(self.data)})>"
@@ -129,6 +139,23 @@ class Component:
         """Complete the widet, when all the layout has been set."""
         pass
 
+    def freeze(self):
+        """
+        Freeze the component, it cannot be modified afterward.
+
+        Frozen components are shared by all the windows created from
+        the same window class (see `bui.layout.leaf`).
+
+        """
+        Frozen = _FROZEN.get(type(self))
+        if Frozen is None:
+            Frozen = type(type(self).__name__, (FrozenComponent, type(self)),
+                    {"__module__": type(self).__module__})
+            _FROZEN[type(self)] = Frozen
+
+        self.children = tuple(self.children)
+        self.__class__ = Frozen
+
     @staticmethod
     def deduce_id(deduce_from: str) -> str:
         """
@@ -159,3 +186,17 @@ class Component:
                 break
 
         return identifier.strip("_")
+
+
+class FrozenComponent:
+
+    """Mixin of frozen components, whose attributes can't be modified."""
+
+    frozen = True
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"can't set {name!r} on {self!r}: "
+                "the component is frozen")
+
+    def freeze(self):
+        pass
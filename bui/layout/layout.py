@@ -6,9 +6,6 @@ and search for specific tags, or browse the list of nested components.
 
 """
 
-from itertools import count
-from queue import PriorityQueue
-
 class Layout:
 
     """Layout of a top-level component (like a Window).
@@ -16,13 +13,28 @@ class Layout:
     This class is created by the `BUILayoutParser`.  It contains a list of top-level components defined in the layout.  Each component can contain others, assuming this is logically supported in the component structure.  A `Layout` object can:
 
     - Be browsed (iterated over with a for loop).
-    - Search for a specific component using the `get` method.
+    - Search for a specific component using the `get` method, or
+      for a component with a given identifier using `get_id`.
     - Iterate over all nested components (see the `flat` property).
 
+    The flattened list of components, as well as the indexes by tag
+    name and identifier, are built once, the first time they are
+    needed.  Components should be added with the `add` method, which
+    keeps them up-to-date.  If components are modified in another way
+    (children added directly, identifiers changed), call `invalidate`.
+
+    Once complete, a layout can be frozen (see `freeze`) to be used
+    as a template by all the windows created from the same class.
+
     """
 
     def __init__(self):
         self.components = []
+        self._flat = None
+        self._tags = None
+        self._ids = None
+        self._positions = None
+        self.frozen = False
 
     def __repr__(self):
         return f"<Layout with <{'>, <'.join([component.tag_name for component in self.components])}>"
@@ -33,22 +45,87 @@ class Layout:
     def __iter__(self):
         return iter(self.components)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_flat"] = state["_tags"] = state["_ids"] = None
+        state["_positions"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name in ("_flat", "_tags", "_ids", "_positions"):
+            state.setdefault(name, None)
+        state.setdefault("frozen", False)
+        self.__dict__.update(state)
+
     @property
     def flat(self):
         """Return a flattened list of all components, including their children."""
-        counter = count(1)
-        components = PriorityQueue()
-        for component in self.components:
-            components.put((-1, next(counter), component))
+        if self._flat is None:
+            self._index()
 
-        flat = []
-        while not components.empty():
-            depth, _, component = components.get()
-            flat.append(component)
-            for child in component.children:
-                components.put((depth - 1, next(counter), child))
+        return self._flat
 
-        return flat
+    def add(self, component, parent=None):
+        """
+        Add a component in the layout.
+
+        Args:
+            component (Component): the component to add.
+            parent (Component, optional): the parent component, if any.
+                    If not set, the component is added as a
+                    top-level component.
+
+        Raises:
+            ValueError: the layout is frozen.
+
+        """
+        if self.frozen:
+            raise ValueError("this layout is frozen and cannot be modified")
+
+        if parent is None:
+            self.components.append(component)
+        else:
+            parent.children.append(component)
+
+        self.invalidate()
+
+    def freeze(self):
+        """
+        Freeze the layout and its components.
+
+        The layout should be complete.  Its components cannot be
+        modified or added anymore.  The flattened list and indexes
+        are built once and kept.
+
+        """
+        self.invalidate()
+        for component in self.flat:
+            component.freeze()
+        self.frozen = True
+
+    def invalidate(self):
+        """Forget the flattened list and indexes, they will be built again."""
+        if not self.frozen:
+            self._flat = self._tags = self._ids = self._positions = None
+
+    def position(self, component):
+        """
+        Return the position of a component in the flattened list.
+
+        Args:
+            component (Component): a component of this layout.
+
+        Raises:
+            ValueError: the component isn't in this layout.
+
+        """
+        if self._positions is None:
+            self._index()
+
+        try:
+            return self._positions[id(component)]
+        except KeyError:
+            raise ValueError(f"{component!r} isn't in this layout") from None
 
     def get(self, tag: str):
         """
@@ -62,8 +139,59 @@ class Layout:
         If more than one tag is present, returns the first.
 
         """
-        tags = self.flat
-        for match in tags:
-            if match.tag_name == tag:
-                return match
-                return match
+        if self._tags is None:
+            self._index()
+
+        matches = self._tags.get(tag)
+        return matches[0] if matches else None
+
+    def get_all(self, tag: str):
+        """
+        Return all the tags with the given name, in order.
+
+        Args:
+            tag (str): the tag name to search.
+
+        Returns:
+            tags (list): the list of matching components, possibly empty.
+
+        """
+        if self._tags is None:
+            self._index()
+
+        return list(self._tags.get(tag, ()))
+
+    def get_id(self, identifier: str):
+        """
+        Return the first component with this identifier, or None.
+
+        Args:
+            identifier (str): the component identifier.
+
+        """
+        if self._ids is None:
+            self._index()
+
+        return self._ids.get(identifier)
+
+    def _index(self):
+        """Build the flattened list and indexes in one traversal."""
+        flat = []
+        tags = {}
+        ids = {}
+        positions = {}
+        stack = list(reversed(self.components))
+        while stack:
+            component = stack.pop()
+            positions[id(component)] = len(flat)
+            flat.append(component)
+            tags.setdefault(component.tag_name, []).append(component)
+            identifier = getattr(component, "id", "")
+            if identifier:
+                ids.setdefault(identifier, component)
+            stack.extend(reversed(component.children))
+
+        self._flat = flat
+        self._tags = tags
+        self._ids = ids
+        self._positions = positions
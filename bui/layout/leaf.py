@@ -0,0 +1,129 @@
+"""Per-window leaves of a layout template.
+
+A parsed and completed [Layout](layout.md) is frozen and kept on the
+window class, as a template shared by every window (or dialog)
+created from this class.  Components of a template cannot be modified.
+
+Each window instance only creates a `LayoutInstance`, holding one
+lightweight `Leaf` per component.  A leaf gives access to the
+attributes of its component (`leaf.title`, `leaf.id`, `leaf.data`...)
+and stores the widget created for it in this window instance.
+
+"""
+
+class Leaf:
+
+    """
+    A component of a layout template, for a single window instance.
+
+    Attributes of the component can be read on the leaf directly.
+
+    Args:
+        component (Component): the component of the template.
+        parent (Leaf): the parent leaf, or `None`.
+
+    Attributes:
+        component (Component): the component of the template.
+        parent (Leaf): the parent leaf, or `None`.
+        children (list): the child leaves.
+        widget (Widget): the generic widget created for this leaf.
+
+    """
+
+    __slots__ = ("component", "parent", "children", "widget")
+
+    def __init__(self, component, parent=None):
+        self.component = component
+        self.parent = parent
+        self.children = []
+        self.widget = None
+
+    def __getattr__(self, name):
+        return getattr(self.component, name)
+
+    def __repr__(self):
+        return f"<Leaf of {self.component!r}>"
+
+    def __str__(self):
+        return str(self.component)
+
+
+class LayoutInstance:
+
+    """
+    The leaves of a layout template, for a single window instance.
+
+    It can be browsed like a `Layout`, but it returns leaves
+    instead of components.
+
+    Args:
+        template (Layout): the frozen layout template.
+
+    """
+
+    __slots__ = ("template", "components", "flat")
+
+    def __init__(self, template):
+        self.template = template
+        self.components = []
+        self.flat = []
+        parents = {}
+        for component in template.flat:
+            parent = component.parent
+            parent = parents[id(parent)] if parent is not None else None
+            leaf = Leaf(component, parent)
+            parents[id(component)] = leaf
+            self.flat.append(leaf)
+            if parent is None:
+                self.components.append(leaf)
+            else:
+                parent.children.append(leaf)
+
+    def __repr__(self):
+        return f"<LayoutInstance of {self.template!r}>"
+
+    def __str__(self):
+        return str(self.template)
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def get(self, tag: str):
+        """
+        Return the first leaf with the given tag name, or None.
+
+        Args:
+            tag (str): the tag name to search.
+
+        """
+        component = self.template.get(tag)
+        return self._leaf(component)
+
+    def get_all(self, tag: str):
+        """
+        Return all the leaves with the given tag name, in order.
+
+        Args:
+            tag (str): the tag name to search.
+
+        """
+        return [self._leaf(component)
+                for component in self.template.get_all(tag)]
+
+    def get_id(self, identifier: str):
+        """
+        Return the first leaf with this identifier, or None.
+
+        Args:
+            identifier (str): the leaf identifier.
+
+        """
+        component = self.template.get_id(identifier)
+        return self._leaf(component)
+
+    def _leaf(self, component):
+        """Return the leaf of a component, or None."""
+        if component is None:
+            return None
+
+        return self.flat[self.template.position(component)]
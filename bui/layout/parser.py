@@ -58,23 +58,25 @@ class BUILayoutParser(HTMLParser):
             raise ValueError(f"Error {self.pos}: unknown tag {name}")
 
         # Browse attributes
-        remaining = list(Tag.attrs)
-        values = {}
+        schema = Tag.schema
+        values = dict(schema.defaults)
+        given = set()
         for attr_name, value in attrs:
-            candidates = [attr for attr in remaining if attr.name == attr_name]
-            if not candidates:
+            attr = schema.by_name.get(attr_name)
+            if attr is None or attr_name in given:
                 raise ValueError(f"Error {self.pos}: tag {name}, unknown attribute {attr_name}")
 
-            attr = candidates[0]
+            given.add(attr_name)
             try:
                 value = attr.prepare(value)
             except ValueError as err:
                 raise ValueError(f"Error {self.pos}: attribute {attr.name}, {err}") from None
             else:
                 values[attr.python_name] = value
-                remaining.remove(attr)
 
-        for attr in remaining:
+        missing = [attr for attr in schema.required + schema.dynamic
+                if attr.name not in given]
+        for attr in missing:
             try:
                 value = attr.prepare()
             except ValueError as err:
@@ -84,14 +86,9 @@ class BUILayoutParser(HTMLParser):
 
         # If there's already one open component, add it to the element if possible
         Tag.can_be_inside(parent_types, self.current_component)
-        if self.current_component:
-            tag = Tag(self.layout, self.current_component, **values)
-            self.current_component.children.append(tag)
-            self.current_component = tag
-        else:
-            tag = Tag(self.layout, None, **values)
-            self.current_component = tag
-            self.layout.components.append(tag)
+        tag = Tag(self.layout, self.current_component, **values)
+        self.layout.add(tag, self.current_component)
+        self.current_component = tag
 
     def handle_endtag(self, tag):
         current = self.current_component
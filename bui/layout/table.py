@@ -82,6 +82,18 @@ class Table(Component):
     |              |          | default is 1, so a       |             |
     |              |          | widget will remain in    |             |
     |              |          | its `y` row.             |             |
+    | `virtual`    | No       | If present, the table    | `<table     |
+    |              |          | doesn't copy its rows:   | virtual>`   |
+    |              |          | the cells are read when  |             |
+    |              |          | they are displayed.      |             |
+    |              |          | Use it for tables with   |             |
+    |              |          | a lot of rows (see       |             |
+    |              |          | below).                  |             |
+    | `sort`       | No       | The column IDs keeping   | `<table     |
+    |              |          | the table sorted,        | sort=-date>`|
+    |              |          | separated by commas (see |             |
+    |              |          | [sorting                 |             |
+    |              |          | rows](#sorting-rows)).   |             |
 
     See also the [col](./col.md) tag to define the columns in a table.
     This tag will need more information.
@@ -130,9 +142,10 @@ class Table(Component):
     |                                   | rows](#removing-rows) for  |
     |                                   | more information.          |
     | `sort(key=None, reverse=False)`   | Sort the table according   |
-    |                                   | to the given key, or the   |
-    |                                   | first column if no key is  |
-    |                                   | given. See [sorting        |
+    |                                   | to the given key (a        |
+    |                                   | callable or column IDs),   |
+    |                                   | or the first column if no  |
+    |                                   | key is given. See [sorting |
     |                                   | rows](#sorting-rows) for   |
     |                                   | more information.          |
 
@@ -198,6 +211,12 @@ class Table(Component):
         )
         # However, this might not be as easy to read.
 
+    Changing a row (or a cell) in an asynchronous control or task
+    doesn't update the table right away: changed rows are displayed
+    together, at most 30 times a second (see the `update_rate` attribute
+    of the [Table widget](../../widget/Table.md), set it to 0 to display
+    every change immediately).  The row itself is changed immediately.
+
     ### Adding rows
 
     You also can use the `add_row` instance method on the
@@ -255,6 +274,34 @@ class Table(Component):
         table.sort(key=attrgetter("price"), reverse=True)
         # Sort with the more expensive objects above
 
+    The key can also be a column ID, or a sequence of column IDs to sort
+    on several columns.  A column ID starting with a minus sign is sorted
+    in descending order.  This is much faster than calling a key on every
+    row, which matters with thousands of rows:
+
+        table.sort(key="price", reverse=True)
+        # Sort by category, then with the more expensive objects above
+        table.sort(key=("category", "-price"))
+
+    A table can also be kept sorted, for instance a table of messages
+    sorted by date, receiving new messages.  Use the `sort` attribute
+    of the table, with the column IDs separated by commas:
+
+        <table x=0 y=0 id=messages sort=-date>
+          <col>Date</col>
+          <col>Message</col>
+        </table>
+
+    Or call `keep_sorted` on the table widget, with the same key
+    as `sort`:
+
+        table.keep_sorted("-date")
+
+    New rows are then placed in order, rather than at the bottom, and
+    a row moves when its sort key changes.  This is much faster than
+    sorting the table after adding each row.  Sorting the table in
+    another order with `sort` stops keeping the table sorted.
+
     > Note: this method will make sure the selection in the table is
       not affected.  If the user was on the "Apple", then she will be on
       the "Apple" after the call to `sort`, even though the "apple" might
@@ -277,6 +324,22 @@ class Table(Component):
         row = table[3]
         table.selected = row
 
+    ### Virtual tables
+
+    By default, every row is sent to the GUI toolkit when it is added,
+    which takes time (and memory) when a table has a lot of rows.  If you
+    expect thousands of rows, add the `virtual` attribute to the table:
+
+        <table x=0 y=0 id=logs virtual>
+          <col>Date</col>
+          <col>Message</col>
+        </table>
+
+    A virtual table works just like any other table.  Only the number of
+    rows is sent to the GUI toolkit, which asks for the text of a
+    cell when it needs to display it.  Adding a row, or setting
+    all of them with the `rows` property, is therefore much faster.
+
     ### Custom row class
 
     Sometimes, beyond the data we want to display in the table, we would
@@ -349,12 +412,19 @@ class Table(Component):
         Attr("id", help="The widget identifier"),
         Attr("width", help="The widget width", type=int, default=1),
         Attr("height", help="The widget height", type=int, default=1),
+        Attr("virtual", help="The table reads cells when displayed",
+                default=False, if_present=True),
+        Attr("sort", help="The columns keeping the table sorted",
+                default=""),
     )
 
-    def __init__(self, layout, parent, x, y, id, width=1, height=1):
+    def __init__(self, layout, parent, x, y, id, width=1, height=1,
+            virtual=False, sort=""):
         super().__init__(layout, parent)
         self.x = x
         self.y = y
         self.id = id
         self.width = width
         self.height = height
+        self.virtual = virtual
+        self.sort = sort
@@ -0,0 +1,111 @@
+"""Metrics to measure BUI's responsiveness.
+
+Some parts of BUI keep metrics, to understand where time is spent
+(for instance, how long the main thread waits for the asynchronous
+thread to decide whether a control is stopped).  These metrics are
+always kept, they're cheap, and can be displayed in an interactive
+session, or logged.
+
+"""
+
+from bisect import bisect_left
+from typing import Sequence
+
+# Default bucket boundaries, in seconds (from 10 us to 10 s)
+DEFAULT_BOUNDS = tuple(base * 10 ** exponent
+        for exponent in range(-5, 1) for base in (1, 2, 5)) + (10, )
+
+class Histogram:
+
+    """
+    Histogram of durations (or any positive value).
+
+    Values are counted in buckets, so that the memory used doesn't
+    grow with the number of values.  Percentiles are therefore
+    approximations: the upper bound of the bucket is returned.
+
+    Args:
+        bounds (sequence, optional): the upper bounds of the buckets,
+                in ascending order.  A last bucket is added for
+                greater values.
+
+    Attributes:
+        count (int): the number of values.
+        total (float): the sum of values.
+        maximum (float): the greatest value.
+        counts (list): the number of values in each bucket.
+
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def __repr__(self):
+        return (f"<Histogram count={self.count} mean={self.mean:.6f} "
+                f"p50={self.percentile(50):.6f} "
+                f"p99={self.percentile(99):.6f} max={self.maximum:.6f}>")
+
+    def __str__(self):
+        lines = []
+        lower = 0
+        for bound, count in zip(self.bounds + (float("inf"), ), self.counts):
+            if count:
+                lines.append(f"{lower:>8g} - {bound:<8g}: {count}")
+            lower = bound
+
+        return "\n".join(lines) or "empty"
+
+    @property
+    def mean(self) -> float:
+        """Return the mean value, or 0 if there's no value."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float):
+        """
+        Add a value in the histogram.
+
+        Args:
+            value (float): the value to add.
+
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the approximate percentile.
+
+        Args:
+            percent (float): the percentile, between 0 and 100.
+
+        Returns:
+            value (float): the upper bound of the bucket containing
+                    this percentile, or the maximum value if it's
+                    in the last bucket (or 0 if there's no value).
+
+        """
+        if not self.count:
+            return 0.0
+
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen > 0:
+                return min(bound, self.maximum)
+
+        return self.maximum
+
+    def clear(self):
+        """Remove all values."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
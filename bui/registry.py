@@ -0,0 +1,83 @@
+"""Registries of classes, imported when they're first needed.
+
+BUI knows its controls and layout tags by name, but importing all their
+modules takes time, which is wasted if the application doesn't create
+a window.  A `LazyRegistry` knows the names in advance, and only
+loads a value when it is first read.
+
+"""
+
+from collections.abc import MutableMapping
+from typing import Callable, Iterable, Optional
+
+class LazyRegistry(MutableMapping):
+
+    """
+    A dictionary whose values are loaded when first read.
+
+    Args:
+        names (iterable): the names known in advance, in order.
+        load (callable, optional): the function to load a value, it
+                receives the name and should either return the
+                value, or return `None` after registering it
+                (by setting it in the registry).
+
+    Values set directly (`registry[name] = value`) are used as is.
+
+    """
+
+    def __init__(self, names: Iterable[str] = (),
+            load: Optional[Callable] = None):
+        self._names = dict.fromkeys(names)
+        self._load = load
+        self._values = {}
+
+    def __repr__(self):
+        return f"<LazyRegistry of {list(self)}>"
+
+    def __getitem__(self, name):
+        value = self._values.get(name)
+        if value is None:
+            if self._load is None or name not in self._names:
+                raise KeyError(name)
+
+            value = self._load(name)
+            if value is None:
+                value = self._values[name]
+            else:
+                self._values[name] = value
+
+        return value
+
+    def __setitem__(self, name, value):
+        self._names.setdefault(name)
+        self._values[name] = value
+
+    def __delitem__(self, name):
+        del self._names[name]
+        self._values.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def get(self, name, default=None):
+        """Return the value of this name, loading it if needed, or default."""
+        value = self._values.get(name)
+        if value is None:
+            try:
+                value = self[name]
+            except KeyError:
+                return default
+
+        return value
+
+    @property
+    def loaded(self):
+        """Return the names of the values already loaded."""
+        return tuple(self._values)
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List
+from typing import List, Sequence, Tuple
 
 from bui.widget.table import AbcRow
 from bui.specific.base import *
@@ -11,12 +11,13 @@ class SpecificTable(SpecificWidget):
     widget_name = "table"
 
     @abstractmethod
-    def refresh(self, rows: List[AbcRow]):
+    def refresh(self, rows: Sequence[AbcRow]):
         """
         Refresh the table rows, using the specified row objects.
 
         Args:
-            rows (list of Row): list of row objects.
+            rows (sequence of Row): the row objects (usually the generic
+                    table itself, which creates them when needed).
 
         """
         pass
@@ -49,3 +50,98 @@ class SpecificTable(SpecificWidget):
 
         """
         pass
+
+    def get_item_text(self, item: int, col: int) -> str:
+        """
+        Return the text of a cell, read in the generic table.
+
+        Virtual tables don't keep their rows: the GUI toolkit asks
+        for the text of a cell when it needs to display it.
+
+        Args:
+            item (int): the row index.
+            col (int): the column index, hidden columns excluded.
+
+        Returns:
+            text (str): the cell text, empty if the cell doesn't
+                    exist (anymore).
+
+        """
+        generic = self.generic
+        try:
+            position = generic.factory._visible_positions[col]
+            with generic._lock:
+                # The rows can be changed in the asynchronous thread
+                value = generic._columns[position][item]
+        except IndexError:
+            return ""
+
+        return str(value)
+
+    def insert_rows(self, index: int, count: int):
+        """
+        Insert several rows, already in the generic table.
+
+        By default, the whole table is refreshed.  Specific widgets
+        should override this method to send all rows at once.
+
+        Args:
+            index (int): the index of the first inserted row.
+            count (int): the number of inserted rows.
+
+        """
+        self.refresh(self.generic)
+
+    def remove_rows(self, indexes: List[int]):
+        """
+        Remove several rows, already removed from the generic table.
+
+        By default, the whole table is refreshed.  Specific widgets
+        should override this method to remove all rows at once.
+
+        Args:
+            indexes (list of int): the indexes of the removed rows
+                    (before they were removed), in order.
+
+        """
+        self.refresh(self.generic)
+
+    def sort(self, order: List[int]):
+        """
+        Move the rows, already sorted in the generic table.
+
+        By default, the whole table is refreshed.  Specific widgets
+        should override this method to move all rows at once.
+
+        Args:
+            order (list of int): the former index of each row, in
+                    the new order.
+
+        """
+        self.refresh(self.generic)
+
+    def apply_edits(self, edits: List[Tuple[str, int, int]]):
+        """
+        Apply the edits computed when the rows were replaced.
+
+        The generic table already holds the new rows.  By default, the
+        edits are applied with `remove_rows`, `insert_rows` and
+        `update_row`.
+
+        Args:
+            edits (list): the `(operation, index, count)` tuples, see
+                    `bui.widget.table.diff_rows`.
+
+        """
+        removed = sorted(index for operation, first, count in edits
+                if operation == "delete"
+                for index in range(first, first + count))
+        if removed:
+            self.remove_rows(removed)
+
+        for operation, index, count in edits:
+            if operation == "insert":
+                self.insert_rows(index, count)
+            elif operation == "update":
+                for row in self.generic[index:index + count]:
+                    self.update_row(row)
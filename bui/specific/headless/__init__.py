@@ -0,0 +1,28 @@
+"""Headless specific window and graphical elements.
+
+This backend doesn't display anything: widgets keep their state in
+plain attributes and user events are synthesized with the `simulate_*`
+methods of specific widgets, which process controls immediately (or
+in a separate thread, see `thread.start_thread`).  It can be used
+to test or benchmark BUI applications without a display, and is
+selected with the `BUI_GUI` environment variable:
+
+    BUI_GUI=headless python app.py
+
+NEVER instanciate classes in this module directly.  Always use the `bui.Window` class.
+
+"""
+
+from bui.specific.headless.button import HeadlessButton as Button
+from bui.specific.headless.checkbox import HeadlessCheckbox as Checkbox
+from bui.specific.headless.context import HeadlessContext as Context
+from bui.specific.headless.dialog import HeadlessDialog as Dialog
+from bui.specific.headless.interactive import interact
+from bui.specific.headless.item import HeadlessItem as Item
+from bui.specific.headless.list import HeadlessList as List
+from bui.specific.headless.menu import HeadlessMenu as Menu
+from bui.specific.headless.menubar import HeadlessMenubar as Menubar
+from bui.specific.headless.radio import HeadlessRadioButton as RadioButton
+from bui.specific.headless.table import HeadlessTable as Table
+from bui.specific.headless.text import HeadlessText as Text
+from bui.specific.headless.window import HeadlessWindow as Window
@@ -0,0 +1,34 @@
+"""The headless implementation of a BUI button widget."""
+
+from bui.specific.base import *
+from bui.specific.base.button import SpecificButton
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessButton(HeadlessShared, SpecificButton):
+
+    @property
+    def name(self):
+        """Get the button name."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the button name."""
+        self._name = name
+
+    def enable(self):
+        """Force-enable the button."""
+        self.generic._enabled = True
+
+    def disable(self):
+        """Force-disable the button."""
+        self.generic._enabled = False
+
+    def _init(self):
+        """Initialize the specific widget."""
+        self._name = self.generic.name
+        self.parent.add_widget(self)
+
+    def simulate_click(self) -> bool:
+        """Simulate a click on the button, return False if stopped."""
+        return self.process_control(None, "click")
@@ -0,0 +1,50 @@
+"""The headless implementation of a BUI checkbox widget."""
+
+from bui.specific.base import *
+from bui.specific.base.checkbox import SpecificCheckbox
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessCheckbox(HeadlessShared, SpecificCheckbox):
+
+    @property
+    def name(self):
+        """Get the checkbox name."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the checkbox name."""
+        self._name = name
+
+    @property
+    def checked(self):
+        """Get the checkbox checked status."""
+        return self._checked
+
+    @checked.setter
+    def checked(self, checked):
+        """Set the checkbox checked status."""
+        self._checked = checked
+
+    def enable(self):
+        """Force-enable the checkbox."""
+        self.generic._enabled = True
+
+    def disable(self):
+        """Force-disable the checkbox."""
+        self.generic._enabled = False
+
+    def _init(self):
+        """Initialize the specific widget."""
+        self._name = self.generic.name
+        self._checked = self.generic.cached_checked
+        self.parent.add_widget(self)
+
+    def simulate_check(self) -> bool:
+        """Simulate a click on the checkbox, return False if stopped."""
+        self._checked = checked = not self._checked
+        state = 'checked' if checked else 'unchecked'
+        status = self.process_control(None, "check",
+                {'checked': checked, 'state': state})
+        self.generic.cached_checked = checked
+        return status
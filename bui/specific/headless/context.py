@@ -0,0 +1,8 @@
+"""The headless implementation of a BUI context menu widget."""
+
+from bui.specific.base import *
+from bui.specific.base.context import SpecificContext
+
+class HeadlessContext(SpecificContext):
+
+    pass
@@ -0,0 +1,14 @@
+"""The headless implementation of a BUI custom dialog box."""
+
+from bui.specific.base import *
+from bui.specific.base.dialog import SpecificDialog
+from bui.specific.headless.window import HeadlessWindow
+
+class HeadlessDialog(HeadlessWindow, SpecificDialog):
+
+    async def pop(self, **kwargs):
+        self.show()
+
+    def close(self):
+        self.closed = True
+        self.shown = False
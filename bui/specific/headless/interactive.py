@@ -0,0 +1,6 @@
+"""Interactive console, not supported without a GUI toolkit."""
+
+def interact():
+    """Refuse to create an interactive console."""
+    raise RuntimeError("the interactive console isn't supported "
+            "by the headless backend")
@@ -0,0 +1,11 @@
+"""The headless implementation of a BUI item widget."""
+
+from bui.specific.base import *
+from bui.specific.base.item import SpecificItem
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessItem(HeadlessShared, SpecificItem):
+
+    def simulate_click(self) -> bool:
+        """Simulate a click on the menu item, return False if stopped."""
+        return self.process_control(None, "click")
@@ -0,0 +1,77 @@
+"""The headless implementation of a BUI list widget."""
+
+from typing import Sequence, Union
+
+from bui.specific.base import *
+from bui.specific.base.list import SpecificList
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessList(HeadlessShared, SpecificList):
+
+    """Headless list widget."""
+
+    def _init(self):
+        self.choices = []
+        self.selected = (0, ) if self.generic.multisel else 0
+        self.refresh()
+        self.parent.add_widget(self)
+
+    def refresh(self):
+        """Refresh the list choices, using the generic widget."""
+        self.choices = list(self.generic._choices)
+        self.selected = (0, ) if self.generic.multisel else 0
+
+    def select(self, choice: Union[int, Sequence[int]]):
+        """Select the specific choice(s)."""
+        if not self.generic.multisel and isinstance(choice, tuple):
+            choice = choice[0]
+
+        self.selected = choice
+
+    def update_choice(self, pos: int, choice: str):
+        """
+        Update a specific choice.
+
+        Args:
+            pos (int): the choice position.
+            choice (str): the choice label to use.
+
+        """
+        self.refresh()
+
+    def remove_choice(self, pos: int):
+        """
+        Remove the specified choice.
+
+        Args:
+            pos (int): the choice position.
+
+        """
+        self.refresh()
+
+    def simulate_select(self, *indexes: int) -> bool:
+        """
+        Simulate the user selecting choices.
+
+        Args:
+            indexes (int): the positions of the selected choices,
+                    only one for a single-selection list.
+
+        Returns:
+            status (bool): `False` if the select control was stopped,
+                    in which case the former selection is restored.
+
+        """
+        selected = tuple(self.generic._pos[index] for index in indexes)
+        if not self.generic.multisel:
+            selected = selected[0] if selected else None
+
+        old_selected = self.selected
+        self.selected = indexes if self.generic.multisel else indexes[0]
+        status = self.process_control(None, "select", {"selected": selected})
+        if status:
+            self.generic.selected = selected
+        else:
+            self.select(old_selected)
+
+        return status
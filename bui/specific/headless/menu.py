@@ -0,0 +1,9 @@
+"""The headless implementation of a BUI menu widget."""
+
+from bui.specific.base import *
+from bui.specific.base.menu import SpecificMenu
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessMenu(HeadlessShared, SpecificMenu):
+
+    pass
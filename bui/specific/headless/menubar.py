@@ -0,0 +1,9 @@
+"""The headless implementation of a BUI menubar widget."""
+
+from bui.specific.base import *
+from bui.specific.base.menubar import SpecificMenubar
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessMenubar(HeadlessShared, SpecificMenubar):
+
+    pass
@@ -0,0 +1,24 @@
+"""The headless implementation of a BUI radio button group widget."""
+
+from bui.specific.base import *
+from bui.specific.base.radio import SpecificRadioButton
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessRadioButton(HeadlessShared, SpecificRadioButton):
+
+    """Headless radio button widget."""
+
+    def _init(self):
+        self.refresh()
+        self.parent.add_widget(self)
+
+    def refresh(self):
+        """Refresh the available choices."""
+        self.choices = [label for _, label in self.generic.choices]
+
+    def simulate_select(self, index: int):
+        """Simulate the selection of a choice."""
+        if not 0 <= index < len(self.choices):
+            raise IndexError(f"{index!r} isn't a valid choice indice")
+
+        self.generic._selected = index
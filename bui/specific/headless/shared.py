@@ -0,0 +1,123 @@
+"""Contain the HeadlessShared class."""
+
+import threading
+
+from bui.control.base import NOT_SET
+from bui.control.exceptions import StopControl
+from bui.specific.headless import thread
+
+class HeadlessShared:
+
+    """
+    Mixin to share headless behavior, to be expected on all BUI widgets.
+
+    Controls are processed immediately, in the calling thread, unless
+    the headless thread is started (see `thread.start_thread`).  Events
+    can be synthesized with the `simulate_*` methods, which fire the
+    same controls, with the same options, as a GUI toolkit would.
+
+    """
+
+    def process_control(self, e, control, options=None, close=False,
+            has_next=False):
+        """
+        Process the control.
+
+        Args:
+            e (None): the toolkit event, unused.
+            control (str): the control name to call.
+            options (optional, dict): the control options.
+            close (bool): if set to True, terminate the loop.
+            has_next (bool): unused.
+
+        If the generic widget is not subscribed to this control,
+        look for the parent widget and so on.
+
+        Returns:
+            status (bool): `False` if the control was stopped,
+                    `True` otherwise.
+
+        """
+        options = options or {}
+        if not close and control not in self.generic.handled:
+            self.control_skipped(control, options)
+            return True
+
+        running = thread.HEADLESS_THREAD
+        if running is not None and threading.current_thread() is not running:
+            return running.send(self.process_control_in_thread, control,
+                    options)
+
+        return self.process_control_in_thread(control, options)
+
+    def process_control_in_thread(self, control, options):
+        """
+        Process the control, in the thread processing controls.
+
+        Args:
+            control (str): the control name to call.
+            options (dict): the control options.
+
+        Returns:
+            status (bool): `False` if the control was stopped,
+                    `True` otherwise.
+
+        """
+        widget = self
+        while widget:
+            try:
+                result = widget.generic._process_control(control, options)
+            except StopControl:
+                return False
+
+            if result is NOT_SET:
+                widget = widget.parent
+            else:
+                break
+
+        return True
+
+    def control_skipped(self, control, options):
+        """
+        A control was skipped, since nothing handles it.
+
+        Override this method to update the widget state, as if
+        the control had been processed.
+
+        Args:
+            control (str): the control name.
+            options (dict): the control options.
+
+        """
+        pass
+
+    def simulate_press(self, key: str, ctrl: bool = False,
+            alt: bool = False, shift: bool = False) -> bool:
+        """
+        Simulate a key pressed and released on this widget.
+
+        The press, type (for a single character) and release
+        controls are fired, in this order.
+
+        Args:
+            key (str): the key name, like "a" or "return".
+            ctrl (bool, optional): is the Ctrl modifier pressed?
+            alt (bool, optional): is the Alt modifier pressed?
+            shift (bool, optional): is the Shift modifier pressed?
+
+        Returns:
+            status (bool): `False` if the press control was stopped.
+
+        """
+        kwargs = {"raw_key": key, "ctrl": ctrl, "alt": alt, "shift": shift}
+        modified = "_".join(name for on, name in ((ctrl, "ctrl"),
+                (alt, "alt"), (shift, "shift")) if on)
+        kwargs["key"] = f"{modified}_{key}" if modified else key
+
+        status = self.process_control(None, "press", dict(kwargs))
+        if status and len(key) == 1:
+            unicode = key.upper() if shift else key
+            self.process_control(None, "type", {"unicode": unicode})
+
+        self.process_control(None, "release", dict(kwargs))
+        return status
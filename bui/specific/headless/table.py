@@ -0,0 +1,142 @@
+"""The headless implementation of a BUI table widget."""
+
+from typing import List, Sequence
+
+from bui.specific.base import *
+from bui.specific.base.table import SpecificTable
+from bui.specific.headless.shared import HeadlessShared
+from bui.widget.table import AbcRow, permutation
+
+class HeadlessTable(HeadlessShared, SpecificTable):
+
+    """
+    Headless table widget.
+
+    Attributes:
+        cells (list): the displayed rows, each of them a list of
+                visible cells, converted to `str`.  A virtual table
+                doesn't keep its cells (`cells` is `None`), use
+                `get_item_text` instead.
+        count (int): the number of displayed rows.
+        selected (int): the selected row, -1 if none.
+
+    """
+
+    def _init(self):
+        self.cells = None if self.generic.virtual else []
+        self.count = 0
+        self.selected = -1
+        self.parent.add_widget(self)
+
+    def update_row(self, row: AbcRow):
+        """
+        Update a specific row.
+
+        Args:
+            row (Row): the row to update.
+
+        """
+        index = row._index
+        if self.cells is None:
+            self.count = len(self.generic)
+        elif index == self.count:
+            self.cells.append([str(cell) for cell in row._visible])
+            self.count += 1
+        else:
+            self.cells[index] = [str(cell) for cell in row._visible]
+
+        if self.count and self.selected < 0:
+            self.selected = 0
+
+    def refresh(self, rows: Sequence[AbcRow]):
+        """
+        Refresh the entire table.
+
+        Args:
+            rows (sequence of Row): the collection of rows to update.
+
+        """
+        if self.cells is not None:
+            for row in rows:
+                self.update_row(row)
+            del self.cells[len(self.generic):]
+        self.count = len(self.generic)
+
+        # Select the first item if nothing is selected
+        if self.count and self.selected < 0:
+            self.selected = 0
+
+    def remove_row(self, row: AbcRow):
+        """
+        Remove the specified row.
+
+        Args:
+            row (Row): the row to remove.
+
+        """
+        if self.cells is not None:
+            del self.cells[row._index]
+        self.count -= 1
+        self.selected = min(row._index, self.count - 1)
+
+    def insert_rows(self, index: int, count: int):
+        """
+        Insert several rows, already in the generic table.
+
+        Args:
+            index (int): the index of the first inserted row.
+            count (int): the number of inserted rows.
+
+        """
+        if self.cells is not None:
+            self.cells[index:index] = [[str(cell) for cell in row._visible]
+                    for row in self.generic[index:index + count]]
+        self.count += count
+        self.selected = self.generic._selected
+
+    def remove_rows(self, indexes: List[int]):
+        """
+        Remove several rows, already removed from the generic table.
+
+        Args:
+            indexes (list of int): the indexes of the removed rows.
+
+        """
+        if self.cells is not None:
+            removed = set(indexes)
+            self.cells = [cells for index, cells in enumerate(self.cells)
+                    if index not in removed]
+        self.count -= len(indexes)
+        self.selected = self.generic._selected if self.count else -1
+
+    def select_row(self, row: int):
+        """Select the specified row."""
+        self.selected = row
+
+    def sort(self, order: List[int]):
+        """Move the rows, already sorted in the generic table."""
+        if self.cells is not None:
+            self.cells = permutation(order)(self.cells)
+
+    def simulate_select(self, index: int) -> bool:
+        """
+        Simulate the user selecting a row.
+
+        Args:
+            index (int): the row index.
+
+        Returns:
+            status (bool): `False` if the select control was stopped,
+                    in which case the former selection is restored.
+
+        """
+        row = self.generic[index]
+        old_selected = self.selected
+        self.selected = index
+        status = self.process_control(None, "select", {"selected": row})
+        if status:
+            self.generic._selected = index
+        else:
+            self.selected = old_selected
+
+        return status
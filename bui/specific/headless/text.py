@@ -0,0 +1,102 @@
+"""The headless implementation of a BUI text widget."""
+
+from bui.specific.base import *
+from bui.specific.base.text import SpecificText
+from bui.specific.headless.shared import HeadlessShared
+
+class HeadlessText(HeadlessShared, SpecificText):
+
+    @property
+    def label(self):
+        """Get the text label."""
+        return self._label
+
+    @label.setter
+    def label(self, label):
+        """Set the text label."""
+        self._label = label
+
+    @property
+    def value(self):
+        """Get the text value."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """Set the text value."""
+        self._value = value
+
+    @property
+    def enabled(self):
+        """Return whether the text is enabled or not."""
+        return self._enabled
+
+    @property
+    def hidden(self):
+        """Return whether the text is hidden or not."""
+        return self.generic._hidden
+
+    def enable(self):
+        """Force-enable the text."""
+        self._enabled = True
+
+    def disable(self):
+        """Force-disable the text."""
+        self._enabled = False
+
+    def _init(self):
+        """Initialize the specific widget."""
+        self._label = self.generic.label
+        self._value = self.generic.value
+        self._enabled = True
+        self.parent.add_widget(self)
+
+    def move(self, position: int):
+        """Move the cursor to the given position.
+
+        Args:
+            position (int): the cursor position.
+
+        """
+        text = self._value
+        position = max(0, min(position, len(text)))
+        before = text[:position]
+        cursor = self.generic.cursor
+        cursor._pos = position
+        cursor._lineno = before.count("\n")
+        cursor._col = len(before) - (before.rfind("\n") + 1)
+
+    def vertical_move(self, lineno: int, col: int):
+        """
+        Move the cursor to the given vertiical position.
+
+        Args:
+            lineno (int): the line number.
+            col (int): the column.
+
+        """
+        position = 0
+        for i, line in enumerate(self._value.split("\n")):
+            if i == lineno:
+                self.move(position + min(col, len(line)))
+                break
+
+            position += len(line) + 1
+        else:
+            self.move(len(self._value))
+
+    def simulate_change(self, text: str):
+        """
+        Simulate the user changing the text value.
+
+        The change control is fired and the cursor is moved at
+        the end of the text.
+
+        Args:
+            text (str): the new text value.
+
+        """
+        self._value = text
+        self.process_control(None, "change", {"text": text})
+        self.generic.cached_value = text
+        self.move(len(text))
@@ -0,0 +1,118 @@
+"""Optional asynchronous thread of the headless backend.
+
+By default, the headless backend processes controls immediately, in
+the calling thread.  Once started (see `start_thread`), controls fired
+from another thread take the path they take with wxPython: they are
+put in the asyncio queue of a separate thread, which processes them
+and answers through a `VetoChannel`, the calling thread waiting for
+the answer.  This is meant to test or benchmark this bridge without
+a display.
+
+"""
+
+import asyncio
+from itertools import count
+import threading
+from typing import Any, Callable
+
+from bui.specific.vetoes import VetoChannel
+
+EVENT_COUNTER = count()
+
+# The running thread, if any (see `start_thread`)
+HEADLESS_THREAD = None
+
+class HeadlessThread(threading.Thread):
+
+    """
+    Thread running an asyncio event loop, processing controls.
+
+    Attributes:
+        loop (AbstractEventLoop): the asyncio event loop of the thread.
+        in_queue (Queue): the controls to process.
+        vetoes (VetoChannel): the answers of processed controls.
+
+    """
+
+    def __init__(self):
+        super().__init__(name="headless", daemon=True)
+        self.loop = None
+        self.in_queue = None
+        self.vetoes = VetoChannel()
+        self._ready = threading.Event()
+
+    def run(self):
+        """Run the event loop, until `stop` is called."""
+        asyncio.run(self.main_loop())
+
+    async def main_loop(self):
+        """Process the queued controls."""
+        self.loop = asyncio.get_running_loop()
+        self.in_queue = asyncio.Queue()
+        self._ready.set()
+        while True:
+            event, callable, args = await self.in_queue.get()
+            if event is None:
+                break
+
+            self.vetoes.answer(event, callable(*args))
+
+    def send(self, callable: Callable[..., bool], *args: Any) -> bool:
+        """
+        Call in the thread and wait for the answer.
+
+        Args:
+            callable (callable): the function to call in the thread,
+                    returning `False` if the control was stopped.
+            args: the positional arguments of the function.
+
+        Returns:
+            status (bool): the answer, `True` if it wasn't received
+                    before the deadline (see `VetoChannel.wait`).
+
+        """
+        if self.vetoes.closed:
+            return True
+
+        event = next(EVENT_COUNTER)
+        self.vetoes.expect(event)
+        self.loop.call_soon_threadsafe(self.in_queue.put_nowait,
+                (event, callable, args))
+        return self.vetoes.wait(event)
+
+    def stop(self):
+        """Stop the thread, once the queued controls are processed."""
+        self.loop.call_soon_threadsafe(self.in_queue.put_nowait,
+                (None, None, ()))
+        self.join()
+        self.vetoes.close()
+
+
+def start_thread() -> HeadlessThread:
+    """
+    Start processing controls in a separate thread.
+
+    Returns:
+        thread (HeadlessThread): the started thread, ready to
+                process controls.
+
+    Raises:
+        RuntimeError: a thread is already running.
+
+    """
+    global HEADLESS_THREAD
+    if HEADLESS_THREAD is not None:
+        raise RuntimeError("the headless thread is already running")
+
+    thread = HeadlessThread()
+    thread.start()
+    thread._ready.wait()
+    HEADLESS_THREAD = thread
+    return thread
+
+def stop_thread():
+    """Stop the thread, controls are processed immediately again."""
+    global HEADLESS_THREAD
+    thread, HEADLESS_THREAD = HEADLESS_THREAD, None
+    if thread is not None:
+        thread.stop()
@@ -0,0 +1,158 @@
+"""The headless implementation of a BUI window.
+
+A headless window isn't displayed: its state (title, widgets,
+popped alerts and dialogs) is kept in plain attributes.  Alerts and
+dialogs don't wait for the user: they use the answers added in
+`answers`, in order.
+
+"""
+
+import asyncio
+from collections import deque
+from typing import Dict, Union
+
+from bui.specific.base import *
+from bui.specific.base.window import SpecificWindow
+from bui.specific.headless.shared import HeadlessShared
+
+# The usable surface of the fake screen, in pixels
+SCREEN = (1920, 1040)
+
+class HeadlessWindow(HeadlessShared, SpecificWindow):
+
+    """
+    Headless window.
+
+    Attributes:
+        widgets (list): the specific widgets added on this window.
+        shown (bool): is the window shown?
+        closed (bool): is the window closed?
+        answers (deque): the scripted answers for alerts and dialogs.
+                An answer for an alert is the clicked button (like
+                "ok").  An answer for a dialog is a callable, called
+                with the dialog before it is returned.  If no answer
+                is available, the alert returns the default button
+                and the dialog is returned as is.
+        alerts (list): the popped alerts, as (title, message, danger,
+                buttons, default, answer) tuples.
+        dialogs (list): the popped dialogs.
+        menus (list): the popped context menus.
+        windows (list): the opened windows.
+
+    """
+
+    def __init__(self, generic):
+        super().__init__(generic)
+        self._title = ""
+        self.widgets = []
+        self.shown = False
+        self.closed = False
+        self.answers = deque()
+        self.alerts = []
+        self.dialogs = []
+        self.menus = []
+        self.windows = []
+        self._closed = None
+
+    @property
+    def usable_surface(self):
+        return Rectangle((0, 0), SCREEN)
+
+    @property
+    def title(self):
+        """Return the current title."""
+        return self._title
+
+    @title.setter
+    def title(self, new_title):
+        """Set the window's title."""
+        self._title = new_title
+
+    def add_widget(self, widget: SpecificWidget):
+        """
+        Add a widget on the window.
+
+        Args:
+            widget (SpecificWidget): the specific widget to add.
+
+        """
+        self.widgets.append(widget)
+
+    def show(self):
+        """Show the window."""
+        self.shown = True
+
+    async def _start(self, loop):
+        """
+        Start the window, wait until it is closed.
+
+        Args:
+            loop (AsyncLoop): the asynchronous event loop (see asyncio).
+
+        """
+        self._closed = asyncio.Event()
+        if self.closed:
+            self._closed.set()
+
+        await self._closed.wait()
+
+    def close(self):
+        """Close this window, terminate loop if appropriate."""
+        if self.closed:
+            return
+
+        self.closed = True
+        self.shown = False
+        parent = self.generic._bui_parent
+        if parent is not None:
+            parent.specific.show()
+
+        if self._closed is not None:
+            self._closed.set()
+
+    async def pop_dialog(self, dialog: SpecificWidget, **kwargs):
+        """Pop up a dialog."""
+        dialog = dialog.parse_layout(dialog, tag_name="dialog", **kwargs)
+        self.dialogs.append(dialog)
+        dialog.specific.show()
+        if self.answers:
+            self.answers.popleft()(dialog)
+
+        dialog.specific.close()
+        return dialog
+
+    def pop_menu(self, context: SpecificWidget):
+        """Pop a context menu."""
+        self.menus.append(context)
+
+    async def pop_alert(self, title: str, message: str,
+            danger: str, buttons: Dict[str, Union[bool, str]],
+            default: str):
+        """
+        Display an alert message.
+
+        Args:
+            title (str): the alert title.
+            message (str): the alert message.
+            danger (str): the alert danger (dialog type).
+            buttons (dict): the buttons of this dialog.
+            default (str): the default button for this dialog.
+
+        Returns:
+            answer (str): the first scripted answer, or the default
+                    button if there is none.
+
+        """
+        answer = self.answers.popleft() if self.answers else default
+        self.alerts.append((title, message, danger, buttons, default,
+                answer))
+        return answer
+
+    def open_window(self, window, child):
+        """Open another window."""
+        window = window.parse_layout(window)
+        self.windows.append(window)
+        if child:
+            self.shown = False
+
+        window.specific.show()
@@ -0,0 +1,134 @@
+"""Helpers to run the asyncio event loop inside a GUI event loop.
+
+In single-thread mode (see `bui.start`), the asyncio event loop and the
+GUI event loop take turns in the main thread.  The GUI event loop
+should block while there is nothing to do, but not longer than
+asyncio allows: `next_timeout` returns how long the GUI event loop
+can wait before an asyncio callback or timer is due.  Callbacks sent
+from other threads should interrupt this wait: `wake_on_threadsafe`
+makes `call_soon_threadsafe` wake up the GUI event loop.
+`run_event_loops` alternates both event loops, using these helpers.
+
+"""
+
+import asyncio
+from collections import deque
+from math import ceil
+from typing import Callable
+
+# Time to wait (in milliseconds) when the loop can't be inspected
+FALLBACK_TIMEOUT = 10
+
+# Maximum time to wait for a GUI event (in milliseconds).  Timers and
+# callbacks from other threads wake up the GUI event loop on time,
+# but asyncio only checks its sockets and pipes when it has the hand,
+# so this is the latency of asyncio I/O in an idle window.  Waking up
+# 20 times a second costs less than 1% of CPU (see
+# benchmarks/idle_cpu.py).
+MAXIMUM_TIMEOUT = 50
+
+def next_timeout(loop, maximum: int) -> int:
+    """
+    Return how long the GUI event loop can wait, in milliseconds.
+
+    Args:
+        loop (AbstractEventLoop): the asyncio event loop.
+        maximum (int): the maximum time to wait, in milliseconds.
+                asyncio doesn't check its sockets while the GUI
+                event loop waits, so this should stay reasonably low.
+
+    Returns:
+        timeout (int): 0 if asyncio callbacks are ready, the time
+                before the next asyncio timer otherwise (capped by
+                `maximum`).  If the loop doesn't expose its
+                callbacks and timers (they are not part of asyncio's
+                public API, and other loops like uvloop don't have
+                them), return `FALLBACK_TIMEOUT` (capped by `maximum`).
+
+    """
+    ready = getattr(loop, "_ready", None)
+    scheduled = getattr(loop, "_scheduled", None)
+    if not isinstance(ready, deque) or not isinstance(scheduled, list):
+        return min(maximum, FALLBACK_TIMEOUT)
+
+    if ready:
+        return 0
+
+    if not scheduled:
+        return maximum
+
+    delay = scheduled[0].when() - loop.time()
+    if delay <= 0:
+        return 0
+
+    return min(maximum, ceil(delay * 1000))
+
+def wake_on_threadsafe(loop, wake: Callable) -> Callable:
+    """
+    Wake up the GUI event loop when a callback comes from another thread.
+
+    Args:
+        loop (AbstractEventLoop): the asyncio event loop.
+        wake (callable): the function to wake up the GUI event loop
+                (like `wx.WakeUpIdle`), it should be thread-safe.
+
+    Returns:
+        restore (callable): a function to restore the loop's
+                `call_soon_threadsafe` method.
+
+    """
+    call_soon_threadsafe = loop.call_soon_threadsafe
+
+    def wrapper(callback, *args, **kwargs):
+        handle = call_soon_threadsafe(callback, *args, **kwargs)
+        wake()
+        return handle
+
+    def restore():
+        if loop.__dict__.get("call_soon_threadsafe") is wrapper:
+            del loop.call_soon_threadsafe
+
+    loop.call_soon_threadsafe = wrapper
+    return restore
+
+async def run_event_loops(loop, gui, running: Callable[[], bool],
+        maximum: int = MAXIMUM_TIMEOUT):
+    """
+    Alternate the GUI and asyncio event loops in the current thread.
+
+    The GUI event loop blocks until a GUI event arrives, an asyncio
+    callback or timer is due, or a callback is sent to asyncio from
+    another thread.  An idle window therefore doesn't use the CPU.
+
+    Args:
+        loop (AbstractEventLoop): the asyncio event loop, running
+                this coroutine.
+        gui: the GUI event loop, with the following methods:
+                `pending()` (are GUI events pending?), `dispatch()`
+                (dispatch a pending event), `dispatch_timeout(timeout)`
+                (wait for an event and dispatch it, the timeout being
+                in milliseconds), `process_idle()` (process pending
+                and idle events) and `wake_up()` (interrupt
+                `dispatch_timeout`, from any thread).
+        running (callable): return whether to keep on running.
+        maximum (int, optional): the maximum time to wait for a GUI
+                event, in milliseconds.
+
+    """
+    restore = wake_on_threadsafe(loop, gui.wake_up)
+    try:
+        while running():
+            # Wait for a GUI event, but only until asyncio
+            # has something to do
+            timeout = next_timeout(loop, maximum)
+            if not gui.pending() and timeout > 0:
+                gui.dispatch_timeout(timeout)
+
+            while gui.pending():
+                gui.dispatch()
+
+            # Run the ready asynchronous callbacks
+            await asyncio.sleep(0)
+            gui.process_idle()
+    finally:
+        restore()
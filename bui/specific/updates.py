@@ -0,0 +1,166 @@
+"""Queue of updates to perform in the main thread, in batches.
+
+Most GUI toolkits only allow to modify widgets in the main thread,
+while BUI controls run in an asynchronous thread.  Updates (setting a
+label, adding a row in a table, selecting an item...) are therefore
+sent to the main thread.  Sending each update as a separate event is
+expensive when there are many of them (refreshing a table with hundreds
+of cells, for instance).
+
+The `UpdateQueue` collects updates and wakes up the main thread only
+once for all the pending updates, which are then performed in a batch
+(the toolkit can freeze the windows during the batch, so they're only
+drawn once).  Updates to the same target can be coalesced: only the
+last update is performed.
+
+"""
+
+from collections import deque
+from itertools import count
+import threading
+from time import perf_counter
+from typing import Callable, Hashable, Optional
+
+from logbook import Logger
+
+from bui.metrics import Histogram
+
+logger = Logger("bui.updates")
+
+# Upper bounds of the buckets for batch sizes
+SIZE_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+class UpdateQueue:
+
+    """
+    Queue of updates to perform in the main thread.
+
+    Args:
+        wake (callable): the function to call to wake up the main
+                thread, it will receive the `drain` method as argument
+                (like `wx.CallAfter`).
+        freeze (callable, optional): a function called in the main
+                thread before a batch of updates, to freeze windows.
+                Its return value is sent to `thaw`.
+        thaw (callable, optional): a function called in the main
+                thread after a batch of updates, to thaw windows.
+
+    Attributes:
+        drain_time (Histogram): the time spent performing batches.
+        batch_size (Histogram): the number of updates in each batch.
+        max_depth (int): the maximum number of pending updates.
+        coalesced (int): the number of updates replaced by a later one.
+
+    """
+
+    def __init__(self, wake: Callable, freeze: Optional[Callable] = None,
+            thaw: Optional[Callable] = None):
+        self.wake = wake
+        self.freeze = freeze
+        self.thaw = thaw
+        self.drain_time = Histogram()
+        self.batch_size = Histogram(SIZE_BOUNDS)
+        self.max_depth = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._updates = deque()
+        self._keyed = {}
+        self._scheduled = False
+
+    @property
+    def depth(self) -> int:
+        """Return the number of pending updates."""
+        return len(self._updates)
+
+    def post(self, callback: Callable, args=(), kwargs=None,
+            key: Optional[Hashable] = None, batch: bool = True):
+        """
+        Post an update, to be performed in the main thread.
+
+        Args:
+            callback (callable): the function to call.
+            args (tuple, optional): the positional arguments.
+            kwargs (dict, optional): the keyword arguments.
+            key (hashable, optional): the update key.  If a pending
+                    update has the same key, it is replaced by this
+                    one (it keeps its place in the queue).  Updates
+                    without a key act as barriers: a keyed update
+                    never replaces an update posted before a barrier.
+            batch (bool, optional): if `False`, windows are thawed
+                    before performing this update.  This is necessary
+                    for updates which can block, like modal dialogs.
+
+        """
+        update = [callback, args, kwargs or {}, batch, key]
+        with self._lock:
+            if key is None:
+                self._keyed.clear()
+                self._updates.append(update)
+            else:
+                pending = self._keyed.get(key)
+                if pending is None:
+                    self._keyed[key] = update
+                    self._updates.append(update)
+                else:
+                    pending[:] = update
+                    self.coalesced += 1
+
+            depth = len(self._updates)
+            if depth > self.max_depth:
+                self.max_depth = depth
+
+            wake = not self._scheduled
+            self._scheduled = True
+
+        if wake:
+            self.wake(self.drain)
+
+    def drain(self):
+        """
+        Perform all pending updates, in the main thread.
+
+        Updates are taken from the queue one at a time.  So if an update
+        runs a nested event loop (like a modal dialog) which drains the
+        queue again, the nested drain performs the older updates first
+        and the order of updates is kept.  Updates posted during the
+        drain are left to the next one.
+
+        """
+        with self._lock:
+            remaining = len(self._updates)
+            self._scheduled = False
+
+        if not remaining:
+            return
+
+        begin = perf_counter()
+        performed = 0
+        frozen = None
+        try:
+            while performed < remaining:
+                with self._lock:
+                    if not self._updates:
+                        break
+
+                    update = self._updates.popleft()
+                    callback, args, kwargs, batch, key = update
+                    if key is not None and self._keyed.get(key) is update:
+                        del self._keyed[key]
+
+                performed += 1
+                if batch and frozen is None and self.freeze:
+                    frozen = self.freeze()
+                elif not batch and frozen is not None:
+                    self.thaw(frozen)
+                    frozen = None
+
+                try:
+                    callback(*args, **kwargs)
+                except Exception:
+                    logger.exception(f"Error while calling {callback!r}")
+        finally:
+            if frozen is not None:
+                self.thaw(frozen)
+
+        self.drain_time.add(perf_counter() - begin)
+        self.batch_size.add(performed)
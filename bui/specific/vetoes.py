@@ -0,0 +1,146 @@
+"""Channel to know whether controls, processed in another thread, were stopped.
+
+Toolkits which process controls in an asynchronous thread (like
+wxPython) need the answer in the main thread, to decide whether to
+perform the default action of an event.  The `VetoChannel` is
+independent of the GUI toolkit.
+
+"""
+
+import threading
+from time import perf_counter
+
+from logbook import Logger
+
+from bui.metrics import Histogram
+
+logger = Logger("bui.vetoes")
+
+class VetoChannel:
+
+    """
+    Answers of the asynchronous thread, to know if controls were stopped.
+
+    When a wx event fires a control, the main thread must know whether
+    the control was stopped, to decide whether to skip the event (let
+    wx perform the default action).  The control is processed in the
+    asynchronous thread, which answers through this channel.  Each
+    answer is identified by the event number, so several events can
+    be in flight at once.
+
+    The main thread only waits until the deadline: if the control
+    hasn't been processed by then, the default action is performed.
+    A control stopped after its deadline is reported as a late veto.
+
+    Args:
+        deadline (float, optional): the maximum time to wait for an
+                answer, in seconds.
+
+    Attributes:
+        deadline (float): the maximum time to wait for an answer.
+        latency (Histogram): the time waited for the answers.
+        timeouts (int): the number of answers not received in time.
+        late_vetoes (int): the number of controls stopped too late.
+        closed (bool): whether the channel is closed (the window
+                is closed, events aren't sent anymore).
+
+    """
+
+    def __init__(self, deadline: float = 0.25):
+        self.deadline = deadline
+        self.latency = Histogram()
+        self.timeouts = 0
+        self.late_vetoes = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def expect(self, event: int):
+        """
+        Expect an answer for this event.
+
+        This should be called before sending the event to the
+        asynchronous thread, so that its answer isn't lost.
+
+        Args:
+            event (int): the event number.
+
+        """
+        with self._lock:
+            self._pending[event] = [threading.Event(), True]
+
+    def answer(self, event: int, status: bool):
+        """
+        Answer for an event, from the asynchronous thread.
+
+        The answer is only recorded here: the main thread removes
+        the event when it has received the answer (see `wait`).  If the
+        main thread has stopped waiting, a stopped control is reported
+        as a late veto.
+
+        Args:
+            event (int): the event number.
+            status (bool): `False` if the control was stopped,
+                    `True` otherwise.
+
+        """
+        with self._lock:
+            pending = self._pending.get(event)
+            if pending is not None:
+                pending[1] = status
+                pending[0].set()
+                return
+
+        if not status:
+            self.late_vetoes += 1
+            logger.warning(f"The control of event {event} was stopped "
+                    "after its deadline, the default action was "
+                    "performed nonetheless")
+
+    def wait(self, event: int) -> bool:
+        """
+        Wait for the answer of an event, until the deadline.
+
+        The answer may have been received before this call, in which
+        case it's returned immediately.
+
+        Args:
+            event (int): the event number.
+
+        Returns:
+            status (bool): `False` if the control was stopped, `True`
+                    otherwise (including if the deadline is reached
+                    or the channel is closed).
+
+        """
+        with self._lock:
+            pending = self._pending.get(event)
+
+        if pending is None:
+            return True
+
+        ready = pending[0]
+        begin = perf_counter()
+        ready.wait(self.deadline)
+        self.latency.add(perf_counter() - begin)
+
+        # Remove the event, the answer might arrive in the meantime
+        with self._lock:
+            self._pending.pop(event, None)
+            answered = ready.is_set()
+
+        if not answered:
+            self.timeouts += 1
+            logger.debug(f"  No answer for event {event} before the deadline")
+            return True
+
+        return pending[1]
+
+    def close(self):
+        """Close the channel, releasing all waiting events."""
+        with self._lock:
+            self.closed = True
+            pending, self._pending = self._pending, {}
+
+        for ready, _ in pending.values():
+            ready.set()
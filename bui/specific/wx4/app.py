@@ -6,20 +6,48 @@ object in this case sersves as a bridge between wxPython and asynchronous
 code.  The latter is optionally used inside of controls (that is, the
 user can define the control method to be asynchronous).
 
+This application is used when BUI runs in a single thread (see
+`bui.start`): the wxPython and asyncio event loops then take turns
+in the main thread.
+
 """
 
-import asyncio
-
-import wx
-from asyncio.events import get_event_loop
 import asyncio
 import platform
 
 import wx
 
+from bui.specific.loop import MAXIMUM_TIMEOUT, run_event_loops
+
 # Constants
 IS_MAC = platform.system() == "Darwin"
 
+class WXEventLoop:
+
+    """The wxPython event loop, as expected by `run_event_loops`."""
+
+    def __init__(self, app):
+        self.app = app
+        self.evtloop = wx.GUIEventLoop()
+
+    def pending(self):
+        # evtloop.Pending() just returns True on MacOS
+        return not IS_MAC and self.evtloop.Pending()
+
+    def dispatch(self):
+        self.evtloop.Dispatch()
+
+    def dispatch_timeout(self, timeout):
+        self.evtloop.DispatchTimeout(timeout)
+
+    def process_idle(self):
+        self.app.ProcessPendingEvents()
+        self.evtloop.ProcessIdle()
+
+    def wake_up(self):
+        wx.WakeUpIdle()
+
+
 class AsyncApp(wx.App):
 
     """
@@ -28,36 +56,38 @@ class AsyncApp(wx.App):
     Mainly override wx.App.MainLoop in order to run a (mostly) non-blocking
     version of it while still using the event loop provided by asyncio.
 
+    The wxPython event loop blocks until a wxPython event arrives, an
+    asyncio callback or timer is due, or a callback is sent to asyncio
+    from another thread (see `bui.specific.loop.run_event_loops`).
+    An idle window therefore doesn't use the CPU.
+
+    Class attributes:
+        timeout (int): the maximum time to wait for a wxPython event,
+                in milliseconds, before giving the hand back to asyncio.
+                asyncio sockets are only checked when it has the hand
+                (see `bui.specific.loop.MAXIMUM_TIMEOUT`).
+
     """
 
-    def __init__(self, top_window):
+    timeout = MAXIMUM_TIMEOUT
+
+    def __init__(self):
         self.loop = asyncio.get_event_loop()
-        self.top_window = top_window
-        self.top_windows = []
         self.exiting = False
         self.tasks = []
-        super().__init__()
+        super().__init__(False)
 
     async def MainLoop(self):
         """Asynchronous version of combined asyncio and wxPython event loops."""
         # inspired by https://github.com/wxWidgets/Phoenix/blob/master/samples/mainloop/mainloop.py
-        evtloop = wx.GUIEventLoop()
-        with wx.EventLoopActivator(evtloop):
-            while any(self.top_windows) and not self.exiting:
-                if IS_MAC:
-                    # evtloop.Pending() just returns True on MacOs
-                    evtloop.DispatchTimeout(0)
-                else:
-                    while evtloop.Pending():
-                        evtloop.Dispatch()
-
-                # We don't stop more than necessary, doing otherwise will create latency
-                await asyncio.sleep(0.0000000000001)
-                self.ProcessPendingEvents()
-                evtloop.ProcessIdle()
-
-            # At this point we just exit the main loop
-            self.ExitMainLoop()
+        gui = WXEventLoop(self)
+        with wx.EventLoopActivator(gui.evtloop):
+            await run_event_loops(self.loop, gui, lambda: bool(
+                    wx.GetTopLevelWindows()) and not self.exiting,
+                    self.timeout)
+
+        # At this point we just exit the main loop
+        self.ExitMainLoop()
 
     def ExitMainLoop(self):
         self.exiting = True
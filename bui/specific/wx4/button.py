@@ -20,17 +20,18 @@ class WX4Button(WXShared, SpecificButton):
     @name.setter
     def name(self, name):
         """Set the button name."""
-        self.in_main_thread(self.wx_button.SetLabel, name)
+        self.coalesce_in_main_thread((self, "name"), self.wx_button.SetLabel,
+                name)
 
     def enable(self):
         """Force-enable the button."""
         self.generic._enabled = True
-        self.in_main_thread(self.wx_button.Enable)
+        self.coalesce_in_main_thread((self, "enabled"), self.wx_button.Enable)
 
     def disable(self):
         """Force-disable the button."""
         self.generic._enabled = True
-        self.in_main_thread(self.wx_button.Disable)
+        self.coalesce_in_main_thread((self, "enabled"), self.wx_button.Disable)
 
     def _init(self):
         """Initialize the specific widget."""
@@ -16,7 +16,8 @@ class WX4Checkbox(WXShared, SpecificCheckbox):
     @name.setter
     def name(self, name):
         """Set the checkbox name."""
-        self.in_main_thread(self.wx_checkbox.SetName, name)
+        self.coalesce_in_main_thread((self, "name"), self.wx_checkbox.SetName,
+                name)
 
     @property
     def checked(self):
@@ -26,15 +27,18 @@ class WX4Checkbox(WXShared, SpecificCheckbox):
     @checked.setter
     def checked(self, checked):
         """Set the checkbox checked status."""
-        self.in_main_thread(self.wx_checkbox.SetValue, checked)
+        self.coalesce_in_main_thread((self, "checked"),
+                self.wx_checkbox.SetValue, checked)
 
     def enable(self):
         """Force-enable the checkbox."""
-        self.in_main_thread(self.wx_checkbox.Enable)
+        self.coalesce_in_main_thread((self, "enabled"),
+                self.wx_checkbox.Enable)
 
     def disable(self):
         """Force-disable the checkbox."""
-        self.in_main_thread(self.wx_checkbox.Disable)
+        self.coalesce_in_main_thread((self, "enabled"),
+                self.wx_checkbox.Disable)
 
     def _init(self):
         """Initialize the specific widget."""
@@ -18,7 +18,7 @@ class WX4Dialog(WX4Window, SpecificDialog):
 
     async def pop(self, **kwargs):
         self.dlg_event = asyncio.Event()
-        self.in_main_thread(self.wx_pop, **kwargs)
+        self.in_main_thread_modal(self.wx_pop, **kwargs)
         await self.dlg_event.wait()
 
     def wx_pop(self, **kwargs):
@@ -29,7 +29,7 @@ class WX4Dialog(WX4Window, SpecificDialog):
                 self.dlg_event.set())
 
     def close(self):
-        self.in_main_thread(self.destroy)
+        self.in_main_thread_modal(self.destroy)
 
     def destroy(self):
         self.wx_dialog.Destroy()
@@ -97,10 +97,19 @@ class WX4List(WXShared, SpecificList):
         """Sub-classing, processing the control in the async thread."""
         result = super().process_control_in_thread(event, control, options)
         if control == "select":
-            selected = options["selected"]
-            if result:
-                self.generic.selected = selected
-            else:
-                self.select(self.wx_old_selected)
+            self._after_select(result, options["selected"])
 
         return result
+
+    def control_skipped(self, control, options):
+        """The control was skipped, update the selection nonetheless."""
+        if control == "select":
+            self.in_async_thread(self._after_select, True,
+                    options["selected"])
+
+    def _after_select(self, result, selected):
+        """Update the selection after the select control."""
+        if result:
+            self.generic.selected = selected
+        else:
+            self.select(self.wx_old_selected)
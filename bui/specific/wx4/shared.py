@@ -5,14 +5,33 @@ from collections import namedtuple
 import threading
 
 import wx
-from pubsub import pub
 
 from bui.control.base import NOT_SET
 from bui.control.exceptions import StopControl
+from bui.specific.updates import UpdateQueue
 from bui.specific.wx4.constants import KEYMAP, CHARMAP
 from bui.specific.wx4.log import logger
 from bui.specific.wx4.thread import WX_THREAD, EVENT_COUNTER
 
+def freeze_windows():
+    """Freeze the top-level windows, before a batch of updates."""
+    windows = [window for window in wx.GetTopLevelWindows()
+            if not window.IsFrozen()]
+    for window in windows:
+        window.Freeze()
+
+    return windows
+
+def thaw_windows(windows):
+    """Thaw the windows frozen by `freeze_windows`."""
+    for window in windows:
+        # The window might have been destroyed in the meantime
+        if window:
+            window.Thaw()
+
+# Updates to perform in the main thread
+UPDATES = UpdateQueue(wx.CallAfter, freeze_windows, thaw_windows)
+
 class WXShared:
 
     """Mixin to share wx behavior, to be expected on all BUI widgets."""
@@ -106,29 +125,42 @@ class WXShared:
 
         """
         event = next(EVENT_COUNTER)
-        if WX_THREAD.in_queue:
+        if WX_THREAD.in_queue or WX_THREAD.integrated:
+            if not close and control not in self.generic.handled:
+                # No method is bound to this control, nor to the parent
+                # widgets, don't send it to the asynchronous thread
+                if e:
+                    if has_next:
+                        e.DoAllowNextEvent()
+                    else:
+                        e.Skip()
+
+                self.control_skipped(control, options or {})
+                return
+
             msg_post = f"Post event {event} ({e})"
-            if threading.current_thread() is threading.main_thread():
+            if WX_THREAD.integrated:
+                logger.debug(f"{msg_post}, process it in the main thread")
+                status = self.process_control_in_thread(event, control,
+                        options, close=close)
+            elif threading.current_thread() is threading.main_thread():
                 logger.debug(f"{msg_post}, redirect to async thread")
-                WX_THREAD.loop.call_soon_threadsafe(
-                        WX_THREAD.in_queue.put_nowait, (event,
-                        self.process_control_in_thread, (control, options),
-                        {}, close))
-                wx_end = getattr(self, "wx_end", False)
-                if wx_end:
-                    rcv_event, status = event, True
+                vetoes = WX_THREAD.vetoes
+                if vetoes.closed:
+                    status = True
                 else:
-                    rcv_event, status = WX_THREAD.out_queue.get()
-
-                if rcv_event is None:
-                    self.wx_end = True
+                    vetoes.expect(event)
+                    WX_THREAD.loop.call_soon_threadsafe(
+                            WX_THREAD.in_queue.put_nowait, (event,
+                            self.process_control_in_thread, (control, options),
+                            {}, close))
+                    status = vetoes.wait(event)
             else:
                 logger.debug(f"{msg_post}, already in async thread")
-                rcv_event = event
                 status = self.process_control_in_thread(event, control, options, close=close)
 
-            logger.debug(f"  Received {rcv_event}-{event}, {status}, {e}")
-            if rcv_event is None or (e and event == rcv_event and status):
+            logger.debug(f"  Received {event}, {status}, {e}")
+            if e and status:
                 logger.debug("  Skip this event")
                 if has_next:
                     e.DoAllowNextEvent()
@@ -157,6 +189,20 @@ class WXShared:
 
         return True
 
+    def control_skipped(self, control, options):
+        """
+        A control was skipped, since nothing handles it.
+
+        Override this method to update the widget state, as if
+        the control had been processed.  It is called in the main thread.
+
+        Args:
+            control (str): the control name.
+            options (dict): the control options.
+
+        """
+        pass
+
     def should_process_control(self, event, name, options=None):
         """Returns whether this widget can perform this control.
 
@@ -176,14 +222,51 @@ class WXShared:
         thread.  It needs to call methods in the main thread where the
         wxPython event loop sits.
 
+        Calls are not performed immediately: they're queued and
+        performed in a batch, while windows are frozen (see `UPDATES`).
+
+        Args:
+            callable (Callable): any callable.
+
+        Anu arguments or keyword arguments is supported.
+
+        """
+        UPDATES.post(callback, args, kwargs)
+
+    def coalesce_in_main_thread(self, key, callback, *args, **kwargs):
+        """
+        Call the specified callback in the main thread, coalescing calls.
+
+        If a call with the same key is still pending, it is replaced
+        by this one.  This is useful for updates which replace the
+        previous state (setting a label or selecting an item, for
+        instance).  Keys are shared by all widgets, so they should
+        contain the widget itself.
+
+        Args:
+            key (hashable): the key of this call.
+            callback (Callable): any callable.
+
+        Anu arguments or keyword arguments is supported.
+
+        """
+        UPDATES.post(callback, args, kwargs, key=key)
+
+    def in_main_thread_modal(self, callback, *args, **kwargs):
+        """
+        Call the specified callback in the main thread, outside of a batch.
+
+        Windows are not frozen when the callback is called, which is
+        necessary for callbacks which can block, like modal dialogs.
+        The callback is still called after pending updates.
+
         Args:
             callable (Callable): any callable.
 
         Anu arguments or keyword arguments is supported.
 
         """
-        wx.CallAfter(pub.sendMessage, "callable", callback=callback,
-                args=args, kwargs=kwargs)
+        UPDATES.post(callback, args, kwargs, batch=False)
 
     def in_async_thread(self, callback, *args):
         """
@@ -203,4 +286,5 @@ class WXShared:
 
 
 def close_loop(task):
-    WX_THREAD.close_event.set()
+    if WX_THREAD.close_event:
+        WX_THREAD.close_event.set()
@@ -1,13 +1,26 @@
 """The wxPython implementation of a BUI table widget."""
 
 import threading
-from typing import Callable, List
+from typing import Any, List, Tuple
 import wx
 
 from bui.specific.base import *
 from bui.specific.base.table import SpecificTable
 from bui.specific.wx4.shared import WXShared
-from bui.widget.table import AbcRow
+from bui.widget.table import AbcRow, permutation
+
+class WX4VirtualList(wx.ListCtrl):
+
+    """A virtual list control, reading its cells in the generic table."""
+
+    def __init__(self, parent, table):
+        super().__init__(parent,
+                style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.LC_VIRTUAL)
+        self.table = table
+
+    def OnGetItemText(self, item, col):
+        return self.table.get_item_text(item, col)
+
 
 class WX4Table(WXShared, SpecificTable):
 
@@ -15,12 +28,18 @@ class WX4Table(WXShared, SpecificTable):
 
     def _init(self):
         self.lock = threading.RLock()
+        self.wx_count = 0
+        # Text of the cells in a non-virtual table, to only set changed cells
         self._wx_rows = []
         self.wx_selected = -1
         self.wx_old_selected = self.wx_selected
         window = self.parent
-        self.wx_add = self.wx_obj = self.wx_table = wx.ListCtrl(
-                window.wx_parent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        if self.generic.virtual:
+            wx_table = WX4VirtualList(window.wx_parent, self)
+        else:
+            wx_table = wx.ListCtrl(window.wx_parent,
+                    style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        self.wx_add = self.wx_obj = self.wx_table = wx_table
 
         num = 0
         for i, (_, name, hidden) in enumerate(self.generic.cols):
@@ -41,50 +60,63 @@ class WX4Table(WXShared, SpecificTable):
 
         The Row object contains the index of the row to edit.  Therefore,
         a match between the row index and the specific GUI toolkit row index
-        is expected.
+        is expected.  Only the cells whose text has changed are set
+        (see `_wx_rows`), setting the same cell twice in a frame is
+        coalesced.  A virtual table only needs to redraw the row, or
+        to know the new number of rows.
 
         """
-        num_items = len(self._wx_rows)
         index = row._index
-        if index == num_items:
+        if self.generic.virtual:
+            if index >= self.wx_count:
+                self._set_count()
+            else:
+                self.coalesce_in_main_thread((self, "row", index),
+                        self.wx_table.RefreshItem, index)
+        elif index == self.wx_count:
             # Append the row
-            self.in_main_thread(self.wx_table.Append, [str(cell)
-                    for cell in row._visible])
-            row = self.generic.factory(index, *row)
-            row._should_update = False
-            self._wx_rows.append(row)
+            cells = [str(cell) for cell in row._visible]
+            self.in_main_thread(self.wx_table.Append, cells)
+            self._wx_rows.append(cells)
+            self.wx_count += 1
         else:
+            cells = [str(cell) for cell in row._visible]
             old = self._wx_rows[index]
-            for i, (new_value, old_value) in enumerate(
-                    zip(row._visible, old._visible)):
-                if new_value != old_value:
-                    self.in_main_thread(self.wx_table.SetItem, index, i, str(new_value))
-                    old[i] = new_value
+            for i, (text, old_text) in enumerate(zip(cells, old)):
+                if text != old_text:
+                    self.coalesce_in_main_thread((self, "cell", index, i),
+                            self.wx_table.SetItem, index, i, text)
+            self._wx_rows[index] = cells
 
     def refresh(self, rows):
         """
         Refresh the entire table, erasing old rows to update if necessary.
 
-        When this method is called, the content of cached rows (`_rows`)
-        and the content of the specific GUI toolkit table should match.
-        Indexes should be similar.  This method will attempt to perform a
-        lazy update, trying to find the first row to edit in the table
-        and then updating what needs updating, removing what needs removing
-        and adding what needs adding.
+        Indexes of the generic rows and of the specific GUI toolkit table
+        should be similar.  Existing rows are updated, additional rows
+        are removed and missing rows are added.
 
         Args:
-            rows (list of Row): the collection of rows to update.
+            rows (sequence of Row): the collection of rows to update.
 
         """
         with self.lock:
-            for row in rows:
-                self.update_row(row)
-            self.delete_additional()
+            if self.generic.virtual:
+                # Don't browse the rows, the cells are read when displayed
+                self._set_count()
+                self.coalesce_in_main_thread((self, "refresh"),
+                        self.wx_table.Refresh)
+            else:
+                for row in rows:
+                    self.update_row(row)
+                self.delete_additional()
 
             # Select the first item if nothing is selected
-            if len(self._wx_rows) > 0 and self._wx_selected < 0:
-                self.in_main_thread(self.wx_table.Select, 0)
-                self.in_main_thread(self.wx_table.Focus, 0)
+            if self.wx_count > 0 and self._wx_selected < 0:
+                self.coalesce_in_main_thread((self, "select"),
+                        self.wx_table.Select, 0)
+                self.coalesce_in_main_thread((self, "focus"),
+                        self.wx_table.Focus, 0)
 
             self.wx_selected = 0
             self.wx_old_selected = self.wx_selected
@@ -101,38 +133,241 @@ class WX4Table(WXShared, SpecificTable):
 
         """
         index = row._index
-        del self._wx_rows[index]
-        self.in_main_thread(self.wx_table.DeleteItem, index)
-        for wx_row in self._wx_rows[index:]:
-            wx_row._index -= 1
-        self.in_main_thread(self.wx_table.Select, index)
-        self.in_main_thread(self.wx_table.Focus, index)
+        if self.generic.virtual:
+            self._set_count()
+            self.coalesce_in_main_thread((self, "refresh"),
+                    self.wx_table.Refresh)
+        else:
+            self.in_main_thread(self.wx_table.DeleteItem, index)
+            del self._wx_rows[index]
+            self.wx_count -= 1
+        self.coalesce_in_main_thread((self, "select"),
+                self.wx_table.Select, index)
+        self.coalesce_in_main_thread((self, "focus"),
+                self.wx_table.Focus, index)
+
+    def insert_rows(self, index: int, count: int):
+        """
+        Insert several rows, already in the generic table.
+
+        The cells are converted here, then inserted at once
+        in the main thread.
+
+        Args:
+            index (int): the index of the first inserted row.
+            count (int): the number of inserted rows.
+
+        """
+        with self.lock:
+            if self.generic.virtual:
+                self._set_count()
+                self.coalesce_in_main_thread((self, "refresh"),
+                        self.wx_table.Refresh)
+            else:
+                rows = [[str(cell) for cell in row._visible]
+                        for row in self.generic[index:index + count]]
+                self.in_main_thread(self._wx_insert, index, rows)
+                self._wx_rows[index:index] = rows
+                self.wx_count += count
+
+            self.select_row(self.generic._selected)
+
+    def remove_rows(self, indexes: List[int]):
+        """
+        Remove several rows, already removed from the generic table.
+
+        Args:
+            indexes (list of int): the indexes of the removed rows.
+
+        """
+        with self.lock:
+            if self.generic.virtual:
+                self._set_count()
+                self.coalesce_in_main_thread((self, "refresh"),
+                        self.wx_table.Refresh)
+            elif len(indexes) * 2 > self.wx_count:
+                # Deleting most rows, it's faster to add the others again
+                rows = [[str(cell) for cell in row._visible]
+                        for row in self.generic]
+                self.in_main_thread(self._wx_reset, rows)
+                self._wx_rows = rows
+                self.wx_count = len(rows)
+            else:
+                self.in_main_thread(self._wx_delete, indexes)
+                for index in reversed(indexes):
+                    del self._wx_rows[index]
+                self.wx_count -= len(indexes)
+
+            if self.wx_count:
+                self.select_row(self.generic._selected)
+
+    def apply_edits(self, edits: List[Tuple[str, int, int]]):
+        """
+        Apply the edits computed when the rows were replaced.
+
+        The cells to insert or update are converted here, then all
+        edits are applied at once in the main thread.  Only the cells
+        of updated rows whose text has changed are set.
+
+        Args:
+            edits (list): the `(operation, index, count)` tuples, see
+                    `bui.widget.table.diff_rows`.
+
+        """
+        with self.lock:
+            if self.generic.virtual:
+                self._set_count()
+                self.coalesce_in_main_thread((self, "refresh"),
+                        self.wx_table.Refresh)
+            else:
+                script = []
+                wx_rows = self._wx_rows
+                for operation, index, count in edits:
+                    if operation == "delete":
+                        script.append((operation, index, count))
+                        del wx_rows[index:index + count]
+                        continue
+
+                    rows = [[str(cell) for cell in row._visible]
+                            for row in self.generic[index:index + count]]
+                    if operation == "insert":
+                        script.append((operation, index, rows))
+                        wx_rows[index:index] = rows
+                    else:
+                        # Unchanged cells are replaced by None
+                        changed = [[text if text != old else None
+                                for text, old in zip(cells, old_cells)]
+                                for cells, old_cells in zip(rows,
+                                wx_rows[index:index + count])]
+                        script.append((operation, index, changed))
+                        wx_rows[index:index + count] = rows
+
+                self.in_main_thread(self._wx_apply, script)
+                self.wx_count = len(self.generic)
+
+            selected = self.generic._selected
+            if self.wx_count and selected != self.wx_selected:
+                self.select_row(selected)
+
+    def _wx_apply(self, script: List[Tuple[str, int, Any]]):
+        """Apply edits to the wx table, in the main thread."""
+        table = self.wx_table
+        table.Freeze()
+        try:
+            for operation, index, data in script:
+                if operation == "delete":
+                    for item in reversed(range(index, index + data)):
+                        table.DeleteItem(item)
+                elif operation == "insert":
+                    self._wx_insert(index, data)
+                else:
+                    for item, cells in enumerate(data, index):
+                        for col, text in enumerate(cells):
+                            if text is not None:
+                                table.SetItem(item, col, text)
+        finally:
+            table.Thaw()
+
+    def _wx_insert(self, index: int, rows: List[List[str]]):
+        """Insert rows in the wx table, in the main thread."""
+        table = self.wx_table
+        table.Freeze()
+        try:
+            for item, cells in enumerate(rows, index):
+                table.InsertItem(item, cells[0] if cells else "")
+                for col, text in enumerate(cells[1:], 1):
+                    table.SetItem(item, col, text)
+        finally:
+            table.Thaw()
+
+    def _wx_delete(self, indexes: List[int]):
+        """Delete rows from the wx table, in the main thread."""
+        table = self.wx_table
+        table.Freeze()
+        try:
+            for index in reversed(indexes):
+                table.DeleteItem(index)
+        finally:
+            table.Thaw()
+
+    def _wx_reset(self, rows: List[List[str]]):
+        """Replace all the rows of the wx table, in the main thread."""
+        self.wx_table.DeleteAllItems()
+        self._wx_insert(0, rows)
 
     def delete_additional(self):
         """Remove rows that are in generic, not in the wx table."""
-        while len(self._wx_rows) > len(self.generic._rows):
-            self.in_main_thread(self.wx_table.DeleteItem, len(self._wx_rows) - 1)
-            del self._wx_rows[-1]
+        while self.wx_count > len(self.generic):
+            self.wx_count -= 1
+            self.in_main_thread(self.wx_table.DeleteItem, self.wx_count)
+            self._wx_rows.pop()
+
+    def _set_count(self):
+        """Send the number of rows to a virtual table."""
+        self.wx_count = len(self.generic)
+        self.coalesce_in_main_thread((self, "count"),
+                self.wx_table.SetItemCount, self.wx_count)
 
     def select_row(self, row: int):
         """Select the specified row."""
         with self.lock:
-            self.in_main_thread(self.wx_table.Select, row)
-            self.in_main_thread(self.wx_table.Focus, row)
+            self.coalesce_in_main_thread((self, "select"),
+                    self.wx_table.Select, row)
+            self.coalesce_in_main_thread((self, "focus"),
+                    self.wx_table.Focus, row)
             self.wx_selected = row
             self.wx_old_selected = self.wx_selected
 
-    def sort(self, key: Callable = None, reverse=False):
-        """Sort the table."""
-        # The generic table has been sorted, so follow it
-        for row in self.generic._rows:
-            self.update_row(row)
+    def sort(self, order: List[int]):
+        """
+        Move the rows, already sorted in the generic table.
+
+        A virtual table only needs to be redrawn.  Otherwise, the new
+        rank of each row is sent at once to the main thread, where the
+        wx table sorts its items (see `_wx_sort`): cells are not
+        converted nor set again.
+
+        Args:
+            order (list of int): the former index of each row, in
+                    the new order.
+
+        """
+        if self.generic.virtual:
+            self.coalesce_in_main_thread((self, "refresh"),
+                    self.wx_table.Refresh)
+        elif any(index != old for index, old in enumerate(order)):
+            ranks = [0] * len(order)
+            for index, old in enumerate(order):
+                ranks[old] = index
+            self.in_main_thread(self._wx_sort, ranks)
+            self._wx_rows = permutation(order)(self._wx_rows)
+
+    def _wx_sort(self, ranks: List[int]):
+        """
+        Sort the items of the wx table, in the main thread.
+
+        The data of each item is set to its current index, then
+        the items are sorted by their new rank.
+
+        Args:
+            ranks (list of int): the new index of each item.
+
+        """
+        table = self.wx_table
+        table.Freeze()
+        try:
+            for item in range(len(ranks)):
+                table.SetItemData(item, item)
+            table.SortItems(lambda first, second:
+                    ranks[first] - ranks[second])
+        finally:
+            table.Thaw()
 
     def _OnSelected(self, e):
         """An item has been selected."""
         with self.lock:
             indexes = [e.GetIndex()]
-            selected = tuple(self.generic._rows[index] for index in indexes)
+            selected = tuple(self.generic[index] for index in indexes)
             self.wx_selected = indexes[0] if indexes else -1
             selected = selected[0] if selected else None
 
@@ -146,10 +381,19 @@ class WX4Table(WXShared, SpecificTable):
         """Sub-classing, processing the control in the async thread."""
         result = super().process_control_in_thread(event, control, options, close=close)
         if control == "select":
-            selected = options["selected"]
-            if result:
-                self.generic._selected = selected.index
-            else:
-                self.select_row(self.wx_old_selected)
+            self._after_select(result, options["selected"])
 
         return result
+
+    def control_skipped(self, control, options):
+        """The control was skipped, update the selection nonetheless."""
+        if control == "select":
+            self.in_async_thread(self._after_select, True,
+                    options["selected"])
+
+    def _after_select(self, result, selected):
+        """Update the selection after the select control."""
+        if result:
+            self.generic._selected = selected.index
+        else:
+            self.select_row(self.wx_old_selected)
@@ -22,7 +22,8 @@ class WX4Text(WXShared, SpecificText):
     @label.setter
     def label(self, label):
         """Set the text label."""
-        self.in_main_thread(self.wx_label.SetLabel, label)
+        self.coalesce_in_main_thread((self, "label"), self.wx_label.SetLabel,
+                label)
 
     @property
     def value(self):
@@ -241,7 +242,8 @@ class WX4Text(WXShared, SpecificText):
                 cursor._pos = i
                 cursor._lineno = lineno
                 cursor._col = col
-                self.in_main_thread(self.wx_set_insertion_point, offset_pos)
+                self.coalesce_in_main_thread((self, "insertion"),
+                        self.wx_set_insertion_point, offset_pos)
                 break
 
             if char == "\n":
@@ -263,7 +265,8 @@ class WX4Text(WXShared, SpecificText):
             cursor._pos = len(text)
             cursor._lineno = lineno
             cursor._col = col
-            self.in_main_thread(self.wx_set_insertion_point, offset_pos)
+            self.coalesce_in_main_thread((self, "insertion"),
+                    self.wx_set_insertion_point, offset_pos)
 
     def vertical_move(self, lineno: int, col: int):
         """
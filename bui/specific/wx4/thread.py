@@ -4,21 +4,50 @@ import asyncio
 import inspect
 from itertools import count
 import platform
-from queue import LifoQueue
 import threading
 
+from bui.specific.vetoes import VetoChannel
+
 EVENT_COUNTER = count()
 
 class WXThread(threading.Thread):
 
+    """
+    Thread running the asyncio event loop, beside the wxPython one.
+
+    In single-thread mode, the thread isn't started: the asyncio event
+    loop runs in the main thread, along with the wxPython event loop
+    (see `integrate`).
+
+    Attributes:
+        loop (AbstractEventLoop): the asyncio event loop.
+        integrated (bool): is the asyncio event loop running in the
+                main thread?
+
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.loop = None
+        self.integrated = False
         self.in_queue = None
-        self.out_queue = None
+        self.vetoes = VetoChannel()
         self.do_not_listen = False
         self.close_event = None
 
+    def integrate(self, loop):
+        """
+        Run in the main thread, instead of starting a new thread.
+
+        Controls are then processed directly in the main thread.
+
+        Args:
+            loop (AbstractEventLoop): the event loop of the main thread.
+
+        """
+        self.loop = loop
+        self.integrated = True
+
     def run(self):
         """Start in a new thread."""
         loop = asyncio.new_event_loop()
@@ -30,7 +59,6 @@ class WXThread(threading.Thread):
         self.loop = asyncio.get_event_loop()
         self.close_event = asyncio.Event()
         self.in_queue = asyncio.Queue()
-        self.out_queue = LifoQueue()
 
         try:
             await self.process_all_events()
@@ -52,11 +80,11 @@ class WXThread(threading.Thread):
             if inspect.iscoroutine(callable):
                 task = asyncio.create_task(coroutine)
                 if event is not None:
-                    self.out_queue.put_nowait((event, False))
+                    self.vetoes.answer(event, False)
             else:
                 res = callable(event, *args, **kwargs)
                 if event is not None:
-                    self.out_queue.put_nowait((event, res))
+                    self.vetoes.answer(event, res)
 
 
 WX_THREAD = WXThread()
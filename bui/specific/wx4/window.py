@@ -14,11 +14,11 @@ import time
 import threading
 from typing import Dict, Union
 
-from pubsub import pub
 import wx
 
 from bui.specific.base import *
 from bui.specific.base.window import SpecificWindow
+from bui.specific.wx4.app import AsyncApp
 from bui.specific.wx4.shared import WXShared
 from bui.specific.wx4.thread import WX_THREAD
 from bui.tasks import cancel_all
@@ -48,7 +48,10 @@ class WX4Window(WXShared, SpecificWindow):
         elif WX_APP:
             self.wx_app = WX_APP
         elif not self.wx_app:
-            self.wx_app = wx.App(False)
+            if self.generic.single_thread:
+                self.wx_app = AsyncApp()
+            else:
+                self.wx_app = wx.App(False)
             WX_APP = self.wx_app
 
         if not self.wx_display:
@@ -62,7 +65,8 @@ class WX4Window(WXShared, SpecificWindow):
     @title.setter
     def title(self, new_title):
         """Set the window's title, override in child class."""
-        self.in_main_thread(self.wx_frame.SetTitle, new_title)
+        self.coalesce_in_main_thread((self, "title"), self.wx_frame.SetTitle,
+                new_title)
 
     def _init(self):
         """Initialize the specific widget."""
@@ -93,10 +97,12 @@ class WX4Window(WXShared, SpecificWindow):
         self.wx_frame.SetClientSize(self.wx_panel.GetSize())
 
         # Start a WXThread if none exists
-        if not WX_THREAD.is_alive():
-            pub.subscribe(self.call, "callable")
+        if not WX_THREAD.is_alive() and not WX_THREAD.integrated:
             WX_THREAD.app = self.wx_app
-            WX_THREAD.start()
+            if self.generic.single_thread:
+                WX_THREAD.integrate(asyncio.get_event_loop())
+            else:
+                WX_THREAD.start()
 
     def position_for(self, widget):
         """
@@ -169,7 +175,10 @@ class WX4Window(WXShared, SpecificWindow):
             loop (AsyncLoop): the asynchronous event loop (see asyncio).
 
         """
-        self.wx_app.MainLoop()
+        if WX_THREAD.integrated:
+            await self.wx_app.MainLoop()
+        else:
+            self.wx_app.MainLoop()
 
     def create_menubar(self, menubar):
         """Create a menu bar."""
@@ -189,7 +198,7 @@ class WX4Window(WXShared, SpecificWindow):
         if threading.current_thread() is threading.main_thread():
             self._close()
         else:
-            self.in_main_thread(self._close)
+            self.in_main_thread_modal(self._close)
 
     def _close(self):
         """Close this window, terminate loop if appropriate."""
@@ -203,15 +212,17 @@ class WX4Window(WXShared, SpecificWindow):
             self.destroy(self.wx_frame)
 
         # Terminate the loop
-        if parent is None:
+        if parent is None and WX_THREAD.integrated:
+            self.wx_app.ExitMainLoop()
+        elif parent is None:
             # The close event is to be set
             WX_THREAD.loop.call_soon_threadsafe(WX_THREAD.close_event.set)
 
             # Send a None event to the queue
             WX_THREAD.loop.call_soon_threadsafe(WX_THREAD.in_queue.put_nowait, (None, None, (), {}, False))
 
-            # Send a "pass" to the output queue so it will skip all events
-            WX_THREAD.out_queue.put_nowait((None, True))
+            # Close the veto channel so that all events are skipped
+            WX_THREAD.vetoes.close()
 
     def destroy(self, wx_window):
         """Try and destroy the window."""
@@ -242,7 +253,8 @@ class WX4Window(WXShared, SpecificWindow):
     async def pop_dialog(self, dialog: SpecificWidget, **kwargs):
         """Pop up a dialog."""
         dlg_queue = asyncio.Queue()
-        self.in_main_thread(self.wx_pop_dialog, dialog, dlg_queue, **kwargs)
+        self.in_main_thread_modal(self.wx_pop_dialog, dialog, dlg_queue,
+                **kwargs)
         return await dlg_queue.get()
 
     def wx_pop_dialog(self, dialog, bui_queue, **kwargs):
@@ -273,7 +285,7 @@ class WX4Window(WXShared, SpecificWindow):
 
         """
         queue = asyncio.Queue()
-        self.in_main_thread(self.wx_pop_alert, title, message, danger,
+        self.in_main_thread_modal(self.wx_pop_alert, title, message, danger,
                 buttons, default, queue)
         status = await queue.get()
         return status
@@ -353,7 +365,7 @@ class WX4Window(WXShared, SpecificWindow):
     def open_window(self, window, child):
         """Open another window."""
         #self._wx_init()
-        self.in_main_thread(self.wx_open_window, window, child)
+        self.in_main_thread_modal(self.wx_open_window, window, child)
 
     def wx_open_window(self, window, child):
         window = window.parse_layout(window)
@@ -365,13 +377,3 @@ class WX4Window(WXShared, SpecificWindow):
             window.specific.wx_frame.GetParent().Hide()
 
         window.specific.show()
-
-    def call(self, callback, args=None, kwargs=None):
-        """Execute the given callable."""
-        args = args or ()
-        kwargs = kwargs or {}
-        callback(*args, **kwargs)
-        #except RuntimeError:
-        #    # Although not perfect, this will catch errors raised by
-        #    # wxPython if the object was deleted.
-        #    pass
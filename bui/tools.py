@@ -21,6 +21,10 @@ def load_GUI():
     3.  On what platform are we running?  This might determine some choice, as
         some toolkits on some platforms might not be as accessible.
 
+    The `BUI_GUI` environment variable can force the sub-package of
+    `specific` to use, for instance `BUI_GUI=headless` to use the
+    headless backend (without display, to test or benchmark BUI).
+
     Returns:
         The dynamically-loaded package (which is a sub-package of
         `specific`).  This package should directly lead to a specific
@@ -31,6 +35,14 @@ def load_GUI():
                 be good for accessibility.
 
     """
+    forced = os.environ.get("BUI_GUI")
+    if forced:
+        try:
+            return import_module(f'bui.specific.{forced}')
+        except ImportError as err:
+            raise RuntimeError(f"the {forced!r} GUI toolkit (set in "
+                    f"BUI_GUI) couldn't be loaded: {err}") from None
+
     # Supported GUI toolkits
     supported = (
             # GUI  Version Package Can use callable
@@ -65,20 +77,41 @@ def load_GUI():
 
     return able[0]
 
-def start(window, **kwargs):
-    """Start a window."""
+def start(window, single_thread: bool = False, **kwargs):
+    """
+    Start a window.
+
+    Args:
+        window (Window subclass): the window class to start.
+        single_thread (bool, optional): if `True`, run the asyncio
+                event loop and the GUI event loop in the main thread,
+                instead of running asyncio in a separate thread.
+                Controls are then processed immediately, without
+                being sent to another thread, but a modal dialog
+                (or alert) blocks asynchronous tasks until it's
+                closed.  This mode can also be set with the
+                `--single-thread` command-line argument.
+
+    Other keyword arguments are set on the window object.
+
+    """
     args = None
     if not FORBID_START:
         args = init_args()
-
-    window = window.parse_layout(window, **kwargs)
+        single_thread = single_thread or args.single_thread
 
     # Create an asyncio EventLoop and hand it to the generic (and
     # specific) window object, to watch for window events AND
     # asynchronous events at the same time
+    loop = None
     if not FORBID_START:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+
+    window = window.parse_layout(window, single_thread=single_thread,
+            **kwargs)
+
+    if loop is not None:
         before_displaying(args, window, loop)
         try:
             loop.run_until_complete(window._start(loop))
@@ -104,5 +137,12 @@ def forbid_start():
     finally:
         FORBID_START = False
 
-PACKAGE = load_GUI()
+def __getattr__(name):
+    """Load the GUI toolkit (`PACKAGE`) when it's first needed."""
+    global PACKAGE
+    if name == "PACKAGE":
+        PACKAGE = load_GUI()
+        return PACKAGE
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
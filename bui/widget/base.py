@@ -4,8 +4,12 @@ import asyncio
 from collections import defaultdict
 
 from bui.control import CONTROLS
+from bui.control.base import DispatchTable
 from bui.tasks import schedule
 
+# Controls with `handle_` or `after_` hooks, with the widget class as key
+_HOOKED = {}
+
 class Widget:
 
     """Parent class for all generic widgets."""
@@ -20,6 +24,8 @@ class Widget:
         self.specific = None
         self.parent = leaf.parent.widget if leaf.parent is not None else None
         self.controls = defaultdict(list)
+        self._dispatch = {}
+        self._handled = None
 
     def __repr__(self):
         return f"<bui.generic.{self.widget} object>"
@@ -31,13 +37,20 @@ class Widget:
         """
         Create the specific widget, using the `specific_package` attribute.
 
+        If this attribute isn't set, use the GUI toolkit, loading it
+        if it's the first specific widget (see `bui.tools.PACKAGE`).
         If the specific object has already been created, don't recreate it and
         raise no exception.
 
         """
         if not self.specific:
+            package = self.specific_package
+            if package is None:
+                # Load the GUI toolkit, if it's not loaded yet
+                from bui.tools import PACKAGE as package
+
             class_name = self.class_name
-            SpecificWidget = getattr(self.specific_package, class_name)
+            SpecificWidget = getattr(package, class_name)
             self.specific = SpecificWidget(self)
 
     def _init(self):
@@ -66,11 +79,77 @@ class Widget:
         control = Control(self, **options)
         return control.process(options, callback=callback)
 
-    def _bind_controls(self, window):
-        """Bind the diget controls."""
+    def _bind_controls(self, window, plan=None):
+        """
+        Bind the widget controls.
+
+        Args:
+            window (Window): the window containing control methods.
+            plan (BindingPlan, optional): the binding plan to complete.
+                    If not set, methods are bound immediately.
+
+        """
         for name in self.default_controls.keys():
             Control = CONTROLS.get(name)
-            Control._bind_methods(self, window)
+            Control._bind_methods(self, window, plan)
+
+    @property
+    def handled(self):
+        """
+        Return the controls handled by this widget or its parents.
+
+        A control is handled if a method is bound to it on this widget
+        or one of its parents, or if they have a `handle_` or `after_`
+        hook for this control.  Specific widgets can skip the other
+        controls without processing them.  This set is computed again
+        if methods were bound to this widget or its parents since it
+        was last computed.
+
+        Returns:
+            handled (frozenset): the names of handled controls.
+
+        """
+        size = sum(map(len, self.controls.values()))
+        inherited = self.parent.handled if self.parent is not None else None
+        cached = self._handled
+        if (cached is not None and cached[0] == size
+                and cached[1] is inherited):
+            return cached[2]
+
+        Widget = type(self)
+        hooked = _HOOKED.get(Widget)
+        if hooked is None:
+            hooked = frozenset(name for name in CONTROLS
+                    if hasattr(Widget, f"handle_{name}")
+                    or hasattr(Widget, f"after_{name}"))
+            _HOOKED[Widget] = hooked
+
+        handled = hooked.union(name for name, methods
+                in self.controls.items() if methods)
+        if inherited is not None:
+            handled = handled.union(inherited)
+
+        handled = frozenset(handled)
+        self._handled = (size, inherited, handled)
+        return handled
+
+    def _dispatch_table(self, control_name):
+        """
+        Return the dispatch table of a control, building it if needed.
+
+        The table is built again if methods were bound to this control
+        since it was last built.
+
+        Args:
+            control_name (str): the control name.
+
+        """
+        table = self._dispatch.get(control_name)
+        methods = self.controls.get(control_name, ())
+        if table is None or table.size != len(methods):
+            table = self._dispatch[control_name] = DispatchTable(methods)
+
+        return table
 
     def schedule(self, coroutine):
         """Schedule the specified coroutine in the main event loop."""
@@ -1,8 +1,15 @@
 """Module containing the generic Table class, a generic table widget."""
 
+import asyncio
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager, nullcontext
+from itertools import islice
 from operator import itemgetter
+import threading
+from time import monotonic
 from typing import (Any, Callable, Dict, Iterable, List, Optional,
         Sequence, Tuple, Union)
+from weakref import WeakValueDictionary
 
 from bui.widget.base import Widget, CachedProperty
 
@@ -21,137 +28,240 @@ class AbcRow:
     row class for a table, but in this case, your row class should
     inherit `AbcRow`.
 
+    A row doesn't hold its values: the table stores them by column
+    (see `Table._columns`) and a row object only keeps its index, so
+    it's a lightweight view on the table.  Rows which aren't in a table
+    yet (or were removed from it) keep their values in `_values`.
+    A row can still hold attributes which aren't columns: the table
+    then keeps this row object, so the attributes aren't lost.
+
     """
 
+    __slots__ = ("_index", "_values", "__weakref__")
     widget = None
     columns = ()
 
+    # Set from the columns (see `_set_columns`)
+    _ids = ()
+    _positions = {}
+    _visible_positions = ()
+
     def __init__(self, index, *args, **kwargs):
         if type(self) is AbcRow:
             raise TypeError("cannot instantiate abstract row")
 
         self._index = index
-        self._cols = {}
-        self._should_update = True
-        used_args = 0
-        ids = [tup[0] for tup in type(self).columns]
-        for col, value in zip(ids, args):
+        self._values = type(self)._check_values(args, kwargs)
+        for col, value in zip(self._ids, self._values):
             self._update(col, value)
-            self._cols[col] = value
-            used_args += 1
-
-        for col in ids:
-            if col in kwargs:
-                if col in self._cols:
-                    arg = self._cols[col]
-                    raise ValueError(f"two values were specified for column "
-                            f"{col!r}: {arg!r} in positional arguments, and "
-                            f"{kwargs[col]!r} in keyword arguments.  You "
-                            f"might be better off using either only "
-                            f"positional, or only keyword arguments when "
-                            f"creating a row")
-                else:
-                    value = kwargs[col]
-                    self._update(col, value)
-                    self._cols[col] = value
 
-        if not all(key in self._cols.keys() for key in ids):
-            forgotten = [key for key in self.columns if key not in ids]
-            raise ValueError(f"not all columns were specified: missing "
-                    f"{', '.join(forgotten)}")
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "columns" in cls.__dict__:
+            cls._set_columns(cls.columns)
+
+    @classmethod
+    def _set_columns(cls, columns):
+        """
+        Set the column positions of this row class.
+
+        Args:
+            columns (sequence): the columns, either as column IDs
+                    or as tuples `(id, name, hidden)`.
+
+        """
+        columns = [(col, col, False) if isinstance(col, str) else col
+                for col in columns]
+        cls._ids = tuple(col[0] for col in columns)
+        cls._positions = {col: i for i, col in enumerate(cls._ids)}
+        cls._visible_positions = tuple(i for i, (_, _, hidden) in
+                enumerate(columns) if not hidden)
+
+    @classmethod
+    def _bind(cls, widget):
+        """Bind this row class to a table, using its columns."""
+        if cls.widget is not widget:
+            cls.widget = widget
+            cls._set_columns(widget.cols)
+
+    @classmethod
+    def _view(cls, index):
+        """Return a row object reading its values in the table."""
+        row = cls.__new__(cls)
+        _set_index(row, index)
+        _set_values(row, None)
+        return row
+
+    @classmethod
+    def _check_values(cls, args, kwargs):
+        """
+        Return the list of values, in column order.
+
+        Args:
+            args (sequence): the positional values.
+            kwargs (dict): the values by column ID.
+
+        Raises:
+            ValueError: the values don't match the columns.
+
+        """
+        ids = cls._ids
+        if not kwargs and len(args) == len(ids):
+            return list(args)
 
-        if len(args) > used_args:
-            unused = args[used_args:]
-            unused = [str(arg) for arg in unused]
+        if len(args) > len(ids):
+            unused = [str(arg) for arg in args[len(ids):]]
             raise ValueError(f"too many position arguments: {', '.join(unused)}")
 
-        if any(key not in ids for key in kwargs.keys()):
-            unused = [key for key in kwargs.keys() if key not in ids]
+        unused = [key for key in kwargs.keys() if key not in cls._positions]
+        if unused:
             raise ValueError(f"unused keyword arguments: {', '.join(unused)}")
 
+        values = list(args) + [NO_VALUE] * (len(ids) - len(args))
+        for col, value in kwargs.items():
+            position = cls._positions[col]
+            if values[position] is not NO_VALUE:
+                arg = values[position]
+                raise ValueError(f"two values were specified for column "
+                        f"{col!r}: {arg!r} in positional arguments, and "
+                        f"{value!r} in keyword arguments.  You "
+                        f"might be better off using either only "
+                        f"positional, or only keyword arguments when "
+                        f"creating a row")
+
+            values[position] = value
+
+        forgotten = [col for col, value in zip(ids, values)
+                if value is NO_VALUE]
+        if forgotten:
+            raise ValueError(f"not all columns were specified: missing "
+                    f"{', '.join(forgotten)}")
+
+        return values
+
     @property
     def index(self):
         return self._index
 
     def __repr__(self):
-        args = [f"{key}={value!r}" for key, value in self._cols.items()]
+        args = [f"{key}={value!r}" for key, value in zip(self._ids, self)]
         return f"<{type(self).__name__}({', '.join(args)})>"
 
     def __str__(self):
-        args = [f"{key}={value}" for key, value in self._cols.items()]
+        args = [f"{key}={value}" for key, value in zip(self._ids, self)]
         return f"{type(self).__name__} {', '.join(args)}"
 
     def __iter__(self):
-        return iter(self._cols.values())
+        values = self._values
+        if values is None:
+            index = self._index
+            values = [column[index] for column in self.widget._columns]
+
+        return iter(values)
 
     @property
     def _visible(self):
         """Return only the visible columns."""
-        visible = []
-        for id, _, hidden in type(self).columns:
-            if hidden:
-                continue
+        values = self._values
+        if values is None:
+            index = self._index
+            columns = self.widget._columns
+            return tuple([columns[position][index]
+                    for position in self._visible_positions])
+
+        return tuple([values[position] for position in self._visible_positions])
+
+    def _get(self, position: int):
+        """Return the value at this column position."""
+        values = self._values
+        if values is None:
+            return self.widget._columns[position][self._index]
+
+        return values[position]
+
+    def _set(self, position: int, value: Any):
+        """Change the value at this column position."""
+        values = self._values
+        if values is None:
+            self.widget._set_cell(self, position, value)
+        else:
+            self._update(self._ids[position], value)
+            values[position] = value
 
-            value = self._cols[id]
-            visible.append(value)
+    def _position(self, item: Union[int, str]):
+        """Return the column position of a column ID or index."""
+        if isinstance(item, int):
+            return range(len(self._ids))[item]
 
-        return tuple(visible)
+        return self._positions[item]
 
     def __getattr__(self, attr):
-        cols = object.__getattribute__(self, "_cols")
-        value = cols.get(attr, NO_VALUE)
-        if value is NO_VALUE:
+        position = type(self)._positions.get(attr)
+        if position is None:
             raise AttributeError(f"no {attr} column or attribute in this row")
 
-        return value
+        return self._get(position)
 
     def __setattr__(self, attr, value):
-        try:
-            cols = object.__getattribute__(self, "_cols")
-        except AttributeError:
+        position = type(self)._positions.get(attr)
+        if position is None:
             object.__setattr__(self, attr, value)
+            if (attr not in _SLOTS
+                    and getattr(self, "_values", NO_VALUE) is None):
+                # Keep this row object and its attributes alive
+                self.widget._kept[id(self)] = self
         else:
-            if attr in cols:
-                self._update(attr, value)
-                cols[attr] = value
-                if self._should_update:
-                    self.widget.update_row(self)
-            else:
-                object.__setattr__(self, attr, value)
+            self._set(position, value)
 
     def __getitem__(self, item):
-        if isinstance(item, int):
-            item = tuple(self._cols.keys())[item]
-
-        return self._cols[item]
+        return self._get(self._position(item))
 
     def __setitem__(self, item, value):
-        if isinstance(item, int):
-            item = tuple(self._cols.keys())[item]
-
-        self._update(item, value)
-        self._cols[item] = value
-        if self._should_update:
-            self.widget.update_row(self)
+        self._set(self._position(item), value)
 
     def __eq__(self, other):
         if isinstance(other, (tuple, list)):
-            other = self.widget.factory(self._index, *other)
+            other = self.widget.factory._check_values(other, {})
         elif isinstance(other, dict):
-            other = self.widget.factory(self._index, **other)
+            other = self.widget.factory._check_values((), other)
         elif not isinstance(other, self.widget.row_classes):
             raise TypeError(f"cannot compare to {type(other)}")
 
-        return self._cols == other._cols
+        return list(self) == list(other)
 
     def _update(self, column: str, value: Any):
-        if not self._should_update:
-            return
-
         method = getattr(self, f"update_{column}", None)
         if method:
             method(value)
 
+    def batch(self):
+        """
+        Change several cells of this row, displaying them once.
+
+        Inside the `with` block, changed cells of this row aren't
+        displayed: the row is displayed once, with its latest values,
+        when the block exits.  If the table is kept sorted, the row is
+        moved when the block exits too.  Batches can be nested, only
+        the outermost one displays the row.  Other rows are displayed
+        as usual.  See `Table.batch` to defer all changes in a table.
+
+        Example:
+            >>> with row.batch():
+            ...     row.name = "Alice"
+            ...     row.age = 32
+
+        """
+        if self._values is not None:
+            # This row isn't in a table, nothing is displayed
+            return nullcontext(self)
+
+        return self.widget._row_batch(self)
+
+
+# Set the slots of row objects, bypassing `AbcRow.__setattr__`
+_set_index = AbcRow._index.__set__
+_set_values = AbcRow._values.__set__
+_SLOTS = frozenset(AbcRow.__slots__)
 
 Row = Union[dict, list, tuple, AbcRow]
 
@@ -181,6 +291,10 @@ class Table(Widget):
         "type": "The user types a character while the table is focused.",
     }
 
+    # Maximum number of times per second changed cells are displayed
+    # (see `flush`), 0 to display every change immediately
+    update_rate = 30
+
     def __init__(self, leaf):
         super().__init__(leaf)
         self.x = leaf.x
@@ -188,12 +302,36 @@ class Table(Widget):
         self.id = leaf.id
         self.width = leaf.width
         self.height = leaf.height
+        self.virtual = leaf.virtual
         self.cols = []
         self.factory = None
         self.row_class = None
-        self._rows = []
+        # Virtual tables read cells from the main thread (see
+        # `SpecificTable.get_item_text`).  So that no row mixes old
+        # and new cells, columns are either replaced at once or
+        # changed in place while holding `_lock`
+        self._columns = []
+        self._lock = threading.RLock()
+        self._views = WeakValueDictionary()
+        self._kept = {}
         self._selected = 0
         self._uniques = set()
+        self._unique_positions = ()
+        self._unique_indexes = None
+        self._dirty = set()
+        self._flush_handle = None
+        self._last_flush = 0.0
+        self._ranks = {}
+        self._sort_key = None
+        self._sort_by = None
+        self._sort_reverse = False
+        # Row batches: [row, depth, changed] lists, with id(row) as key
+        self._row_batches = {}
+        # Table batch: depth by task, snapshot of the columns
+        self._batch_tasks = {}
+        self._batch_columns = None
+        self._batch_selected = 0
+        self._batch_moved = False
 
     def __str__(self):
         """Return a nice display of the table."""
@@ -216,46 +354,56 @@ class Table(Widget):
         return (self.factory, )
 
     def __len__(self):
-        return len(self._rows)
+        return len(self._columns[0]) if self._columns else 0
 
-    def __getitem__(self, item):
-        row = self._rows[item]
-        if isinstance(row, AbcRow):
-            return row
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._row(index)
 
-        ret = []
-        rows = row
-        for row in rows:
-            ret.append(row)
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._row(index) for index in range(len(self))[item]]
 
-        return ret
+        return self._row(range(len(self))[item])
 
     def __setitem__(self, item, row: Union[Row, Sequence[Row]]):
         if isinstance(item, int):
-            items = slice(item, item + 1, 1)
+            indexes = [range(len(self))[item]]
             rows = [row]
         else:
-            items = item
+            indexes = range(len(self))[item]
             rows = row
 
-        cur_rows = self._rows[items]
         try:
             iter(rows)
-            if len(rows) != len(cur_rows):
+            if len(rows) != len(indexes):
                 raise TypeError
         except TypeError:
             raise TypeError("the number of rows doesn't match "
                     "the speicified indices") from None
 
-        for cur_row, row in zip(cur_rows, rows):
-            if isinstance(row, AbcRow) and not isinstance(row, self.row_classes):
-                raise TypeError("the specified row isn't of the proper table")
+        # Read all the values first, the rows might be in this table
+        all_values = []
+        for row in rows:
+            if isinstance(row, AbcRow):
+                if not isinstance(row, self.row_classes):
+                    raise TypeError("the specified row isn't of the proper table")
+                values = list(row)
             elif isinstance(row, dict):
-                row = self.factory(cur_row._index, **row)
+                values = self.factory._check_values((), row)
             else:
-                row = self.factory(cur_row._index, *row)
-            row._index = cur_row._index
-            self.update_row(row)
+                values = self.factory._check_values(tuple(row), {})
+            all_values.append(values)
+
+        self._check_uniques(all_values, replaced=indexes)
+        for index, values in zip(indexes, all_values):
+            self._store(index, values)
+
+        if self._sort_key is not None:
+            if len(indexes) == 1:
+                self._reposition(indexes[0])
+            else:
+                self.sort(self._sort_key, self._sort_reverse)
 
     @CachedProperty
     def id(self):
@@ -264,7 +412,7 @@ class Table(Widget):
     @property
     def rows(self):
         """Return the table rows."""
-        return list(self._rows)
+        return list(self)
 
     @rows.setter
     def rows(self, rows: Iterable[Row]):
@@ -277,36 +425,168 @@ class Table(Widget):
                     or tuple, list or dict).
 
         """
-        try:
-            iter(rows)
-        except TypeError:
-            raise TypeError("'rows' isn't a valid iterable")
+        all_values, attached = self._prepare_rows(rows)
+        self._check_uniques(all_values, replaced=range(len(self)))
+        self.flush()
+        for view in list(self._views.values()):
+            self._detach(view)
+        self._views.clear()
+
+        old_columns = self._columns
+        self._columns = [[values[position] for values in all_values]
+                for position in range(len(old_columns))]
+        for index, row in attached:
+            self._attach(row, index)
+
+        if self._unique_indexes is not None:
+            self._unique_indexes = {position: {}
+                    for position in self._unique_indexes}
+            self._reindex_uniques(0)
+        self._ranks.clear()
+        if self._sort_key is not None:
+            self._permute(self._sorted_order(self._sort_key,
+                    self._sort_reverse))
+
+        self._follow_selection(old_columns, self._selected)
+        if self._batch_columns is None:
+            self._display_changes(old_columns)
+
+    def extend(self, rows: Iterable[Row]):
+        """
+        Add several rows at the bottom of the table.
 
-        if not isinstance(rows, list):
-            rows = list(rows)
+        This is much faster than calling `add_row` for each row: all
+        rows are checked first, then added at once, and the GUI toolkit
+        receives only one update.
 
-        for i, row in enumerate(rows):
-            if isinstance(row, (tuple, list)):
-                row = self._create_row(i, *row)
-            elif isinstance(row, (dict)):
-                row = self._create_row(i, **row)
-            elif not isinstance(row, self.row_classes):
-                raise TypeError(f"invalid row type ({type(row)})")
-            rows[i] = row
+        Args:
+            rows (iterable): an iterable containing representations
+                    of rows (can be Row objects specific to this table,
+                    or tuple, list or dict).
+
+        Raises:
+            ValueError: a row doesn't match the table columns.  No row
+                    is added in this case.
+
+        """
+        self.insert_rows(len(self), rows)
+
+    def insert_rows(self, index: int, rows: Iterable[Row]):
+        """
+        Insert several rows before the given index.
+
+        Like `list.insert`, an index beyond the table adds the rows
+        at the bottom.  If the table is kept sorted (see `keep_sorted`),
+        the index is ignored and rows are placed in order.
+
+        Args:
+            index (int): the index before which to insert rows.
+            rows (iterable): an iterable containing representations
+                    of rows (can be Row objects specific to this table,
+                    or tuple, list or dict).
+
+        Raises:
+            ValueError: a row doesn't match the table columns.  No row
+                    is inserted in this case.
+
+        """
+        length = len(self)
+        index = len(range(length)[:index])
+        kept_sorted = self._sort_key is not None
+        all_values, attached = self._prepare_rows(rows,
+                0 if kept_sorted else index)
+        count = len(all_values)
+        if not count:
+            return
+
+        self._check_uniques(all_values)
+        self.flush()
+        if kept_sorted:
+            self._insert_sorted(all_values, attached)
+            return
+
+        with self._lock:
+            for position, column in enumerate(self._columns):
+                column[index:index] = [values[position]
+                        for values in all_values]
+
+        self._reindex_uniques(index)
+        self._ranks.clear()
+
+        self._reindex(lambda i: i + count if i >= index else i)
+        for row_index, row in attached:
+            self._attach(row, row_index)
+
+        if length and self._selected >= index:
+            self._selected += count
+
+        self._display("insert_rows", index, count)
+
+    def remove_rows(self, rows: Iterable[Union[int, AbcRow]]):
+        """
+        Remove several rows.
+
+        This is much faster than calling `remove_row` for each row:
+        the table is updated once, whatever the number of rows to
+        remove.
+
+        Args:
+            rows (iterable): the rows to remove, as Row objects or
+                    as indexes.  A slice of indexes is accepted too.
+
+        Example:
+            >>> table.remove_rows(range(10, 20))
+            >>> table.remove_rows(row for row in table if row.age > 20)
+
+        """
+        length = len(self)
+        if isinstance(rows, slice):
+            rows = range(length)[rows]
+
+        indexes = set()
+        for row in rows:
+            if isinstance(row, AbcRow):
+                row = row._index
+            indexes.add(range(length)[row])
+        if not indexes:
+            return
+
+        self.flush()
+        indexes = sorted(indexes)
+        for index in indexes:
+            row = self._views.pop(index, None)
+            if row is not None:
+                self._detach(row)
+        self._unindex_uniques(indexes)
+
+        if indexes[-1] - indexes[0] + 1 == len(indexes):
+            # The rows follow each other
+            with self._lock:
+                for column in self._columns:
+                    del column[indexes[0]:indexes[-1] + 1]
+        else:
+            removed = set(indexes)
+            kept = [i for i in range(length) if i not in removed]
+            self._columns = [list(map(column.__getitem__, kept))
+                    for column in self._columns]
+
+        self._reindex_uniques(indexes[0])
+        self._ranks.clear()
+        self._reindex(lambda i: i - bisect_left(indexes, i))
+        selected = self._selected
+        if 0 <= selected < length:
+            selected -= bisect_left(indexes, selected)
+            self._selected = max(min(selected, len(self) - 1), 0)
 
-        self._rows[:] = rows
-        self.specific.refresh(rows)
-        return rows
+        self._display("remove_rows", indexes)
 
     @property
     def selected(self):
         """Return the currently selected row."""
-        try:
-            row = self._rows[self._selected]
-        except IndexError:
-            row = None
+        if 0 <= self._selected < len(self):
+            return self._row(self._selected)
 
-        return row
+        return None
 
     @selected.setter
     def selected(self, row: Union[int, Row]):
@@ -320,7 +600,7 @@ class Table(Widget):
         if isinstance(row, AbcRow):
             row = row._index
         self._selected = row
-        self.specific.select_row(row)
+        self._display("select_row", row)
 
     def _init(self):
         """Widget initialization."""
@@ -336,8 +616,556 @@ class Table(Widget):
                     "<list> tag instead.")
 
         self.factory = build_factory(self, self.cols)
+        self._columns = [[] for _ in self.cols]
+        self._unique_positions = tuple(sorted(self.factory._positions[col]
+                for col in self._uniques))
+        if self.leaf.sort:
+            self.keep_sorted([col.strip() for col in self.leaf.sort.split(",")])
+
         return super()._init()
 
+    def _prepare_rows(self, rows: Iterable[Row], start: int = 0):
+        """
+        Check the rows before adding them to the table.
+
+        Args:
+            rows (iterable): an iterable containing representations
+                    of rows (can be Row objects specific to this table,
+                    or tuple, list or dict).
+            start (int, optional): the index of the first row.
+
+        Returns:
+            (all_values, attached): the list of values for each row,
+                    and the `(index, row)` tuples of the row objects
+                    to attach to the table once their values are in it.
+
+        Raises:
+            TypeError: `rows` isn't an iterable or contains invalid rows.
+            ValueError: a row doesn't match the table columns.
+
+        """
+        try:
+            iter(rows)
+        except TypeError:
+            raise TypeError("'rows' isn't a valid iterable")
+
+        # Rows with extra information (of the row class) are kept
+        check = self.factory._check_values
+        all_values = []
+        attached = []
+        for i, row in enumerate(rows, start):
+            if isinstance(row, (tuple, list)):
+                if self.row_class:
+                    row = self._create_row(i, *row)
+                else:
+                    all_values.append(check(row, {}))
+                    continue
+            elif isinstance(row, dict):
+                if self.row_class:
+                    row = self._create_row(i, **row)
+                else:
+                    all_values.append(check((), row))
+                    continue
+            elif not isinstance(row, self.row_classes):
+                raise TypeError(f"invalid row type ({type(row)})")
+
+            if row._values is None:
+                all_values.append(list(row))
+            else:
+                all_values.append(row._values)
+                attached.append((i, row))
+
+        return all_values, attached
+
+    def _row(self, index: int) -> AbcRow:
+        """
+        Return the row object at this index, creating a view if needed.
+
+        Row objects are kept in a weak dictionary: as long as the user
+        keeps a row object, this object is returned and its index
+        follows the table changes.  Row objects of the row class, or
+        row objects holding extra attributes, are always kept.
+
+        Args:
+            index (int): the row index, assumed to be valid.
+
+        """
+        row = self._views.get(index)
+        if row is None:
+            row = self.factory._view(index)
+            self._views[index] = row
+
+        return row
+
+    def _attach(self, row: AbcRow, index: int):
+        """Attach a row object, its values being in the table."""
+        _set_index(row, index)
+        _set_values(row, None)
+        self._views[index] = row
+        if type(row) is self.factory:
+            # Default rows are only kept if they hold attributes
+            kept = bool(row.__dict__)
+        else:
+            kept = hasattr(row, "__dict__")
+
+        if kept:
+            self._kept[id(row)] = row
+
+    def _detach(self, row: AbcRow):
+        """Detach a row object, copying its values from the table."""
+        _set_values(row, list(row))
+        self._kept.pop(id(row), None)
+
+    def _reindex(self, new_index: Callable[[int], Optional[int]]):
+        """
+        Change the index of the row objects.
+
+        Args:
+            new_index (callable): called with the current index of each
+                    row object, should return its new index.
+
+        """
+        views = list(self._views.items())
+        self._views.clear()
+        for index, row in views:
+            index = new_index(index)
+            _set_index(row, index)
+            self._views[index] = row
+
+    def _store(self, index: int, values: List[Any]):
+        """
+        Store the values of a row already in the table.
+
+        Args:
+            index (int): the row index.
+            values (list): the values, in column order.
+
+        """
+        view = self._views.get(index)
+        for position, (column, value) in enumerate(zip(self._columns, values)):
+            if view is not None and column[index] != value:
+                view._update(view._ids[position], value)
+            self._reindex_unique(position, column[index], value, index)
+
+        # The cells of the row are changed together
+        with self._lock:
+            for column, value in zip(self._columns, values):
+                column[index] = value
+        self._ranks.clear()
+
+        row = self._row(index)
+        if not self._deferred(row):
+            self.specific.update_row(row)
+
+    def _display(self, method: str, *args, **kwargs):
+        """
+        Call a method of the specific table, unless in a table batch.
+
+        In a table batch (see `batch`), changes are displayed when the
+        batch ends, comparing the rows with the rows before the batch.
+        Rows changed by other tasks are still displayed, unless rows
+        were added, removed or moved in the batch (the indexes of the
+        specific table wouldn't match anymore).
+
+        Args:
+            method (str): the name of the specific method.
+            Extra arguments are sent to this method.
+
+        """
+        if self._batch_columns is not None:
+            if method != "update_row":
+                self._batch_moved = True
+                return
+
+            if self._batch_moved or _current_task() in self._batch_tasks:
+                return
+
+        getattr(self.specific, method)(*args, **kwargs)
+
+    def _display_changes(self, old_columns: List[List[Any]]):
+        """
+        Display the changes since the old columns, as edits if possible.
+
+        Returns:
+            refreshed (bool): whether the table was refreshed (and the
+                    selected row selected again).
+
+        """
+        edits = self._diff(old_columns)
+        if edits is not None:
+            self.specific.apply_edits(edits)
+            return False
+
+        self.specific.refresh(self)
+        # The selection might have followed the selected row
+        if len(self):
+            self.specific.select_row(self._selected)
+        return True
+
+    def _follow_selection(self, old_columns: List[List[Any]], selected: int):
+        """
+        Select the row which was selected before the rows changed.
+
+        Rows are identified by their first unique column, if any.
+        Otherwise, the same index stays selected, if possible.
+
+        Args:
+            old_columns (list): the columns before the rows changed.
+            selected (int): the index of the selected row in these columns.
+
+        """
+        old_length = len(old_columns[0]) if old_columns else 0
+        if 0 <= selected < old_length and self._unique_positions:
+            position = self._unique_positions[0]
+            selected = self._unique_index(position).get(
+                    old_columns[position][selected], 0)
+        self._selected = max(min(selected, len(self) - 1), 0)
+
+    def _diff(self, old_columns: List[List[Any]]):
+        """
+        Return the edits to display the new rows, or `None`.
+
+        Rows are identified by their first unique column, if any, or
+        else by their index.
+
+        Args:
+            old_columns (list): the columns before the rows changed.
+
+        Returns:
+            edits (list or None): the edits (see `diff_rows`), or `None`
+                    if most rows have changed, in which case refreshing
+                    the table is faster.
+
+        """
+        old_length = len(old_columns[0]) if old_columns else 0
+        length = len(self)
+        if self._unique_positions:
+            position = self._unique_positions[0]
+            old_keys = old_columns[position]
+            new_keys = self._columns[position]
+        else:
+            old_keys = range(old_length)
+            new_keys = range(length)
+
+        visible = self.factory._visible_positions
+        columns = self._columns
+
+        def changed(old, new):
+            return any(old_columns[position][old] != columns[position][new]
+                    for position in visible)
+
+        edits = diff_rows(old_keys, new_keys, changed)
+        if sum(count for _, _, count in edits) * 2 > max(old_length, length):
+            return None
+
+        return edits
+
+    def _set_cell(self, row: AbcRow, position: int, value: Any):
+        """
+        Change the value of one cell, the row being in the table.
+
+        Args:
+            row (Row): the row object.
+            position (int): the column position.
+            value (Any): the new value.
+
+        Raises:
+            ValueError: the value is already used in a unique column.
+
+        """
+        index = row._index
+        column = self._columns[position]
+        if position in self._unique_positions:
+            other = self._unique_index(position).get(value)
+            if other is not None and other != index:
+                raise ValueError(f"the value {value!r} is already used "
+                        f"in the unique column {row._ids[position]!r}")
+
+        row._update(row._ids[position], value)
+        self._reindex_unique(position, column[index], value, index)
+        column[index] = value
+        self._ranks.pop(position, None)
+        if not self._reposition(index, position):
+            self._touch(row)
+
+    def _touch(self, row: AbcRow):
+        """
+        Display a changed row, at most `update_rate` times per second.
+
+        In the event loop, changed rows are marked as dirty and
+        displayed together by `flush`, a row changed several times
+        being displayed only once, with its latest values.  The flush
+        is scheduled once per period, other changes only mark their
+        row.  Outside of the event loop, the row is displayed
+        immediately, unless a flush is already scheduled.  In a batch,
+        the row is displayed when the batch ends.
+
+        Args:
+            row (Row): the changed row.
+
+        """
+        if self._deferred(row):
+            return
+
+        if self._flush_handle is not None:
+            # A flush is already scheduled for this dirty period
+            self._dirty.add(row._index)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None or self.update_rate <= 0:
+            self.specific.update_row(row)
+            return
+
+        self._dirty.add(row._index)
+        delay = self._last_flush + 1 / self.update_rate - monotonic()
+        self._flush_handle = loop.call_later(max(delay, 0), self.flush)
+
+    def flush(self):
+        """
+        Display the rows which have changed since the last flush.
+
+        This is done automatically (see `update_rate`), but you can call
+        this method to display changed rows right away.  Adding,
+        removing or sorting rows also flushes changed rows first.
+
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._last_flush = monotonic()
+
+        dirty = sorted(self._dirty)
+        self._dirty.clear()
+        length = len(self)
+        for index in dirty:
+            if index < length:
+                self._display("update_row", self._row(index))
+
+    def batch(self):
+        """
+        Change the table, displaying all changes at once.
+
+        Inside the `with` block, nothing is sent to the GUI toolkit:
+        rows can be changed, added, removed or sorted.  When the block
+        exits, the rows are compared with the rows before the block
+        (like when setting `rows`) and only the changed rows are
+        displayed.  Table batches can be nested, only the outermost one
+        displays the changes.  The batch belongs to the asyncio task
+        which opened it: rows changed by other tasks in the meantime
+        are displayed as usual, unless rows were added, removed or
+        sorted in the batch.
+
+        Example:
+            >>> with table.batch():
+            ...     table.remove_row(0)
+            ...     for row in table:
+            ...         row.age += 1
+
+        """
+        return self._table_batch()
+
+    @contextmanager
+    def _table_batch(self):
+        """
+        Defer the display of changes until the outermost table batch ends.
+
+        The batch belongs to the tasks which opened it (see
+        `_deferred`): the rows changed by other tasks are displayed as
+        usual, unless rows were added, removed or moved in the batch.
+
+        """
+        task = _current_task()
+        if self._batch_columns is None:
+            # Changes made so far are displayed, others will be compared
+            self.flush()
+            self._batch_columns = [list(column) for column in self._columns]
+            self._batch_selected = self._selected
+            self._batch_moved = False
+
+        tasks = self._batch_tasks
+        tasks[task] = tasks.get(task, 0) + 1
+        try:
+            yield self
+        finally:
+            tasks[task] -= 1
+            if not tasks[task]:
+                del tasks[task]
+                if not tasks:
+                    self._end_batch()
+
+    @contextmanager
+    def _row_batch(self, row: AbcRow):
+        """
+        Defer the display of a row until its outermost batch ends.
+
+        Args:
+            row (Row): the row object, in the table.
+
+        """
+        batch = self._row_batches.get(id(row))
+        if batch is None:
+            batch = self._row_batches[id(row)] = [row, 0, False]
+
+        batch[1] += 1
+        try:
+            yield row
+        finally:
+            batch[1] -= 1
+            if not batch[1]:
+                del self._row_batches[id(row)]
+                if batch[2] and row._values is None:
+                    # The row has changed and is still in the table
+                    if not self._reposition(row._index):
+                        self._touch(row)
+
+    def _deferred(self, row: AbcRow) -> bool:
+        """
+        Return whether the display of a changed row is deferred by a batch.
+
+        A row in a row batch is displayed when its batch ends.  In a
+        table batch, the rows changed by the tasks which opened it are
+        compared when it ends.  Other tasks are affected only if rows
+        were added, removed or moved in the batch.
+
+        Args:
+            row (Row): the changed row.
+
+        """
+        if self._row_batches:
+            batch = self._row_batches.get(id(row))
+            if batch is not None:
+                batch[2] = True
+                return True
+
+        return self._batch_columns is not None and (self._batch_moved
+                or _current_task() in self._batch_tasks)
+
+    def _end_batch(self):
+        """Display the changes made in the table batch."""
+        old_columns = self._batch_columns
+        self._batch_columns = None
+        selected = self._selected
+        if selected == self._batch_selected:
+            self._follow_selection(old_columns, selected)
+            self._display_changes(old_columns)
+        elif not self._display_changes(old_columns):
+            self.specific.select_row(selected)
+
+    def _unique_index(self, position: int) -> Dict[Any, int]:
+        """
+        Return the index of a unique column, building it if needed.
+
+        The index of a unique column is a dictionary with the
+        column values as keys and the row indexes as values.  It's
+        built the first time it's needed, then kept up to date when
+        rows are added, changed, removed or moved: only the index of
+        the rows which have moved is updated.
+
+        Args:
+            position (int): the column position.
+
+        """
+        indexes = self._unique_indexes
+        if indexes is None:
+            indexes = self._unique_indexes = {}
+            for unique in self._unique_positions:
+                column = self._columns[unique]
+                indexes[unique] = dict(zip(column, range(len(column))))
+
+        return indexes[position]
+
+    def _reindex_unique(self, position: int, old: Any, new: Any, index: int):
+        """Update the index of a unique column after a value change."""
+        if self._unique_indexes is None or position not in self._unique_indexes:
+            return
+
+        values = self._unique_indexes[position]
+        if values.get(old) == index:
+            del values[old]
+        values[new] = index
+
+    def _unindex_uniques(self, indexes: Sequence[int]):
+        """
+        Remove rows from the indexes of unique columns.
+
+        This method should be called before the rows are removed,
+        then `_reindex_uniques` when the following rows have moved.
+
+        Args:
+            indexes (sequence of int): the indexes of the removed rows.
+
+        """
+        if self._unique_indexes is None:
+            return
+
+        for position, values in self._unique_indexes.items():
+            column = self._columns[position]
+            for index in indexes:
+                del values[column[index]]
+
+    def _reindex_uniques(self, start: int, stop: Optional[int] = None):
+        """
+        Update the indexes of unique columns after rows have moved.
+
+        The index of the rows from `start` to `stop` is set again,
+        the other rows being where they were.
+
+        Args:
+            start (int): the index of the first row to index again.
+            stop (int, optional): the index after the last row to
+                    index again, the end of the table by default.
+
+        """
+        if self._unique_indexes is None:
+            return
+
+        if stop is None:
+            stop = len(self)
+
+        for position, values in self._unique_indexes.items():
+            column = self._columns[position]
+            values.update(zip(islice(column, start, stop),
+                    range(start, stop)))
+
+    def _check_uniques(self, all_values, replaced: Sequence[int] = ()):
+        """
+        Check the values of unique columns before changing rows.
+
+        Args:
+            all_values (list): the values of each row to add or replace.
+            replaced (sequence, optional): the indexes of the replaced
+                    rows, whose current values are ignored.
+
+        Raises:
+            ValueError: a value is already used in a unique column.
+
+        """
+        positions = self._unique_positions
+        if not positions or not all_values:
+            return
+
+        # If all rows are replaced, current values don't matter
+        everything = len(replaced) == len(self)
+        if not isinstance(replaced, range):
+            replaced = set(replaced)
+
+        for position in positions:
+            index = {} if everything else self._unique_index(position)
+            seen = set()
+            for values in all_values:
+                value = values[position]
+                row = index.get(value)
+                if value in seen or (row is not None and row not in replaced):
+                    column = self.factory._ids[position]
+                    raise ValueError(f"the value {value!r} is already "
+                            f"used in the unique column {column!r}")
+                seen.add(value)
+
     def _create_row(self, index, *args, **kwargs):
         """
         Return a new row, either using the row factory or row class.
@@ -354,7 +1182,7 @@ class Table(Widget):
 
         """
         if self.row_class:
-            self.row_class.widget = self
+            self.row_class._bind(self)
 
         row_class = self.row_class or self.factory
         return row_class(index, *args, **kwargs)
@@ -376,27 +1204,43 @@ class Table(Widget):
             self.add_row(name="table", price=30, quantity=1)
 
         """
-        row = self._create_row(len(self._rows), *args, **kwargs)
+        row = self._create_row(len(self), *args, **kwargs)
         self.update_row(row)
         return row
 
     def update_row(self, row):
         """Update the specified row."""
         index = row._index
-        if index == len(self._rows):
-            # Append the row
-            self._rows.append(row)
-        elif index > len(self._rows):
-            for i in range(len(self._rows), index + 1):
-                row = self._rows[i]
-                self.update_row(row)
-        else:
-            old = self._rows[index]
-            for i, (new_value, old_value) in enumerate(zip(row, old)):
-                if new_value != old_value:
-                    old[i] = new_value
+        values = row._values
+        if values is not None:
+            # This row isn't in the table yet
+            if index == len(self) and self._sort_key is not None:
+                # Insert the row in order
+                self.insert_rows(index, [row])
+                return
+            elif index == len(self):
+                # Append the row
+                self._check_uniques([values])
+                for column, value in zip(self._columns, values):
+                    column.append(value)
+                self._reindex_uniques(index)
+                self._ranks.clear()
+                self._attach(row, index)
+                if self._batch_columns is not None:
+                    # A row was added in a table batch
+                    self._batch_moved = True
+            elif index < len(self):
+                self._check_uniques([values], replaced=[index])
+                self._store(index, values)
+                self._reposition(index)
+                return
+            else:
+                raise IndexError(f"cannot add row {index}, the table "
+                        f"only has {len(self)} rows")
+        elif self._deferred(row):
+            return
 
-        self.specific.update_row(row)
+        self._display("update_row", row)
 
     def remove_row(self, row: Optional[Union[int, AbcRow]]):
         """
@@ -411,46 +1255,443 @@ class Table(Widget):
             return
 
         if isinstance(row, int):
-            row = self._rows[row]
+            row = self[row]
+        else:
+            row = self._row(row._index)
 
+        self.flush()
         index = row._index
-        del self._rows[index]
-        for next_row in self._rows[index:]:
-            next_row._index -= 1
-
-        self.specific.remove_row(row)
-
-    def sort(self, key: Callable = None, reverse: bool = False):
+        self._detach(row)
+        del self._views[index]
+        self._unindex_uniques([index])
+        with self._lock:
+            for column in self._columns:
+                del column[index]
+
+        self._reindex_uniques(index)
+        self._ranks.clear()
+        self._reindex(lambda i: i - 1 if i > index else i)
+        self._display("remove_row", row)
+
+    def sort(self, key: Union[None, str, Sequence[str], Callable] = None,
+            reverse: bool = False):
         """
         Sort the table rows, given an optional key.
 
         This method is similar to the sort method of a list.  You
         can use it to sort using, by default, the first column, or by
-        specifying a column key.
+        specifying a column key.  The key can also be a column ID, or a
+        sequence of column IDs to sort on several columns (a column ID
+        starting with a minus sign sorts this column in descending
+        order).  Sorting by column is much faster than calling a key
+        on every row.
 
         Args:
-            key (callable, optional): the key to call on every row.
+            key (str, sequence of str or callable, optional): the column
+                    ID(s), or the key to call on every row.
             reverse (bool, optional): sort in reverse order.
 
+        Raises:
+            ValueError: a column ID doesn't exist.
+
         Example:
             >>> from operator import attrgetter
             >>> table.sort(key=attrgetter("grade"))
+            >>> table.sort(key="grade")
+            >>> table.sort(key=("grade", "-age"))
 
         """
         if key is None:
-            key = itemgetter(0)
+            key = self._sort_key
+            if key is None:
+                key = (self.factory._ids[0], )
+        elif isinstance(key, str):
+            key = (key, )
+        elif not callable(key):
+            key = tuple(key)
+
+        if self._sort_key is not None and (key, reverse) != (
+                self._sort_key, self._sort_reverse):
+            # Sorted in another order, the table isn't kept sorted anymore
+            self._sort_key = None
+
+        # Sort the row indexes, then move the values of every column
+        self.flush()
+        order = self._sorted_order(key, reverse)
+        if order == list(range(len(order))):
+            return
+
+        kept = () if callable(key) else [position for position, _
+                in self._sort_columns(key)]
+        new_index = self._permute(order, kept)
+        self._display("sort", order)
+        if 0 <= self._selected < len(order):
+            self.selected = new_index(self._selected)
+
+    def keep_sorted(self, key: Union[None, str, Sequence[str], Callable],
+            reverse: bool = False):
+        """
+        Sort the table and keep it sorted.
+
+        New rows are then placed in order, rather than at the bottom,
+        and a row is moved when its sort key changes.  A row is placed
+        with a binary search, and only its insertion is sent to the GUI
+        toolkit, which is much faster than sorting the table again.
+        Sorting the table in another order (see `sort`) stops keeping
+        the table sorted.
+
+        Args:
+            key (str, sequence of str or callable): the column ID(s),
+                    or the key to call on every row, like in `sort`.
+                    If `None`, the table is no longer kept sorted.
+            reverse (bool, optional): sort in reverse order.
+
+        Raises:
+            ValueError: a column ID doesn't exist.
+
+        Example:
+            >>> table.keep_sorted("-date")
+            >>> table.add_row(date=datetime.now(), message="Connected")
+            >>> table[0].message
+            'Connected'
+
+        """
+        if key is None:
+            self._sort_key = None
+            return
+
+        if callable(key):
+            by = None
+        else:
+            key = (key, ) if isinstance(key, str) else tuple(key)
+            by = self._sort_columns(key)
+
+        self._sort_key = key
+        self._sort_by = by
+        self._sort_reverse = reverse
+        self.sort(key, reverse)
+
+    def _sorted_order(self, key: Union[str, Sequence[str], Callable],
+            reverse: bool) -> List[int]:
+        """
+        Return the row indexes, in sorted order.
+
+        Args:
+            key (str, sequence of str or callable): the column ID(s),
+                    or the key to call on every row.
+            reverse (bool): sort in reverse order.
+
+        Raises:
+            ValueError: a column ID doesn't exist.
+
+        """
+        length = len(self)
+        if callable(key):
+            views = self._views
+            view = self.factory._view
+            keys = [key(views.get(index) or view(index))
+                    for index in range(length)]
+        else:
+            keys = self._sort_keys([key] if isinstance(key, str) else key)
+
+        return sorted(range(length), key=keys.__getitem__, reverse=reverse)
+
+    def _permute(self, order: List[int],
+            kept: Iterable[int] = ()) -> Callable[[int], int]:
+        """
+        Move the rows in a new order, without displaying them.
+
+        Args:
+            order (list of int): the former index of each row, in
+                    the new order.
+            kept (iterable of int, optional): the positions of the
+                    columns whose ranks are kept (the columns the
+                    table was sorted on), the other ranks are dropped.
+
+        Returns:
+            new_index (callable): return the new index of a row,
+                    given its former index.
+
+        """
+        move = permutation(order)
+        self._columns = [move(column) for column in self._columns]
+        ranks = self._ranks
+        self._ranks = {position: move(ranks[position])
+                for position in kept if position in ranks}
+        self._reindex_uniques(0)
+
+        if len(self._views) < 16:
+            # Searching a few rows is faster than inverting the order
+            new_index = order.index
+        else:
+            new_indexes = [0] * len(order)
+            for new, old in enumerate(order):
+                new_indexes[old] = new
+            new_index = new_indexes.__getitem__
+
+        self._reindex(new_index)
+        return new_index
+
+    def _sort_keys(self, columns: Sequence[str]) -> List[int]:
+        """
+        Return the sort key of every row, to sort by columns.
+
+        The key of a row combines the ranks of its values in each
+        column (see `_column_ranks`) in a single integer.
+
+        Args:
+            columns (sequence of str): the column IDs, a column ID
+                    starting with a minus sign sorts in descending order.
+
+        Raises:
+            ValueError: a column ID doesn't exist.
+
+        """
+        keys = None
+        for position, descending in self._sort_columns(columns):
+            # Ranks are between 0 and the number of rows (excluded)
+            ranks = self._column_ranks(position)
+            size = len(ranks)
+            if descending:
+                ranks = [size - 1 - rank for rank in ranks]
+
+            if keys is None:
+                keys = ranks
+            else:
+                keys = [key * size + rank for key, rank in zip(keys, ranks)]
 
-        selected = self._rows[self._selected]
-        self._rows.sort(key=key, reverse=reverse)
-        for index, row in zip(range(len(self._rows)), self._rows):
-            row._index = index
+        return keys
 
-        self.specific.sort(key=key, reverse=reverse)
-        self.selected = selected
+    def _sort_columns(self, columns: Sequence[str]) -> List[Tuple[int, bool]]:
+        """
+        Return the positions of the columns to sort on.
+
+        Args:
+            columns (sequence of str): the column IDs, a column ID
+                    starting with a minus sign sorts in descending order.
+
+        Returns:
+            by (list): the `(position, descending)` tuples.
+
+        Raises:
+            ValueError: a column ID doesn't exist.
+
+        """
+        by = []
+        for col in columns:
+            descending = col.startswith("-")
+            col = col[1:] if descending else col
+            position = self.factory._positions.get(col)
+            if position is None:
+                raise ValueError(f"unknown column: {col!r}")
+            by.append((position, descending))
+
+        if not by:
+            raise ValueError("no column to sort on")
+
+        return by
+
+    def _sort_key_of(self, row: AbcRow):
+        """Return the sort key of a row, the table being kept sorted."""
+        by = self._sort_by
+        if by is None:
+            return self._sort_key(row)
+
+        return tuple([Descending(row._get(position)) if descending
+                else row._get(position) for position, descending in by])
+
+    def _sorts_before(self, key, other) -> bool:
+        """Return whether a sort key goes before another one."""
+        return other < key if self._sort_reverse else key < other
+
+    def _sorted_index(self, key, lo: int, hi: int) -> int:
+        """
+        Return where to place a row with this sort key, with a binary search.
+
+        Rows with the same sort key stay first.
+
+        Args:
+            key: the sort key of the row to place.
+            lo (int): the first index to search.
+            hi (int): the index after the last one to search.
+
+        """
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if self._sorts_before(key, self._sort_key_of(self._row(middle))):
+                hi = middle
+            else:
+                lo = middle + 1
+
+        return lo
+
+    def _insert_sorted(self, all_values: List[List[Any]],
+            attached: List[Tuple[int, AbcRow]]):
+        """
+        Insert rows in order, the table being kept sorted.
+
+        The rows are sorted, then placed with a binary search and all
+        inserted at once.
+
+        Args:
+            all_values (list): the values of each row to insert.
+            attached (list): the `(position, row)` tuples of the row
+                    objects to attach, by position in `all_values`.
+
+        """
+        attached = dict(attached)
+        keys = []
+        for position, values in enumerate(all_values):
+            row = attached.get(position)
+            if row is None:
+                row = self.factory._view(-1)
+                _set_values(row, values)
+            keys.append(self._sort_key_of(row))
+
+        # Rows are placed in order, so each search starts at the last one
+        length = len(self)
+        order = sorted(range(len(keys)), key=keys.__getitem__,
+                reverse=self._sort_reverse)
+        points = []
+        point = 0
+        for position in order:
+            point = self._sorted_index(keys[position], point, length)
+            points.append(point)
+
+        columns = []
+        for column_position, column in enumerate(self._columns):
+            new_column = []
+            previous = 0
+            for point, position in zip(points, order):
+                new_column.extend(column[previous:point])
+                new_column.append(all_values[position][column_position])
+                previous = point
+            new_column.extend(column[previous:])
+            columns.append(new_column)
+        self._columns = columns
+
+        if points:
+            self._reindex_uniques(points[0])
+        self._ranks.clear()
+        self._reindex(lambda i: i + bisect_right(points, i))
+        indexes = [point + shift for shift, point in enumerate(points)]
+        for index, position in zip(indexes, order):
+            row = attached.get(position)
+            if row is not None:
+                self._attach(row, index)
+
+        if length:
+            self._selected += bisect_right(points, self._selected)
+
+        # Send consecutive rows together
+        runs = _runs(indexes)
+        if len(runs) == 1:
+            self._display("insert_rows", *runs[0])
+        else:
+            self._display("apply_edits", [("insert", index, count)
+                    for index, count in runs])
+
+    def _reposition(self, index: int, position: Optional[int] = None) -> bool:
+        """
+        Move a changed row if needed, the table being kept sorted.
+
+        Args:
+            index (int): the index of the changed row.
+            position (int, optional): the position of the changed
+                    column, if only one column has changed.
+
+        Returns:
+            moved (bool): whether the row was moved (and displayed).
+
+        """
+        if self._sort_key is None:
+            return False
+
+        if self._row_batches:
+            batch = self._row_batches.get(id(self._views.get(index)))
+            if batch is not None:
+                # The row will be moved when its batch ends
+                batch[2] = True
+                return True
+
+        by = self._sort_by
+        if position is not None and by is not None and all(
+                sorted_position != position for sorted_position, _ in by):
+            return False
+
+        key = self._sort_key_of(self._row(index))
+        length = len(self)
+        if index > 0 and self._sorts_before(key,
+                self._sort_key_of(self._row(index - 1))):
+            new_index = self._sorted_index(key, 0, index)
+        elif index + 1 < length and self._sorts_before(
+                self._sort_key_of(self._row(index + 1)), key):
+            new_index = self._sorted_index(key, index + 1, length) - 1
+        else:
+            return False
+
+        self.flush()
+        with self._lock:
+            for column in self._columns:
+                column.insert(new_index, column.pop(index))
+        self._reindex_uniques(min(index, new_index),
+                max(index, new_index) + 1)
+        self._ranks.clear()
+
+        def move(i):
+            if i == index:
+                return new_index
+            elif new_index <= i < index:
+                return i + 1
+            elif index < i <= new_index:
+                return i - 1
+            return i
+
+        self._reindex(move)
+        if 0 <= self._selected < length:
+            self._selected = move(self._selected)
+        self._display("apply_edits", [("delete", index, 1),
+                ("insert", new_index, 1)])
+        return True
+
+    def _column_ranks(self, position: int) -> List[int]:
+        """
+        Return the rank of every value in a column, building it if needed.
+
+        The rank of a value is its position in the sorted column, equal
+        values having the same rank.  Ranks are integers, faster to
+        compare than most values, and they follow the rows when they're
+        sorted on this column.  They are dropped when the column changes
+        or when the table is sorted on other columns.  So sorting again
+        on a column only compares integers.
+
+        Args:
+            position (int): the column position.
+
+        """
+        ranks = self._ranks.get(position)
+        if ranks is None:
+            column = self._columns[position]
+            ranks = [0] * len(column)
+            rank = -1
+            previous = NO_VALUE
+            for index in sorted(range(len(column)), key=column.__getitem__):
+                value = column[index]
+                if previous is NO_VALUE or value != previous:
+                    rank += 1
+                    previous = value
+                ranks[index] = rank
+
+            self._ranks[position] = ranks
+
+        return ranks
 
     def get_from_unique(self, column, value):
         """Return the row matching a unique column or None.
 
+        Unique columns are indexed (see `_unique_index`), so
+        the row is found without browsing the table.
+
         Args:
             column (str): the column.  It must be unique.
             value (Any): the row value.
@@ -459,13 +1700,12 @@ class Table(Widget):
         if column not in self._uniques:
             raise ValueError(f"the column {column!r} isn't uniquely declared")
 
-        rows = [row for row in self._rows if getattr(row, column) == value]
-        if rows:
-            row = rows[0]
-        else:
-            row = None
+        index = self._unique_index(self.factory._positions[column])
+        row = index.get(value)
+        if row is None:
+            return None
 
-        return row
+        return self._row(row)
 
 
 def build_factory(widget, cols):
@@ -475,3 +1715,151 @@ def build_factory(widget, cols):
             "columns": tuple(cols),
     })
     return factory
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    """Return the running asyncio task, `None` outside of a task."""
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+def permutation(order: Sequence[int]) -> Callable[[Sequence], List]:
+    """
+    Return a function moving the items of a sequence in a new order.
+
+    Args:
+        order (sequence of int): the former index of each item, in
+                the new order.
+
+    Returns:
+        move (callable): a function returning the list of items of
+                a sequence, in the new order.
+
+    """
+    if len(order) < 2:
+        return lambda values: [values[index] for index in order]
+
+    get = itemgetter(*order)
+    return lambda values: list(get(values))
+
+
+class Descending:
+
+    """A value sorted in descending order, to keep a table sorted."""
+
+    __slots__ = ("value", )
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def longest_increasing(values: Sequence[int]) -> List[int]:
+    """
+    Return the positions of a longest increasing subsequence.
+
+    Args:
+        values (sequence of int): the values, all different.
+
+    Returns:
+        positions (list of int): the positions in `values` of a longest
+                strictly increasing subsequence, in order.
+
+    """
+    # tails[k]: position of the smallest last value of an increasing
+    # subsequence of length k + 1, with this value in `tail_values`
+    tails = []
+    tail_values = []
+    previous = [-1] * len(values)
+    for position, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        if k > 0:
+            previous[position] = tails[k - 1]
+        if k == len(tails):
+            tails.append(position)
+            tail_values.append(value)
+        else:
+            tails[k] = position
+            tail_values[k] = value
+
+    positions = []
+    position = tails[-1] if tails else -1
+    while position >= 0:
+        positions.append(position)
+        position = previous[position]
+
+    return positions[::-1]
+
+def diff_rows(old_keys: Sequence[Any], new_keys: Sequence[Any],
+        changed: Callable[[int, int], bool]) -> List[Tuple[str, int, int]]:
+    """
+    Return the edits to turn a sequence of rows into another.
+
+    Rows are identified by keys (the value of a unique column, or their
+    index), which must be unique in each sequence.  Rows whose key is
+    only in the old sequence are deleted, rows whose key is only in the
+    new sequence are inserted.  The rows present in both sequences keep
+    their place if they belong to the longest subsequence already in
+    order, the others are moved (deleted, then inserted again).
+
+    Args:
+        old_keys (sequence): the keys of the old rows.
+        new_keys (sequence): the keys of the new rows.
+        changed (callable): called with the old and new index of a row
+                which hasn't moved, should return whether it needs to
+                be updated.
+
+    Returns:
+        edits (list): the `(operation, index, count)` tuples to apply
+                in order:  first `("delete", index, count)` with old
+                indexes (from the bottom), then `("insert", index,
+                count)` with new indexes (from the top), then
+                `("update", index, count)` with new indexes.
+
+    """
+    new_positions = {key: index for index, key in enumerate(new_keys)}
+    deleted = []
+    kept = []
+    for old, key in enumerate(old_keys):
+        new = new_positions.get(key)
+        if new is None:
+            deleted.append(old)
+        else:
+            kept.append((old, new))
+
+    stable = longest_increasing([new for _, new in kept])
+    in_place = [kept[position] for position in stable]
+    if len(in_place) < len(kept):
+        moved = set(stable)
+        deleted.extend(old for position, (old, _) in enumerate(kept)
+                if position not in moved)
+        deleted.sort()
+
+    present = {new for _, new in in_place}
+    inserted = [new for new in range(len(new_keys)) if new not in present]
+    updated = [new for old, new in in_place if changed(old, new)]
+
+    edits = [("delete", index, count) for index, count in
+            reversed(_runs(deleted))]
+    edits.extend(("insert", index, count) for index, count in
+            _runs(inserted))
+    edits.extend(("update", index, count) for index, count in
+            _runs(updated))
+    return edits
+
+def _runs(indexes: Sequence[int]) -> List[Tuple[int, int]]:
+    """Group sorted indexes in `(first index, count)` runs."""
+    runs = []
+    for index in indexes:
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1])
+
+    return [(index, count) for index, count in runs]
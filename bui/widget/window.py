@@ -18,9 +18,13 @@ from pathlib import Path
 import sys
 from typing import Optional, Sequence, Tuple, Type, Union
 
+from bui.compile import load_compiled
+from bui.control.base import BindingPlan
 from bui.control.exceptions import StopControl
-from bui.control.log import logger as control_logger
-from bui.layout.parser import BUILayoutParser
+from bui.control.log import tracer
+from bui.layout.cache import CACHE as LAYOUT_CACHE
+from bui.layout.layout import Layout
+from bui.layout.leaf import LayoutInstance
 from bui.tasks import cancel_all, run_remaining
 from bui.widget.base import Widget, CachedProperty
 from bui import widget as wg
@@ -118,6 +122,7 @@ class Window(Widget, metaclass=MetaWindow):
 
     # Class attributes, to be overridden by instance attributes
     parsed_layout = None
+    single_thread = False # See `bui.start`
     _bui_parent = None
 
     def __init__(self, leaf):
@@ -160,39 +165,85 @@ class Window(Widget, metaclass=MetaWindow):
         self.specific.title = title
 
     @classmethod
-    def parse_layout(cls, Window, tag_name="window", **kwargs):
+    def layout_template(cls) -> Layout:
         """
-        Determine where the layout is and try to parse it, return a window.
+        Return the layout template of this class, parsing it if needed.
+
+        The template is a complete and frozen layout, shared by all
+        the windows created from this class.  It is kept on the class
+        itself (subclasses have their own template).
+
+        Returns:
+            template (Layout): the frozen layout.
 
         Raises:
             ValueError: the layout couldn't be parsed.
 
         """
+        template = cls.__dict__.get("_layout_template")
+        if template is not None:
+            return template
+
+        error = None
         if cls.layout:
             layout = cls.layout
 
             # Try to find the first line and the proper file,
             # since the layout is defined in code
-            qualname = cls.__qualname__
+            qualname = key = cls.__qualname__
             file, line = MetaWindow._marks.get(qualname, ("__unknown__", 0))
-            parser = BUILayoutParser(file, line)
         else:
             bui = cls.bui
             if not bui:
-                filename = Path(inspect.getsourcefile(cls))
+                filename = Path(inspect.getsourcefile(cls)
+                        or inspect.getfile(cls))
                 if filename.is_absolute():
                     relative = filename.relative_to(Path().absolute())
                     bui = f"{relative.parent}/{relative.stem}.bui"
                 else:
                     bui = f"{filename.parent}/{filename.stem}.bui"
 
-            with open(bui, 'r', encoding="utf-8") as file:
-                layout = file.read()
+            key = Path(bui).name
+            try:
+                with open(bui, 'r', encoding="utf-8") as file:
+                    layout = file.read()
+            except OSError as err:
+                # The layout file might be missing in a frozen
+                # application, if its layout has been compiled
+                layout, error = None, err
+
+            file, line, qualname = bui, 0, ""
+
+        # Prefer the compiled layout (see `python -m bui.compile`)
+        parsed_layout = load_compiled(cls, key, layout)
+        if parsed_layout is None:
+            if layout is None:
+                raise error
+
+            parsed_layout = LAYOUT_CACHE.parse(layout, file, line, qualname)
+
+        # Complete all the components, which might deduce their identifiers
+        for component in parsed_layout.flat:
+            component.complete()
+        parsed_layout.freeze()
+        cls._layout_template = parsed_layout
+        return parsed_layout
 
-            parser = BUILayoutParser(bui)
+    @classmethod
+    def parse_layout(cls, Window, tag_name="window", **kwargs):
+        """
+        Determine where the layout is and try to parse it, return a window.
+
+        The layout is only parsed once for each window class: the
+        completed layout is frozen and kept as a template (see
+        `layout_template`).  Creating another window from the same
+        class only creates its widgets.
 
-        parser.feed(layout)
-        parsed_layout = parser.layout
+        Raises:
+            ValueError: the layout couldn't be parsed.
+
+        """
+        parsed_layout = LayoutInstance(cls.layout_template())
         window_leaf = parsed_layout.get(tag_name)
         if window_leaf is None:
             raise ValueError("the specified layout doesn't contain a <window> description")
@@ -202,7 +253,6 @@ class Window(Widget, metaclass=MetaWindow):
         widgets = []
         ids = {}
         for leaf in parsed_layout.flat:
-            leaf.complete()
             if not leaf.has_widget:
                 continue
             elif leaf is window_leaf:
@@ -228,10 +278,18 @@ class Window(Widget, metaclass=MetaWindow):
         window._ids = ids
 
         # Call the `_init` method on all generic widgets
-        control_logger.debug("  Binding control methods...")
+        if tracer.enabled and tracer.log:
+            tracer.logger.debug("  Binding control methods...")
+
+        plan = cls.__dict__.get("_binding_plan")
+        if plan is None:
+            plan = BindingPlan(window, widgets)
+            for widget in widgets:
+                widget._bind_controls(window, plan)
+            cls._binding_plan = plan
 
+        plan.apply(window, widgets)
         for widget in widgets:
-            widget._bind_controls(window)
             widget._init()
 
         window.parsed_layout = parsed_layout
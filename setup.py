@@ -13,11 +13,10 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/vincent-lg/bui/",
     packages=setuptools.find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires = [
         'Logbook == 1.5.2',
         'wxPython == 4.2.0; platform_system=="Windows"',
-        'Pypubsub == 4.0.3; platform_system=="Windows"',
     ],
     extras_require={
         'demo':  [
@@ -1,8 +1,24 @@
 """Register fixtures for pytest."""
 
+import os
+import shutil
+import tempfile
+
+# Use the headless backend, unless another one is forced
+os.environ.setdefault("BUI_GUI", "headless")
+
 from bui.tools import forbid_start
 import pytest
 
+def pytest_configure(config):
+    """Cache layouts in a temporary directory, removed after the tests."""
+    config.layout_cache = tempfile.mkdtemp(prefix="bui-layouts-")
+    os.environ["BUI_CACHE_DIR"] = config.layout_cache
+
+def pytest_unconfigure(config):
+    """Remove the temporary directory of cached layouts."""
+    shutil.rmtree(config.layout_cache, ignore_errors=True)
+
 @pytest.fixture(autouse=True)
 def no_BUI_start():
     """This fixture makes sure BUI will not start and enter a blocking loop."""
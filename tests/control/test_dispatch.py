@@ -0,0 +1,43 @@
+"""Test the dispatch table, indexing control methods by options."""
+
+from bui.control.base import DispatchTable
+
+def on_press():
+    pass
+
+def on_press_a():
+    pass
+
+def on_press_ctrl_a():
+    pass
+
+def on_press_a_again():
+    pass
+
+def test_match():
+    """Sub-controls are found by their options."""
+    table = DispatchTable([
+        ({}, on_press),
+        ({"key": "a"}, on_press_a),
+        ({"key": "ctrl_a"}, on_press_ctrl_a),
+        ({"key": "a"}, on_press_a_again),
+    ])
+
+    assert table.main is on_press
+    assert table.match({"key": "a", "raw_key": "a"}) is on_press_a
+    assert table.match({"key": "ctrl_a", "raw_key": "a"}) is on_press_ctrl_a
+    assert table.match({"key": "b", "raw_key": "b"}) is None
+    assert table.match({"raw_key": "a"}) is None
+    assert table.match({}) is None
+
+def test_order():
+    """With several matching sub-controls, the first bound is used."""
+    table = DispatchTable([
+        ({"unicode": "a", "shift": False}, on_press_a_again),
+        ({"unicode": "a"}, on_press_a),
+    ])
+
+    assert table.main is None
+    assert table.match({"unicode": "a", "shift": False}) is on_press_a_again
+    assert table.match({"unicode": "a", "shift": True}) is on_press_a
+    assert table.match({"unicode": ["unhashable"]}) is None
@@ -6,6 +6,7 @@ linked to controls, and that firing the controls does call the method.
 """
 
 from bui import Window, start
+from bui.control import CONTROLS
 
 from tests.control.helpers import is_registered
 
@@ -221,3 +222,100 @@ def test_alias_widget_control():
     # Check that the on_press_b method is called when firing the control
     widget._process_control("press", {"key": "b", "raw_key": "b"})
     assert window.pressed, "The control method wasn't called."
+
+def test_binding_plan():
+    """Windows of the same class share a binding plan, not their methods."""
+    class Example(Window):
+
+        layout = mark("""
+          <window title="Test on the binding plan">
+            <button x=2 y=2 id=quit>Quit</button>
+          </window>
+        """)
+
+        def on_press(self):
+            self.pressed = True
+
+        def on_click_quit(self):
+            self.should_quit = True
+
+    first = start(Example)
+    plan = Example._binding_plan
+    second = start(Example)
+    assert Example._binding_plan is plan
+    assert is_registered(second, "press", second.on_press)
+    assert is_registered(second["quit"], "click", second.on_click_quit)
+
+    # Firing a control on the second window doesn't affect the first one
+    first.should_quit = second.should_quit = False
+    second["quit"]._process_control("click")
+    assert second.should_quit
+    assert not first.should_quit
+
+def test_call_plan():
+    """The arguments of a control method are only inspected once."""
+    from bui.control.press import Press
+
+    class Example(Window):
+
+        layout = mark("""
+          <window title="Test on call plans">
+          </window>
+        """)
+
+        def on_press(self, key, control):
+            self.pressed = (key, control)
+
+        async def on_release(self, key):
+            pass
+
+    window = start(Example)
+    window._process_control("press", {"key": "a", "raw_key": "a"})
+    assert window.pressed[0] == "a"
+    assert isinstance(window.pressed[1], Press)
+
+    plan = Press._call_plan(window.on_press)
+    assert plan == (("key", ), True, False, False)
+    assert Press._call_plan(window.on_press) is plan
+    assert Press._call_plan(window.on_release)[3]
+
+def test_handled():
+    """Widgets know which controls are handled by them or their parents."""
+    class Example(Window):
+
+        layout = mark("""
+          <window title="Test on handled controls">
+            <button x=2 y=2 id=ok>OK</button>
+            <text x=2 y=3>Name</text>
+          </window>
+        """)
+
+        def on_press_ctrl_s(self):
+            pass
+
+        def on_type_in_name(self):
+            pass
+
+    window = start(Example)
+    assert "press" in window.handled
+    assert "type" not in window.handled
+    assert "close" in window.handled
+
+    # Controls handled by the window are handled by its widgets too
+    name = window["name"]
+    assert {"press", "type"} <= name.handled
+    assert "release" not in name.handled
+
+    # Buttons have hooks for the click and press controls
+    ok = window["ok"]
+    assert {"click", "press"} <= ok.handled
+    assert "type" not in ok.handled
+
+    # Methods bound later are handled too
+    Example.on_release_name = lambda self: None
+    CONTROLS["release"]._bind_methods(name, window)
+    assert "release" in name.handled
+    assert "release" not in ok.handled
+    Example.on_release = lambda self: None
+    CONTROLS["release"]._bind_methods(window, window)
+    assert "release" in ok.handled
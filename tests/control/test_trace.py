@@ -0,0 +1,69 @@
+"""Test the tracer of controls."""
+
+import pytest
+
+from bui import Window, start
+from bui.control.log import tracer
+
+class Example(Window):
+
+    layout = mark("""
+      <window title="Test on traced controls">
+        <button x=2 y=2 id=quit>Quit</button>
+      </window>
+    """)
+
+    def on_press_a(self):
+        pass
+
+    def on_click_quit(self):
+        pass
+
+@pytest.fixture
+def trace():
+    """Enable the tracer, without logging, and disable it afterward."""
+    tracer.events.clear()
+    yield tracer
+    tracer.disable()
+    tracer.events.clear()
+
+def test_disabled(trace):
+    """A disabled tracer records nothing."""
+    window = start(Example)
+    window._process_control("press", {"key": "a", "raw_key": "a"})
+    assert not trace.events
+
+def test_events(trace):
+    """An enabled tracer records structured events."""
+    trace.enable(log=False)
+    window = start(Example)
+    kinds = [(event.kind, event.method) for event in trace.events]
+    assert ("bind", "on_press_a") in kinds
+    assert ("bind", "on_click_quit") in kinds
+
+    trace.events.clear()
+    window._process_control("press", {"key": "a", "raw_key": "a"})
+    fire, call, ret = trace.events
+    assert fire.kind == "fire"
+    assert fire.control == "press"
+    assert fire.options == {"key": "a", "raw_key": "a"}
+    assert (call.kind, call.method, call.details) == (
+            "call", "on_press_a", {"child": True})
+    assert ret.kind == "return"
+    assert ret.duration >= 0
+    assert "on_press_a" in trace.format(call)
+
+def test_filters(trace):
+    """Filters are applied when events are emitted."""
+    trace.enable([("quit", "")], log=False)
+    window = start(Example)
+    assert {event.wid for event in trace.events} == {"quit"}
+
+    trace.events.clear()
+    window._process_control("press", {"key": "a", "raw_key": "a"})
+    window["quit"]._process_control("click")
+    assert {event.control for event in trace.events} == {"click"}
+
+    assert trace.accepts("other", "click") is False
+    trace.filters[:] = [("", "click")]
+    assert trace.accepts("other", "click")
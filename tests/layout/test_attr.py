@@ -2,7 +2,7 @@
 
 import pytest
 
-from bui.layout.attr import Attr
+from bui.layout.attr import Attr, AttrSchema
 
 def test_mandatory():
     """Test a mandatory attribute."""
@@ -68,3 +68,16 @@ def test_if_present():
     assert result
     result = attr.prepare(object())
     assert result
+
+def test_schema():
+    """Test the schema of attributes, indexed for the parser."""
+    schema = AttrSchema((
+        Attr("title", "The window title"),
+        Attr("read-only", "Read only", default=False, if_present=True),
+        Attr("name", "The widget name", default=lambda: "unnamed"),
+    ))
+
+    assert set(schema.by_name) == {"title", "read-only", "name"}
+    assert [attr.name for attr in schema.required] == ["title"]
+    assert [attr.name for attr in schema.dynamic] == ["name"]
+    assert schema.defaults == {"read_only": False}
@@ -0,0 +1,91 @@
+"""Test the layout cache, storing compiled layouts."""
+
+import pytest
+
+from bui.layout import cache as cache_module
+from bui.layout.cache import LayoutCache, cache_directory, layout_hash
+from bui.layout.parser import BUILayoutParser
+
+LAYOUT = """
+    <window title="Cached window">
+      <button x=1 y=2 id=ok>OK</button>
+      <text x=1 y=3>Name</text>
+    </window>
+"""
+
+@pytest.fixture
+def cache(tmp_path):
+    """Return a layout cache writing in a temporary directory."""
+    return LayoutCache(directory=tmp_path)
+
+def test_parse(cache):
+    """Parsing through the cache returns a complete layout."""
+    layout = cache.parse(LAYOUT, "test.bui")
+    window = layout.get("window")
+    assert window.title == "Cached window"
+    button = layout.get("button")
+    assert button.x == 1
+    assert button.y == 2
+    assert button.id == "ok"
+    assert button.data == "OK"
+    assert button.parent is window
+
+def test_memory(cache, monkeypatch):
+    """A layout in memory isn't parsed again."""
+    first = cache.parse(LAYOUT, "test.bui")
+    monkeypatch.setattr(BUILayoutParser, "feed", None)
+    second = cache.parse(LAYOUT, "test.bui")
+
+    # Each call returns a different copy of the same layout
+    assert second is not first
+    assert str(second) == str(first)
+
+def test_disk(cache, tmp_path, monkeypatch):
+    """A layout on disk isn't parsed again, even in a new cache."""
+    cache.parse(LAYOUT, "test.bui")
+    assert list(tmp_path.iterdir())
+
+    monkeypatch.setattr(BUILayoutParser, "feed", None)
+    other = LayoutCache(directory=tmp_path)
+    layout = other.parse(LAYOUT, "test.bui")
+    assert layout.get("button").id == "ok"
+
+def test_invalidate(cache):
+    """Changing the layout content invalidates the cached layout."""
+    cache.parse(LAYOUT, "test.bui")
+    changed = LAYOUT.replace("Cached window", "Changed window")
+    assert layout_hash(changed) != layout_hash(LAYOUT)
+    layout = cache.parse(changed, "test.bui")
+    assert layout.get("window").title == "Changed window"
+
+def test_errors(cache):
+    """Errors are reported and invalid layouts aren't cached."""
+    with pytest.raises(ValueError):
+        cache.parse("<window></window>", "test.bui")
+
+    with pytest.raises(ValueError):
+        cache.parse("<window></window>", "test.bui")
+
+    assert len(cache) == 0
+
+def test_stale_formats(cache, tmp_path, monkeypatch):
+    """Entries of older formats are removed."""
+    cache.parse(LAYOUT, "test.bui")
+    old, = tmp_path.iterdir()
+    monkeypatch.setattr(cache_module, "FORMAT", cache_module.FORMAT + 1)
+    LayoutCache(directory=tmp_path).parse(LAYOUT, "test.bui")
+    new, = tmp_path.iterdir()
+    assert new != old
+
+def test_directory(tmp_path, monkeypatch):
+    """The cache directory can be changed or disabled."""
+    monkeypatch.setenv("BUI_CACHE_DIR", str(tmp_path))
+    assert cache_directory() == tmp_path
+    LayoutCache().parse(LAYOUT, str(tmp_path / "app" / "test.bui"))
+    assert not (tmp_path / "app").exists()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    monkeypatch.setenv("BUI_CACHE_DIR", "")
+    assert cache_directory() is None
+    monkeypatch.delenv("BUI_CACHE_DIR")
+    assert cache_directory() is not None
@@ -0,0 +1,61 @@
+"""Test the ahead-of-time layout compiler."""
+
+import pytest
+
+from bui import compile as bui_compile
+from bui.layout.parser import BUILayoutParser
+
+SOURCE = '''
+class MainWindow:
+
+    layout = mark("""
+      <window title="Compiled window">
+        <button x=1 y=2 id=ok>OK</button>
+        <text x=1 y=3>Name</text>
+      </window>
+    """)
+'''
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    """Write a Python module with a layout and compile it."""
+    path = tmp_path / "compiled_app.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(bui_compile, "_MODULES", {})
+    assert bui_compile.main(["-q", str(tmp_path)]) == 0
+    assert (tmp_path / "compiled_app_bui.py").exists()
+
+    class MainWindow:
+        pass
+
+    MainWindow.__module__ = "compiled_app"
+    return MainWindow
+
+def layout_text():
+    """Return the layout text, as found by the compiler."""
+    return SOURCE.split('"""')[1]
+
+def test_compiled(module):
+    """The compiled layout is identical to the parsed one."""
+    text = layout_text()
+    layout = bui_compile.load_compiled(module, "MainWindow", text)
+    assert layout is not None
+    parser = BUILayoutParser("compiled_app.py", 0)
+    parser.feed(text)
+    assert str(layout) == str(parser.layout)
+
+    button = layout.get("button")
+    assert button.id == "ok"
+    assert button.data == "OK"
+    assert button.parent is layout.get("window")
+
+def test_outdated(module):
+    """A compiled layout isn't used if the layout has changed."""
+    text = layout_text().replace("Compiled window", "Changed window")
+    assert bui_compile.load_compiled(module, "MainWindow", text) is None
+    assert bui_compile.load_compiled(module, "Unknown", text) is None
+
+    # Without layout text (frozen application), the compiled layout is used
+    layout = bui_compile.load_compiled(module, "MainWindow")
+    assert layout.get("window").title == "Compiled window"
@@ -0,0 +1,63 @@
+"""Test the layout, its flattened list and indexes."""
+
+from bui.layout.parser import BUILayoutParser
+
+LAYOUT = """
+    <window title="Indexed window">
+      <menubar>
+        <menu name=File>
+          <item>Open</item>
+          <item id=leave>Quit</item>
+        </menu>
+      </menubar>
+      <button x=1 y=2 id=ok>OK</button>
+      <button x=2 y=2 id=cancel>Cancel</button>
+    </window>
+"""
+
+def parse(text=LAYOUT):
+    """Parse and return a layout."""
+    parser = BUILayoutParser("test.bui")
+    parser.feed(text)
+    return parser.layout
+
+def test_flat():
+    """The flattened list follows the layout order, parents first."""
+    layout = parse()
+    tags = [component.tag_name for component in layout.flat]
+    assert tags == ["window", "menubar", "menu", "item", "item",
+            "button", "button"]
+
+    # The list is only built once
+    assert layout.flat is layout.flat
+
+def test_get():
+    """Components can be searched by tag name and identifier."""
+    layout = parse()
+    assert layout.get("button").id == "ok"
+    assert [button.id for button in layout.get_all("button")] == [
+            "ok", "cancel"]
+    assert layout.get("checkbox") is None
+    assert layout.get_all("checkbox") == []
+    assert layout.get_id("cancel").data == "Cancel"
+    assert layout.get_id("leave").data == "Quit"
+    assert layout.get_id("unknown") is None
+
+def test_invalidate():
+    """Completing components updates the identifiers once invalidated."""
+    layout = parse()
+    assert layout.get_id("open") is None
+    for component in layout.flat:
+        component.complete()
+
+    layout.invalidate()
+    assert layout.get_id("open").data == "Open"
+
+    # Adding a component invalidates the indexes as well
+    window = layout.get("window")
+    button = type(layout.get("button"))(layout, window, x=3, y=2,
+            id="help", set="", disabled=False, set_true=False,
+            set_false=False)
+    layout.add(button, window)
+    assert layout.get_id("help") is button
+    assert layout.flat[-1] is button
@@ -0,0 +1,63 @@
+"""Test frozen layout templates and their per-window leaves."""
+
+import pytest
+
+from bui.layout.leaf import LayoutInstance
+from bui.layout.parser import BUILayoutParser
+
+LAYOUT = """
+    <window title="Template">
+      <menubar>
+        <menu name=File>
+          <item>Open</item>
+        </menu>
+      </menubar>
+      <button x=1 y=2>OK</button>
+    </window>
+"""
+
+@pytest.fixture
+def template():
+    """Return a complete and frozen layout."""
+    parser = BUILayoutParser("test.bui")
+    parser.feed(LAYOUT)
+    layout = parser.layout
+    for component in layout.flat:
+        component.complete()
+    layout.freeze()
+    return layout
+
+def test_frozen(template):
+    """A frozen layout and its components can't be modified."""
+    button = template.get("button")
+    assert button.id == "ok"
+    with pytest.raises(AttributeError):
+        button.id = "other"
+
+    with pytest.raises(ValueError):
+        template.add(button, template.get("window"))
+
+    # Invalidating a frozen layout keeps its indexes
+    template.invalidate()
+    assert template.get_id("open").data == "Open"
+
+def test_instance(template):
+    """Leaves give access to their component attributes."""
+    first = LayoutInstance(template)
+    second = LayoutInstance(template)
+    window = first.get("window")
+    assert window.title == "Template"
+    assert window.parent is None
+    assert [leaf.tag_name for leaf in window.children] == [
+            "menubar", "button"]
+
+    item = first.get_id("open")
+    assert item.component is template.get("item")
+    assert item.parent.parent.parent is window
+    assert first.get("checkbox") is None
+
+    # Each instance has its own leaves, sharing the same components
+    item.widget = "widget"
+    assert second.get_id("open").widget is None
+    assert second.get_id("open").component is item.component
+    assert [leaf.component for leaf in second.flat] == template.flat
@@ -0,0 +1,275 @@
+"""Test the headless backend, with synthesized events."""
+
+import asyncio
+import threading
+
+from bui import Window, start
+from bui.specific.headless.thread import start_thread, stop_thread
+from bui.tools import PACKAGE
+
+LAYOUT = """
+  <window title="Headless test">
+    <button x=0 y=0 id=ok>OK</button>
+    <checkbox x=1 y=0 id=agree>I agree</checkbox>
+    <text x=0 y=1 id=name>Name</text>
+    <table x=0 y=2 id=people>
+      <col>Name</col>
+      <col>Age</col>
+    </table>
+  </window>
+"""
+
+class Example(Window):
+
+    layout = mark(LAYOUT)
+
+    def on_init(self):
+        self.fired = []
+
+    def on_click_ok(self):
+        self.fired.append("click")
+
+    def on_check_agree(self, checked):
+        self.fired.append(("check", checked))
+
+    def on_press(self, key):
+        self.fired.append(("press", key))
+
+    def on_select_people(self, selected):
+        self.fired.append(("select", selected.name))
+        if selected.name == "Locked":
+            self.stop_control()
+
+def test_backend():
+    """The headless backend is used by the tests."""
+    assert PACKAGE.__name__ == "bui.specific.headless"
+
+def test_events():
+    """Synthesized events fire controls immediately."""
+    window = start(Example)
+    assert window.specific.title == "Headless test"
+    assert window["ok"].specific.simulate_click()
+    assert window["agree"].specific.simulate_check()
+    assert window["agree"].checked
+    assert window["ok"].specific.simulate_press("a", ctrl=True)
+    assert window.fired == ["click", ("check", True), ("press", "ctrl_a")]
+
+    text = window["name"]
+    text.specific.simulate_change("first\nsecond")
+    assert text.value == "first\nsecond"
+    assert (text.cursor.lineno, text.cursor.col) == (1, 6)
+    text.cursor.move(0, 3)
+    assert text.cursor.pos == 3
+
+def test_table():
+    """Rows are kept in memory, a stopped selection is restored."""
+    window = start(Example)
+    table = window["people"]
+    table.add_row("Alice", 32)
+    table.add_row("Locked", 40)
+    assert table.specific.cells == [["Alice", "32"], ["Locked", "40"]]
+    assert table.specific.selected == 0
+
+    assert not table.specific.simulate_select(1)
+    assert table.specific.selected == 0
+    assert table.selected.name == "Alice"
+    table[0].age = 33
+    assert table.specific.cells[0] == ["Alice", "33"]
+
+def test_thread():
+    """With the headless thread, controls go through its queue."""
+    class Threaded(Example):
+        def on_click_ok(self):
+            self.fired.append(threading.current_thread())
+
+    window = start(Threaded)
+    table = window["people"]
+    table.add_row("Alice", 32)
+    table.add_row("Locked", 40)
+    thread = start_thread()
+    try:
+        assert window["ok"].specific.simulate_click()
+        assert not table.specific.simulate_select(1)
+        assert table.specific.selected == 0
+    finally:
+        stop_thread()
+
+    assert window.fired == [thread, ("select", "Locked")]
+    assert thread.vetoes.latency.count == 2
+    assert thread.vetoes.timeouts == 0
+
+    # Controls are processed immediately again
+    window["ok"].specific.simulate_click()
+    assert window.fired[-1] is threading.current_thread()
+
+def test_alert():
+    """Alerts use scripted answers."""
+    window = start(Example)
+    window.specific.answers.append("cancel")
+    loop = asyncio.new_event_loop()
+    try:
+        answer = loop.run_until_complete(window.pop_alert("Sure?",
+                "Really?", danger="question", cancel=True))
+        default = loop.run_until_complete(window.pop_alert("Done", "Done"))
+    finally:
+        loop.close()
+
+    assert answer == "cancel"
+    assert default == "ok"
+    assert [alert[0] for alert in window.specific.alerts] == ["Sure?", "Done"]
+
+class VirtualExample(Window):
+
+    layout = mark("""
+      <window title="Virtual table">
+        <table x=0 y=0 id=people virtual>
+          <col hidden>ID</col>
+          <col>Name</col>
+          <col>Age</col>
+        </table>
+      </window>
+    """)
+
+    def on_select_people(self, selected):
+        self.selected = selected.name
+
+def test_sort():
+    """Sorting moves the displayed rows."""
+    window = start(Example)
+    table = window["people"]
+    table.rows = [("Bob", 3), ("Alice", 1), ("Carl", 2)]
+    table.sort(key="age")
+    assert table.specific.cells == [["Alice", "1"], ["Carl", "2"],
+            ["Bob", "3"]]
+
+def test_keep_sorted():
+    """A table with the sort attribute stays sorted."""
+    class Messages(Window):
+        layout = mark("""
+          <window title="Messages">
+            <table x=0 y=0 id=messages sort="-date, message">
+              <col>Date</col>
+              <col>Message</col>
+            </table>
+          </window>
+        """)
+
+    window = start(Messages)
+    table = window["messages"]
+    table.rows = [(1, "Hello"), (3, "Bye"), (2, "How are you?")]
+    for date in range(4, 7):
+        table.add_row(date, f"Message {date}")
+    table[5].date = 5
+    assert table.specific.cells == [["6", "Message 6"], ["5", "Hello"],
+            ["5", "Message 5"], ["4", "Message 4"], ["3", "Bye"],
+            ["2", "How are you?"]]
+
+def test_virtual_table():
+    """A virtual table reads its cells in the generic table."""
+    window = start(VirtualExample)
+    table = window["people"]
+    table.rows = ((i, f"Person {i}", i % 100) for i in range(100000))
+    assert table.specific.cells is None
+    assert table.specific.count == 100000
+    assert table.specific.get_item_text(99999, 0) == "Person 99999"
+    assert table.specific.get_item_text(99999, 1) == "99"
+    assert table.specific.get_item_text(100000, 1) == ""
+
+    assert table.specific.simulate_select(50000)
+    assert window.selected == "Person 50000"
+    assert table.selected.id == 50000
+
+    table.remove_row(0)
+    table.add_row(-1, "Last", 0)
+    assert table.specific.count == 100000
+    assert table.specific.get_item_text(99999, 0) == "Last"
+
+def test_bulk():
+    """Rows added or removed at once are displayed."""
+    window = start(Example)
+    table = window["people"]
+    table.extend((f"Person {i}", i) for i in range(10))
+    table.insert_rows(0, [("First", 0)])
+    assert table.specific.count == 11
+    assert table.specific.cells[:2] == [["First", "0"], ["Person 0", "0"]]
+
+    table.remove_rows(range(1, 11, 2))
+    assert table.specific.cells == [["First", "0"], ["Person 1", "1"],
+            ["Person 3", "3"], ["Person 5", "5"], ["Person 7", "7"],
+            ["Person 9", "9"]]
+    assert table.specific.count == 6
+
+def test_rows_diff():
+    """The edits computed when replacing rows are displayed."""
+    class UniqueExample(Window):
+        layout = mark("""
+          <window title="Diff">
+            <table x=0 y=0 id=people>
+              <col unique>ID</col>
+              <col>Name</col>
+            </table>
+          </window>
+        """)
+
+    window = start(UniqueExample)
+    table = window["people"]
+    table.rows = [(i, f"Person {i}") for i in range(100)]
+    rows = [(i, f"Person {i}") for i in range(100) if i % 10]
+    rows.insert(40, rows.pop(0))
+    rows[:0] = [(-i, f"New {i}") for i in range(1, 4)]
+    rows[60] = (rows[60][0], "Renamed")
+    table.rows = rows
+    assert table.specific.cells == [[str(i), name] for i, name in rows]
+
+    # The selection follows the selected row, even when refreshing
+    table.selected = 10
+    selected = table.selected.id
+    table.rows = list(reversed(rows))
+    assert table.selected.id == selected
+    assert table.specific.selected == table.selected.index
+
+def test_update_rate():
+    """Cells changed in the event loop are displayed at most 30 times a second."""
+    window = start(Example)
+    table = window["people"]
+    table.add_row("Alice", 0)
+    row = table[0]
+
+    async def download():
+        for progress in range(1, 101):
+            row.age = progress
+            assert row.age == progress
+
+        # Not displayed yet, the latest value is displayed once
+        assert table.specific.cells[0] == ["Alice", "0"]
+        await asyncio.sleep(0.05)
+        assert table.specific.cells[0] == ["Alice", "100"]
+
+        # Removing a row displays pending changes first
+        row.name = "Bob"
+        table.remove_row(table.add_row("Carl", 1))
+        assert table.specific.cells == [["Bob", "100"]]
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(download())
+    finally:
+        loop.close()
+
+def test_batch():
+    """A table batch displays all its changes at once."""
+    window = start(Example)
+    table = window["people"]
+    table.rows = [(f"Person {i}", i) for i in range(10)]
+    with table.batch():
+        for row in table:
+            with row.batch():
+                row.name = row.name.upper()
+                row.age += 1
+        table.remove_rows(range(0, 10, 2))
+        table.add_row("Alice", 0)
+        assert table.specific.cells[0] == ["Person 0", "0"]
+
+    assert table.specific.cells == [[row.name, str(row.age)]
+            for row in table]
+    assert table.specific.cells[-1] == ["Alice", "0"]
@@ -0,0 +1,101 @@
+"""Test the time needed to import BUI.
+
+Imports are measured in a new interpreter with `-X importtime`, which
+reports the time spent importing each module, in microseconds.
+
+"""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+# Maximum time to import BUI, in microseconds (5 ms).  Importing BUI
+# takes about 1.5 ms here, importing asyncio or logbook alone would
+# take more than the margin.
+BUDGET = 5000
+
+def import_times(statement):
+    """
+    Run a statement in a new interpreter and return the import times.
+
+    Args:
+        statement (str): the Python statement to run.
+
+    Returns:
+        times (dict): the cumulative import time of each imported
+                module, in microseconds.
+
+    """
+    env = dict(os.environ, BUI_GUI="headless")
+    root = Path(__file__).parent.parent
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c",
+            statement], cwd=str(root), env=env, stderr=subprocess.PIPE,
+            universal_newlines=True, check=True)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+def test_import_bui():
+    """Importing BUI imports neither widgets nor the GUI toolkit."""
+    # Keep the fastest of a few imports, to ignore a busy machine
+    runs = [import_times("import bui") for _ in range(3)]
+    times = min(runs, key=lambda times: times["bui"])
+    assert times["bui"] < BUDGET
+    for name in times:
+        assert not name.startswith(("asyncio", "logbook", "wx",
+                "bui.control", "bui.layout", "bui.specific",
+                "bui.widget")), f"{name} imported with bui"
+
+def imported(statement):
+    """
+    Run a statement in a new interpreter and return the imported modules.
+
+    Args:
+        statement (str): the Python statement to run.
+
+    Returns:
+        names (set): the names of the modules in `sys.modules`
+                after the statement.
+
+    """
+    statement += "\nimport sys\nprint(*sys.modules)"
+    env = dict(os.environ, BUI_GUI="headless")
+    root = Path(__file__).parent.parent
+    result = subprocess.run([sys.executable, "-c", statement],
+            cwd=str(root), env=env, stdout=subprocess.PIPE,
+            universal_newlines=True, check=True)
+    return set(result.stdout.split())
+
+def test_lazy_backend(tmp_path):
+    """The GUI toolkit is only loaded when a window is created."""
+    names = imported("from bui import Window")
+    assert "bui.widget.window" in names
+    for name in names:
+        assert not name.startswith(("logbook", "wx", "bui.specific.",
+                "bui.control.click", "bui.layout.button")), (
+                f"{name} imported with Window")
+
+    # Layouts defined with `mark()` need the file defining them
+    names = imported(f"""if True:
+        __file__ = {str(tmp_path / "example.py")!r}
+        from bui import Window, start
+        from bui.tools import forbid_start
+
+        class Example(Window):
+            layout = mark('<window title="Test"></window>')
+
+        with forbid_start():
+            start(Example)
+    """)
+    assert "bui.specific.headless" in names
+    assert "bui.layout.window" in names
+    assert "bui.layout.button" not in names
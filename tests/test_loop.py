@@ -0,0 +1,95 @@
+"""Test the helpers to run asyncio inside a GUI event loop."""
+
+import asyncio
+import threading
+
+from bui.specific.loop import (FALLBACK_TIMEOUT, next_timeout,
+        run_event_loops, wake_on_threadsafe)
+
+def test_next_timeout():
+    """The GUI event loop only waits until asyncio has something to do."""
+    loop = asyncio.new_event_loop()
+    try:
+        assert next_timeout(loop, 50) == 50
+
+        timer = loop.call_later(0.02, print)
+        assert 0 < next_timeout(loop, 50) <= 20
+        assert next_timeout(loop, 5) == 5
+        timer.cancel()
+
+        loop.call_soon(print)
+        assert next_timeout(loop, 50) == 0
+    finally:
+        loop.close()
+
+def test_next_timeout_fallback():
+    """Loops without inspectable callbacks wait a fixed time."""
+    class Loop(asyncio.AbstractEventLoop):
+
+        def time(self):
+            return 0.0
+
+    loop = Loop()
+    assert next_timeout(loop, 50) == min(50, FALLBACK_TIMEOUT)
+    assert next_timeout(loop, 1) == 1
+
+def test_wake_on_threadsafe():
+    """Callbacks from other threads wake up the GUI event loop."""
+    loop = asyncio.new_event_loop()
+    woken = threading.Event()
+    try:
+        restore = wake_on_threadsafe(loop, woken.set)
+        thread = threading.Thread(target=loop.call_soon_threadsafe,
+                args=(print, ))
+        thread.start()
+        thread.join()
+        assert woken.is_set()
+        assert next_timeout(loop, 50) == 0
+
+        restore()
+        woken.clear()
+        loop.call_soon_threadsafe(print)
+        assert not woken.is_set()
+    finally:
+        loop.close()
+
+def test_run_event_loops():
+    """The GUI event loop waits between asyncio callbacks and timers."""
+    class GUI:
+
+        def __init__(self):
+            self.events = ["event"]
+            self.calls = []
+            self.woken = threading.Event()
+
+        def pending(self):
+            return bool(self.events)
+
+        def dispatch(self):
+            self.calls.append(self.events.pop())
+
+        def dispatch_timeout(self, timeout):
+            self.calls.append(timeout)
+            self.woken.wait(timeout / 1000)
+            self.woken.clear()
+
+        def process_idle(self):
+            self.calls.append("idle")
+
+        def wake_up(self):
+            self.woken.set()
+
+    loop = asyncio.new_event_loop()
+    gui = GUI()
+    stopped = []
+    try:
+        loop.call_later(0.03, stopped.append, True)
+        loop.run_until_complete(run_event_loops(loop, gui,
+                lambda: not stopped, maximum=1000))
+    finally:
+        loop.close()
+
+    # Pending events are dispatched, then the loop waits for the timer
+    assert gui.calls[:2] == ["event", "idle"]
+    assert 0 < gui.calls[2] <= 30
+    assert "call_soon_threadsafe" not in loop.__dict__
@@ -0,0 +1,25 @@
+"""Test the metrics, used to measure BUI's responsiveness."""
+
+from bui.metrics import Histogram
+
+def test_histogram():
+    """Values are counted in buckets."""
+    histogram = Histogram(bounds=(0.001, 0.01, 0.1))
+    assert histogram.percentile(50) == 0
+    for value in (0.0005, 0.002, 0.003, 0.05, 2):
+        histogram.add(value)
+
+    assert histogram.count == 5
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.maximum == 2
+    assert abs(histogram.mean - 2.0555 / 5) < 1e-9
+
+    # Percentiles are the upper bounds of buckets
+    assert histogram.percentile(20) == 0.001
+    assert histogram.percentile(50) == 0.01
+    assert histogram.percentile(80) == 0.1
+    assert histogram.percentile(100) == 2
+
+    histogram.clear()
+    assert histogram.count == 0
+    assert histogram.counts == [0, 0, 0, 0]
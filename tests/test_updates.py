@@ -0,0 +1,105 @@
+"""Test the queue of updates to perform in the main thread."""
+
+from bui.specific.updates import UpdateQueue
+
+class Recorder:
+
+    """Record wake-ups, freezes and calls."""
+
+    def __init__(self):
+        self.wakes = []
+        self.calls = []
+
+    def wake(self, drain):
+        self.wakes.append(drain)
+
+    def freeze(self):
+        self.calls.append("freeze")
+        return "frozen"
+
+    def thaw(self, frozen):
+        assert frozen == "frozen"
+        self.calls.append("thaw")
+
+    def call(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+def test_batch():
+    """Pending updates are performed in a single wake-up."""
+    recorder = Recorder()
+    queue = UpdateQueue(recorder.wake, recorder.freeze, recorder.thaw)
+    queue.post(recorder.call, (1, ))
+    queue.post(recorder.call, (2, ), {"key": "value"})
+    assert len(recorder.wakes) == 1
+    assert queue.depth == 2
+
+    recorder.wakes.pop()()
+    assert queue.depth == 0
+    assert recorder.calls == ["freeze", ((1, ), {}),
+            ((2, ), {"key": "value"}), "thaw"]
+    assert queue.batch_size.count == 1
+    assert queue.batch_size.total == 2
+    assert queue.drain_time.count == 1
+
+    # The queue is woken up again for the next updates
+    queue.post(recorder.call)
+    assert len(recorder.wakes) == 1
+
+def test_coalesce():
+    """Updates with the same key are coalesced, up to a barrier."""
+    recorder = Recorder()
+    queue = UpdateQueue(recorder.wake)
+    queue.post(recorder.call, ("title", 1), key="title")
+    queue.post(recorder.call, ("label", ), key="label")
+    queue.post(recorder.call, ("title", 2), key="title")
+    queue.post(recorder.call, ("barrier", ))
+    queue.post(recorder.call, ("title", 3), key="title")
+    assert queue.coalesced == 1
+    assert queue.max_depth == 4
+
+    recorder.wakes.pop()()
+    assert [args for args, kwargs in recorder.calls] == [("title", 2),
+            ("label", ), ("barrier", ), ("title", 3)]
+
+def test_modal():
+    """Updates outside of a batch are performed with windows thawed."""
+    recorder = Recorder()
+    queue = UpdateQueue(recorder.wake, recorder.freeze, recorder.thaw)
+    queue.post(recorder.call, (1, ))
+    queue.post(recorder.call, (2, ), batch=False)
+    queue.post(recorder.call, (3, ))
+    recorder.wakes.pop()()
+    assert recorder.calls == ["freeze", ((1, ), {}), "thaw",
+            ((2, ), {}), "freeze", ((3, ), {}), "thaw"]
+
+def test_nested_drain():
+    """A modal update draining the queue again keeps the order of updates."""
+    queue = UpdateQueue(lambda drain: None)
+    values = {}
+
+    def set_value(value):
+        values["label"] = value
+
+    def modal():
+        # The modal dialog updates the label, then its event loop drains
+        queue.post(set_value, ("new", ), key="label")
+        queue.drain()
+
+    queue.post(modal, batch=False)
+    queue.post(set_value, ("old", ), key="label")
+    queue.drain()
+    assert values["label"] == "new"
+    assert queue.depth == 0
+
+def test_error():
+    """An error in an update doesn't prevent the next ones."""
+    recorder = Recorder()
+    queue = UpdateQueue(recorder.wake, recorder.freeze, recorder.thaw)
+
+    def fail():
+        raise RuntimeError("wrapped C/C++ object has been deleted")
+
+    queue.post(fail)
+    queue.post(recorder.call, (1, ))
+    recorder.wakes.pop()()
+    assert recorder.calls == ["freeze", ((1, ), {}), "thaw"]
@@ -0,0 +1,47 @@
+"""Test the channel answering whether controls were stopped."""
+
+import threading
+
+from bui.specific.vetoes import VetoChannel
+
+def test_answer_before_wait():
+    """An answer received before waiting isn't lost."""
+    vetoes = VetoChannel()
+    vetoes.expect(1)
+    vetoes.answer(1, False)
+    assert vetoes.wait(1) is False
+    vetoes.expect(2)
+    vetoes.answer(2, True)
+    assert vetoes.wait(2) is True
+    assert vetoes.late_vetoes == 0
+    assert vetoes.timeouts == 0
+
+def test_answer_from_thread():
+    """The main thread waits for the answer of another thread."""
+    vetoes = VetoChannel(deadline=5)
+    vetoes.expect(1)
+    timer = threading.Timer(0.01, vetoes.answer, (1, False))
+    timer.start()
+    assert vetoes.wait(1) is False
+    timer.join()
+    assert vetoes.timeouts == 0
+
+def test_late_veto():
+    """A control stopped after the deadline is a late veto."""
+    vetoes = VetoChannel(deadline=0.01)
+    vetoes.expect(1)
+    assert vetoes.wait(1) is True
+    assert vetoes.timeouts == 1
+    vetoes.answer(1, False)
+    assert vetoes.late_vetoes == 1
+
+    # Events which aren't expected don't wait
+    assert vetoes.wait(2) is True
+
+def test_close():
+    """Closing the channel releases the waiting events."""
+    vetoes = VetoChannel(deadline=5)
+    vetoes.expect(1)
+    threading.Timer(0.01, vetoes.close).start()
+    assert vetoes.wait(1) is True
+    assert vetoes.closed
@@ -1,5 +1,7 @@
 """Test the table widget."""
 
+import asyncio
+import gc
 from operator import attrgetter
 
 import pytest
@@ -360,3 +362,353 @@ def test_sort(table):
     # Sort by reverse grades
     table.sort(key=attrgetter("grade"), reverse=True)
     assert table[0].name == "Arold"
+
+def test_sort_columns(table):
+    """Sort by one or several columns, sending the new order."""
+    table.extend([
+            ("Magalie", 21, "B"),
+            ("Viktor", 20, "A"),
+            ("Vanessa", 21, "C"),
+            ("Arold", 23, "A"),
+    ])
+    viktor = table[1]
+    table.selected = viktor
+
+    table.sort(key="age")
+    assert [row.name for row in table] == [
+            "Viktor", "Magalie", "Vanessa", "Arold"]
+    table.specific.sort.assert_called_once_with([1, 0, 2, 3])
+    assert table.selected is viktor
+
+    # Sort by grade, then by descending age
+    table.sort(key=("grade", "-age"))
+    assert [row.name for row in table] == [
+            "Arold", "Viktor", "Magalie", "Vanessa"]
+    table.sort(key=["grade", "-age"], reverse=True)
+    assert [row.name for row in table] == [
+            "Vanessa", "Magalie", "Viktor", "Arold"]
+
+    # Only the ranks of the columns sorted on are kept
+    assert sorted(table._ranks) == [1, 2]
+    table.sort(key="name")
+    assert sorted(table._ranks) == [0]
+
+    # Ranks follow the changes of their column
+    table.sort(key=["grade", "-age"], reverse=True)
+    table[0].grade = "A+"
+    table.sort(key="grade")
+    assert [row.name for row in table] == [
+            "Viktor", "Arold", "Vanessa", "Magalie"]
+
+    # Sorting a sorted table doesn't move anything
+    table.specific.sort.reset_mock()
+    table.sort(key="grade")
+    table.specific.sort.assert_not_called()
+
+    with pytest.raises(ValueError):
+        table.sort(key="score")
+
+def test_keep_sorted(table):
+    """New and changed rows are placed in order."""
+    table.extend([("Magalie", 21, "B"), ("Viktor", 20, "A")])
+    table.keep_sorted(("grade", "-age"))
+    assert [row.name for row in table] == ["Viktor", "Magalie"]
+    table.selected = 1
+
+    # A new row is inserted, after the rows with the same key
+    specific = table.specific
+    vanessa = table.add_row("Vanessa", 20, "B")
+    assert [row.name for row in table] == ["Viktor", "Magalie", "Vanessa"]
+    assert vanessa.index == 2
+    specific.insert_rows.assert_called_with(2, 1)
+    table.insert_rows(0, [("Arold", 23, "A"), ("Mike", 18, "C"),
+            ("Audrey", 25, "B")])
+    assert [row.name for row in table] == [
+            "Arold", "Viktor", "Audrey", "Magalie", "Vanessa", "Mike"]
+    specific.apply_edits.assert_called_with([("insert", 0, 1),
+            ("insert", 2, 1), ("insert", 5, 1)])
+    assert table.selected.name == "Magalie"
+
+    # A changed row moves
+    vanessa.grade = "A"
+    assert [row.name for row in table] == [
+            "Arold", "Viktor", "Vanessa", "Audrey", "Magalie", "Mike"]
+    specific.apply_edits.assert_called_with([("delete", 4, 1),
+            ("insert", 2, 1)])
+    table[0] = ("Arold", 23, "F")
+    assert table[5].name == "Arold"
+    assert vanessa.index == 1
+
+    # Changing another column doesn't move the row
+    specific.apply_edits.reset_mock()
+    vanessa.name = "Vanessa B."
+    assert vanessa.index == 1
+    specific.apply_edits.assert_not_called()
+
+    # Sorting in the same order keeps the table sorted
+    table.keep_sorted("name")
+    table.sort(key="name")
+    table.sort()
+    table.add_row("Ben", 30, "A")
+    assert [row.name for row in table][:3] == ["Arold", "Audrey", "Ben"]
+
+    # Sorting in another order stops keeping the table sorted
+    table.sort(key="name", reverse=True)
+    table.sort(key="name")
+    table.add_row("Zoe", 30, "A")
+    assert table[-1].name == "Zoe"
+    with pytest.raises(ValueError):
+        table.keep_sorted("score")
+
+def test_columns(table):
+    """Values are stored by column, rows are views following their index."""
+    table.rows = (
+            ("Magalie", 21, "B"),
+            ("Viktor", 20, "A"),
+            ("Vanessa", 21, "C"),
+    )
+    assert table._columns == [
+            ["Magalie", "Viktor", "Vanessa"], [21, 20, 21], ["B", "A", "C"]]
+
+    # Rows can hold attributes which aren't columns
+    table[0].note = "first"
+    gc.collect()
+    assert table[0].note == "first"
+    with pytest.raises(AttributeError):
+        table[1].note
+
+    # A row object follows its row when the table changes
+    vanessa = table[2]
+    table.sort(key=attrgetter("age"))
+    assert vanessa.index == 2
+    table.remove_row(0)
+    assert vanessa.index == 1
+    assert vanessa.name == "Vanessa"
+    vanessa.grade = "B"
+    assert table._columns[2] == ["B", "B"]
+
+    # A removed row keeps its values
+    magalie = table[0]
+    table.remove_row(magalie)
+    assert magalie.name == "Magalie"
+    assert vanessa.index == 0
+    assert table._columns == [["Vanessa"], [21], ["B"]]
+
+    # Sorting replaces the columns at once
+    table.insert_rows(0, [("Viktor", 20, "A")])
+    columns = table._columns
+    table.sort(key="name")
+    assert columns == [["Viktor", "Vanessa"], [20, 21], ["A", "B"]]
+    assert table._columns == [["Vanessa", "Viktor"], [21, 20], ["B", "A"]]
+
+def test_bulk(table):
+    """Add, insert and remove several rows at once."""
+    table.extend([("Magalie", 21, "B"), {"name": "Viktor", "age": 20,
+            "grade": "A"}])
+    viktor = table[1]
+    table.insert_rows(1, [("Vanessa", 21, "C"), ("Arold", 23, "F")])
+    assert [row.name for row in table] == [
+            "Magalie", "Vanessa", "Arold", "Viktor"]
+    assert viktor.index == 3
+    table.specific.insert_rows.assert_called_with(1, 2)
+
+    # Rows are checked before any of them is added
+    with pytest.raises(ValueError):
+        table.extend([("Mike", 18, "B"), ("Audrey", 18)])
+    assert len(table) == 4
+
+    table.remove_rows([table[0], 2])
+    assert [row.name for row in table] == ["Vanessa", "Viktor"]
+    assert viktor.index == 1
+    table.specific.remove_rows.assert_called_with([0, 2])
+    table.remove_rows(slice(None))
+    assert len(table) == 0
+
+def test_batch(table):
+    """Changes in a batch are displayed when the batch ends."""
+    table.extend([("Magalie", 21, "B"), ("Vanessa", 21, "C")])
+    specific = table.specific
+    magalie = table[0]
+    specific.update_row.reset_mock()
+    with magalie.batch() as row:
+        row.age = 22
+        with row.batch():
+            row.grade = "A"
+        specific.update_row.assert_not_called()
+    specific.update_row.assert_called_once_with(magalie)
+    assert list(magalie) == ["Magalie", 22, "A"]
+
+    # Nothing is sent to the specific table in a table batch
+    specific.reset_mock()
+    with table.batch():
+        magalie.age = 23
+        table.add_row("Viktor", 20, "A")
+        table.remove_row(1)
+        table.sort(key=attrgetter("age"))
+        with magalie.batch():
+            magalie.grade = "B"
+        assert not specific.method_calls
+    assert [call[0] for call in specific.method_calls] == [
+            "refresh", "select_row"]
+    assert [row.name for row in table] == ["Viktor", "Magalie"]
+    assert table.selected.name == "Magalie"
+
+    # The changes are displayed even if the block raises an exception
+    specific.reset_mock()
+    with pytest.raises(ValueError):
+        with table.batch():
+            magalie.age = 24
+            raise ValueError
+    specific.apply_edits.assert_called_once_with([("update", 1, 1)])
+
+def test_batch_scope(table):
+    """Batches only defer their own changes."""
+    table.extend([("Magalie", 21, "B"), ("Vanessa", 21, "C")])
+    specific = table.specific
+    magalie, vanessa = table[0], table[1]
+
+    # Other rows are displayed during a row batch
+    specific.reset_mock()
+    with magalie.batch():
+        magalie.age = 22
+        vanessa.age = 22
+        specific.update_row.assert_called_once_with(vanessa)
+    specific.update_row.assert_called_with(magalie)
+
+    # A row of a sorted table is moved when its batch ends
+    table.keep_sorted("age")
+    specific.reset_mock()
+    with vanessa.batch():
+        vanessa.age = 20
+        vanessa.grade = "A"
+        assert not specific.method_calls
+    specific.apply_edits.assert_called_once_with([("delete", 1, 1),
+            ("insert", 0, 1)])
+    assert table[0] is vanessa
+    table.keep_sorted(None)
+
+    # Other tasks aren't deferred by a table batch, until rows move
+    async def other(name, age):
+        table[name].age = age
+
+    async def batch():
+        with table.batch():
+            magalie.age = 30
+            await asyncio.create_task(other(0, 19))
+            specific.update_row.assert_called_once_with(vanessa)
+            table.add_row("Viktor", 20, "A")
+            await asyncio.create_task(other(0, 18))
+            specific.update_row.assert_called_once_with(vanessa)
+
+    table.update_rate = 0
+    specific.reset_mock()
+    asyncio.run(batch())
+    assert [call[0] for call in specific.method_calls] == [
+            "update_row", "refresh", "select_row"]
+
+def test_unique():
+    """Unique columns are indexed and can't hold the same value twice."""
+    from bui import Window, start
+    class TestWindow(Window):
+        layout = mark("""
+            <window title="Unique test">
+              <table x=0 y=0 id=table>
+                <col unique>ID</col>
+                <col>Name</col>
+              </table>
+            </window>
+        """)
+
+    table = start(TestWindow)["table"]
+    table.rows = [(i, f"Person {i}") for i in range(10)]
+    assert table.get_from_unique("id", 5).name == "Person 5"
+    assert table.get_from_unique("id", 10) is None
+    with pytest.raises(ValueError):
+        table.get_from_unique("name", "Person 5")
+
+    # The index follows the changes
+    table.add_row(10, "Person 10")
+    table[5].id = 15
+    table.remove_row(0)
+    table.sort(reverse=True)
+    assert table.get_from_unique("id", 5) is None
+    assert table.get_from_unique("id", 15).name == "Person 5"
+    assert table.get_from_unique("id", 15).index == 0
+
+    # Values must be unique
+    with pytest.raises(ValueError):
+        table.add_row(1, "Duplicate")
+    with pytest.raises(ValueError):
+        table[0].id = 1
+    with pytest.raises(ValueError):
+        table.extend([(20, "Twenty"), (20, "Twenty again")])
+    with pytest.raises(ValueError):
+        table.rows = [(1, "One"), (1, "One again")]
+    assert len(table) == 10
+
+    # Swapping values is allowed
+    table[0:2] = [table[1], table[0]]
+    assert table.get_from_unique("id", 15).index == 1
+    assert table.get_from_unique("id", 10).index == 0
+
+    # The index is updated, not built again
+    index = table._unique_index(0)
+    def check():
+        assert table._unique_index(0) is index
+        assert index == {value: i for i, value in
+                enumerate(table._columns[0])}
+
+    table.remove_rows([1, 4, 7])
+    check()
+    table.insert_rows(2, [(30, "Thirty"), (31, "Thirty-one")])
+    check()
+    table.sort(key="name")
+    check()
+    table.keep_sorted("id")
+    table.add_row(5, "Five")
+    table[0].id = 40
+    check()
+    table.rows = [(i, f"Person {i}") for i in range(5)]
+    assert table.get_from_unique("id", 40) is None
+    assert table.get_from_unique("id", 4).index == 4
+
+def test_rows_diff():
+    """Replacing the rows only sends the edits to the specific table."""
+    from bui import Window, start
+    class TestWindow(Window):
+        layout = mark("""
+            <window title="Diff test">
+              <table x=0 y=0 id=table>
+                <col unique>ID</col>
+                <col>Name</col>
+              </table>
+            </window>
+        """)
+
+    table = start(TestWindow)["table"]
+    table.rows = [(i, f"Person {i}") for i in range(10)]
+    table.specific.refresh.assert_called_once()
+    table.selected = 5
+
+    # Insert a row at the top, remove one, move one, rename one
+    rows = [(i, f"Person {i}") for i in range(10) if i != 3]
+    rows.insert(0, (10, "Person 10"))
+    rows.append(rows.pop(1))
+    rows[5] = (6, "Renamed")
+    table.rows = rows
+    table.specific.apply_edits.assert_called_once_with([
+            ("delete", 3, 1), ("delete", 0, 1), ("insert", 0, 1),
+            ("insert", 9, 1), ("update", 5, 1)])
+    assert table.selected.id == 5
+    assert table.specific.refresh.call_count == 1
+
+def test_diff_rows():
+    """Compute edits, keeping rows already in order."""
+    from bui.widget.table import diff_rows, longest_increasing
+
+    assert longest_increasing([3, 1, 2, 5, 4, 6]) == [1, 2, 4, 5]
+    assert longest_increasing([]) == []
+    assert diff_rows("ABCDE", "XBCDEA", lambda old, new: False) == [
+            ("delete", 0, 1), ("insert", 0, 1), ("insert", 5, 1)]
+    assert diff_rows(range(5), range(3), lambda old, new: old == 1) == [
+            ("delete", 3, 2), ("update", 1, 1)]